@@ -7,37 +7,56 @@ https://github.com/toggm/askoheat
 
 from __future__ import annotations
 
+import asyncio
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from homeassistant.const import CONF_HOST, CONF_PORT, Platform
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.loader import async_get_loaded_integration
 
 from custom_components.askoheat.const import DeviceKey
 
-from .api import AskoheatModbusApiClient
+from .api import AskoheatModbusApiClient, connection_parameters
+from .api_desc import load_register_map_variants, select_register_map_variant
 from .const import (
     CONF_ANALOG_INPUT_UNIT,
     CONF_DEVICE_UNITS,
     CONF_HEATPUMP_UNIT,
     CONF_LEGIONELLA_PROTECTION_UNIT,
     CONF_MODBUS_MASTER_UNIT,
+    CONF_REGISTER_HISTORY,
+    CONF_REGISTER_HISTORY_DAYS,
+    CONF_REGISTER_HISTORY_ENABLED,
+    CONF_UNIT_ID,
+    DEFAULT_REGISTER_HISTORY_DAYS,
+    DEFAULT_UNIT_ID,
     DOMAIN,
     LOGGER,
+    SensorAttrKey,
 )
 from .coordinator import (
     AskoheatConfigDataUpdateCoordinator,
     AskoheatEMADataUpdateCoordinator,
     AskoheatOperationDataUpdateCoordinator,
     AskoheatParameterDataUpdateCoordinator,
+    async_get_domain_coordinator,
 )
 from .data import AskoheatData
+from .entity_index import entity_descriptions, entity_index
+from .register_history import close_register_histories, open_register_histories
+from .services import async_setup_services
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers import device_registry as dr
+    from homeassistant.helpers.typing import ConfigType
 
-    from .data import AskoheatConfigEntry
+    from .data import AskoheatBlockState, AskoheatConfigEntry
 
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
@@ -49,6 +68,19 @@ PLATFORMS: list[Platform] = [
     Platform.SELECT,
 ]
 
+# platforms owning entities outside of the entity index, which are always set up
+PLATFORMS_WITH_UNINDEXED_ENTITIES: frozenset[Platform] = frozenset(
+    {Platform.SENSOR, Platform.SWITCH, Platform.NUMBER}
+)
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
+    """Set up the askoheat services."""
+    async_setup_services(hass)
+    return True
+
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(
@@ -56,70 +88,195 @@ async def async_setup_entry(
     entry: AskoheatConfigEntry,
 ) -> bool:
     """Set up this integration using UI."""
+    # import the descriptor modules of all register blocks off the event loop
+    await hass.async_add_import_executor_job(entity_index)
+
+    domain_coordinator = async_get_domain_coordinator(hass)
     client = AskoheatModbusApiClient(
         host=entry.data[CONF_HOST],
         port=entry.data[CONF_PORT],
+        unit_id=entry.data.get(CONF_UNIT_ID, DEFAULT_UNIT_ID),
+        pool=domain_coordinator.connection_pool,
+        **connection_parameters(entry.data),
     )
 
     await client.connect()
 
     if not client.is_connected:
+        client.close()
         msg = "Could not connect to modbus client"
         LOGGER.error(msg)
         raise ConfigEntryNotReady(msg)
 
     LOGGER.debug(
-        "Connect modbus client %s:%s",
+        "Connect modbus client %s:%s, unit %s",
         entry.data[CONF_HOST],
         entry.data[CONF_PORT],
+        client.unit_id,
     )
 
-    par_coordinator = AskoheatParameterDataUpdateCoordinator(
-        hass=hass, client=client, config_entry=entry
-    )
-    ema_coordinator = AskoheatEMADataUpdateCoordinator(
-        hass=hass, client=client, config_entry=entry
-    )
-    config_coordinator = AskoheatConfigDataUpdateCoordinator(
-        hass=hass, client=client, config_entry=entry
-    )
-    data_coordinator = AskoheatOperationDataUpdateCoordinator(
-        hass=hass, client=client, config_entry=entry
+    try:
+        domain_coordinator.register(entry.entry_id)
+
+        par_coordinator = AskoheatParameterDataUpdateCoordinator(
+            hass=hass,
+            client=client,
+            config_entry=entry,
+            domain_coordinator=domain_coordinator,
+        )
+        ema_coordinator = AskoheatEMADataUpdateCoordinator(
+            hass=hass,
+            client=client,
+            config_entry=entry,
+            domain_coordinator=domain_coordinator,
+        )
+        config_coordinator = AskoheatConfigDataUpdateCoordinator(
+            hass=hass,
+            client=client,
+            config_entry=entry,
+            domain_coordinator=domain_coordinator,
+        )
+        data_coordinator = AskoheatOperationDataUpdateCoordinator(
+            hass=hass,
+            client=client,
+            config_entry=entry,
+            domain_coordinator=domain_coordinator,
+        )
+
+        # default devices
+        supported_devices = [
+            DeviceKey.WATER_HEATER_CONTROL_UNIT,
+            DeviceKey.ENERGY_MANAGER,
+        ]
+        # add devices based on configuration
+        additional_devices = entry.data.get(CONF_DEVICE_UNITS) or {}
+        if additional_devices.get(CONF_LEGIONELLA_PROTECTION_UNIT):
+            supported_devices.append(DeviceKey.LEGIO_PROTECTION_CONTROL_UNIT)
+        if additional_devices.get(CONF_ANALOG_INPUT_UNIT):
+            supported_devices.append(DeviceKey.ANALOG_INPUT_CONTROL_UNIT)
+        if additional_devices.get(CONF_MODBUS_MASTER_UNIT):
+            supported_devices.append(DeviceKey.MODBUS_MASTER)
+        if additional_devices.get(CONF_HEATPUMP_UNIT):
+            supported_devices.append(DeviceKey.HEATPUMP_CONTROL_UNIT)
+
+        entry.runtime_data = AskoheatData(
+            client=client,
+            integration=async_get_loaded_integration(hass, entry.domain),
+            ema_coordinator=ema_coordinator,
+            config_coordinator=config_coordinator,
+            par_coordinator=par_coordinator,
+            data_coordinator=data_coordinator,
+            supported_devices=supported_devices,
+            platforms=_async_platforms_to_set_up(hass, entry, supported_devices),
+        )
+
+        # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
+        # the firmware reported by the parameter block selects the registers read from
+        # the other blocks
+        await par_coordinator.async_config_entry_first_refresh()
+        await _async_select_register_map_variant(hass, client, par_coordinator.data)
+        ema_coordinator.async_setup_heater_energy(par_coordinator.data)
+        await _async_open_register_histories(hass, entry, client)
+
+        # refresh the other blocks in parallel, the domain coordinator limits the number
+        # of concurrent requests over all config entries
+        await asyncio.gather(
+            ema_coordinator.async_config_entry_first_refresh(),
+            config_coordinator.async_config_entry_first_refresh(),
+            data_coordinator.async_config_entry_first_refresh(),
+        )
+        if "recorder" in hass.config.components:
+            # importing the statistics imports the recorder, only do so if it is loaded
+            from .long_term_statistics import AskoheatLongTermStatistics
+
+            entry.runtime_data.long_term_statistics = AskoheatLongTermStatistics(
+                hass, entry, data_coordinator
+            )
+            await entry.runtime_data.long_term_statistics.async_setup()
+
+        await hass.config_entries.async_forward_entry_setups(
+            entry, entry.runtime_data.platforms
+        )
+        entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    except BaseException:
+        # release the pooled connection and the poll slot, the setup is retried
+        await _async_release_client(hass, entry, client)
+        raise
+
+    return True
+
+
+async def _async_select_register_map_variant(
+    hass: HomeAssistant,
+    client: AskoheatModbusApiClient,
+    parameters: AskoheatBlockState,
+) -> None:
+    """Drop registers the firmware of the device doesn't support from reads."""
+    software_version = parameters.get(f"sensor.{SensorAttrKey.PAR_SOFTWARE_VERSION}")
+    if not software_version:
+        return
+    variant = select_register_map_variant(
+        await hass.async_add_executor_job(load_register_map_variants),
+        str(software_version),
     )
+    if variant is not None:
+        LOGGER.info(
+            "Use register map variant %s for software version %s",
+            variant.name,
+            software_version,
+        )
+    client.register_map_variant = variant
 
-    # default devices
-    supported_devices = [DeviceKey.WATER_HEATER_CONTROL_UNIT, DeviceKey.ENERGY_MANAGER]
-    # add devices based on configuration
-    additional_devices = entry.data.get(CONF_DEVICE_UNITS) or {}
-    if additional_devices.get(CONF_LEGIONELLA_PROTECTION_UNIT):
-        supported_devices.append(DeviceKey.LEGIO_PROTECTION_CONTROL_UNIT)
-    if additional_devices.get(CONF_ANALOG_INPUT_UNIT):
-        supported_devices.append(DeviceKey.ANALOG_INPUT_CONTROL_UNIT)
-    if additional_devices.get(CONF_MODBUS_MASTER_UNIT):
-        supported_devices.append(DeviceKey.MODBUS_MASTER)
-    if additional_devices.get(CONF_HEATPUMP_UNIT):
-        supported_devices.append(DeviceKey.HEATPUMP_CONTROL_UNIT)
-
-    entry.runtime_data = AskoheatData(
-        client=client,
-        integration=async_get_loaded_integration(hass, entry.domain),
-        ema_coordinator=ema_coordinator,
-        config_coordinator=config_coordinator,
-        par_coordinator=par_coordinator,
-        data_coordinator=data_coordinator,
-        supported_devices=supported_devices,
+
+async def _async_open_register_histories(
+    hass: HomeAssistant,
+    entry: AskoheatConfigEntry,
+    client: AskoheatModbusApiClient,
+) -> None:
+    """Keep raw snapshots of the polled blocks on disk if enabled."""
+    history = entry.data.get(CONF_REGISTER_HISTORY) or {}
+    if not history.get(CONF_REGISTER_HISTORY_ENABLED):
+        return
+    client.register_histories = await hass.async_add_import_executor_job(
+        open_register_histories,
+        Path(hass.config.path(STORAGE_DIR, DOMAIN, entry.entry_id)),
+        history.get(CONF_REGISTER_HISTORY_DAYS, DEFAULT_REGISTER_HISTORY_DAYS),
     )
 
-    # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-    await par_coordinator.async_config_entry_first_refresh()
-    await ema_coordinator.async_config_entry_first_refresh()
-    await config_coordinator.async_config_entry_first_refresh()
-    await data_coordinator.async_config_entry_first_refresh()
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+@callback
+def _async_platforms_to_set_up(
+    hass: HomeAssistant,
+    entry: AskoheatConfigEntry,
+    supported_devices: list[DeviceKey],
+) -> list[Platform]:
+    """
+    Return platforms having entities which are enabled or not registered yet.
 
-    return True
+    Platforms of which all entities got disabled are not set up, enabling an entity
+    reloads the config entry which then sets up its platform again. Platforms owning
+    entities not found in the entity index are always set up.
+    """
+    entity_registry = er.async_get(hass)
+    device_unique_id = entry.unique_id or "unknown"
+    platforms: list[Platform] = []
+    for platform in PLATFORMS:
+        if platform in PLATFORMS_WITH_UNINDEXED_ENTITIES:
+            platforms.append(platform)
+            continue
+        for entity_description, _ in entity_descriptions(platform, supported_devices):
+            entity_id = entity_registry.async_get_entity_id(
+                platform,
+                DOMAIN,
+                f"{platform}.{device_unique_id}_{entity_description.key}",
+            )
+            registry_entry = (
+                entity_registry.async_get(entity_id) if entity_id is not None else None
+            )
+            if registry_entry is None or not registry_entry.disabled:
+                platforms.append(platform)
+                break
+    return platforms
 
 
 async def async_remove_config_entry_device(
@@ -149,8 +306,29 @@ async def async_unload_entry(
     entry: AskoheatConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
-    entry.runtime_data.client.close()
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if not await hass.config_entries.async_unload_platforms(
+        entry, entry.runtime_data.platforms
+    ):
+        # the entities still in use keep their client
+        return False
+    if entry.runtime_data.long_term_statistics:
+        entry.runtime_data.long_term_statistics.async_shutdown()
+    await _async_release_client(hass, entry, entry.runtime_data.client)
+    return True
+
+
+async def _async_release_client(
+    hass: HomeAssistant,
+    entry: AskoheatConfigEntry,
+    client: AskoheatModbusApiClient,
+) -> None:
+    """Close client of the entry and release its poll slot."""
+    client.close()
+    if client.register_histories:
+        await hass.async_add_executor_job(
+            close_register_histories, client.register_histories
+        )
+    async_get_domain_coordinator(hass).unregister(entry.entry_id)
 
 
 async def async_reload_entry(
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import struct
+from collections import deque
+from dataclasses import dataclass
 from datetime import time
 from enum import ReprEnum
+from numbers import Real
+from time import monotonic
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -14,10 +19,11 @@ from typing import (
 )
 
 from homeassistant.exceptions import HomeAssistantError
-from numpy import number
-from pymodbus.client import AsyncModbusTcpClient
+from homeassistant.util import dt as dt_util
+from pymodbus import FramerType
+from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
+from pymodbus.exceptions import ModbusException
 
-from custom_components.askoheat.api_conf_desc import CONF_REGISTER_BLOCK_DESCRIPTOR
 from custom_components.askoheat.api_desc import (
     ByteRegisterInputDescriptor,
     FlagRegisterInputDescriptor,
@@ -25,6 +31,8 @@ from custom_components.askoheat.api_desc import (
     IntEnumInputDescriptor,
     RegisterBlockDescriptor,
     RegisterInputDescriptor,
+    RegisterMap,
+    RegisterMapVariant,
     SignedInt16RegisterInputDescriptor,
     StrEnumInputDescriptor,
     StringRegisterInputDescriptor,
@@ -32,17 +40,47 @@ from custom_components.askoheat.api_desc import (
     TimeRegisterInputDescriptor,
     UnsignedInt16RegisterInputDescriptor,
     UnsignedInt32RegisterInputDescriptor,
+    register_block,
+)
+from custom_components.askoheat.const import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_OPEN_INTERVAL,
+    CIRCUIT_BREAKER_PROBE_REGISTER,
+    CONF_BAUDRATE,
+    CONF_CONNECTION,
+    CONF_READ_CHUNK_SIZE,
+    CONF_READ_RATE_LIMIT,
+    CONF_SERIAL_PORT,
+    CONF_STALE_DATA_GRACE_PERIOD,
+    CONF_TRANSPORT,
+    CONF_WRITE_RATE_LIMIT,
+    DECODE_ERROR_LOG_INTERVAL,
+    DEFAULT_BAUDRATE,
+    DEFAULT_READ_RATE_LIMIT,
+    DEFAULT_STALE_DATA_GRACE_PERIOD,
+    DEFAULT_UNIT_ID,
+    DEFAULT_WRITE_RATE_LIMIT,
+    DOMAIN,
+    LOGGER,
+    MODBUS_MAX_READ_REGISTERS,
+    MODBUS_RTU_BITS_PER_CHARACTER,
+    MODBUS_RTU_FIXED_INTER_FRAME_DELAY,
+    MODBUS_RTU_FIXED_TIMING_BAUDRATE,
+    READ_CHUNK_SIZE_PROBE_INTERVAL,
+    READ_RATE_LIMIT_BURST,
+    STATUS_REGISTERS,
+    WRITE_RATE_LIMIT_BURST,
+    BlockKey,
+    CircuitBreakerState,
+    ModbusTransport,
 )
-from custom_components.askoheat.api_ema_desc import EMA_REGISTER_BLOCK_DESCRIPTOR
-from custom_components.askoheat.api_op_desc import DATA_REGISTER_BLOCK_DESCRIPTOR
-from custom_components.askoheat.api_par_desc import PARAM_REGISTER_BLOCK_DESCRIPTOR
-from custom_components.askoheat.const import DOMAIN, LOGGER
 from custom_components.askoheat.data import AskoheatDataBlock
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Coroutine
+    from collections.abc import Awaitable, Callable, Coroutine, Mapping, Sequence
 
-    from pymodbus.pdu import ModbusPDU
+    from custom_components.askoheat.model import AskoheatEntityDescription
+    from custom_components.askoheat.register_history import RegisterHistory
 
 
 class AskoheatModbusApiClientError(HomeAssistantError):
@@ -55,22 +93,461 @@ class AskoheatModbusApiClientCommunicationError(
     """Exception to indicate a communication error."""
 
 
+class AskoheatModbusApiClientDecodeError(
+    AskoheatModbusApiClientError,
+):
+    """Exception to indicate a register value which cannot be decoded."""
+
+
+# errors raised while decoding a single value from its registers
+_DECODE_ERRORS = (
+    AskoheatModbusApiClientDecodeError,
+    ArithmeticError,
+    LookupError,
+    TypeError,
+    ValueError,
+    struct.error,
+)
+
+
+class AskoheatDecodeErrorLog:
+    """Status of values which failed to decode, logging each field rate limited."""
+
+    def __init__(self, interval: float) -> None:
+        """Initialize."""
+        self._interval = interval
+        self._errors: dict[str, str] = {}
+        self._last_logged: dict[str, float] = {}
+        self._suppressed: dict[str, int] = {}
+
+    @property
+    def errors(self) -> dict[str, str]:
+        """Return last decode error of all fields currently failing."""
+        return dict(self._errors)
+
+    def failed(self, field: str, err: Exception) -> None:
+        """Record decode error of a field."""
+        self._errors[field] = f"{type(err).__name__}: {err}"
+        now = monotonic()
+        last_logged = self._last_logged.get(field)
+        if last_logged is not None and now - last_logged < self._interval:
+            self._suppressed[field] = self._suppressed.get(field, 0) + 1
+            return
+        self._last_logged[field] = now
+        LOGGER.warning(
+            "Cannot decode value of %s: %s (%s repetitions suppressed)",
+            field,
+            self._errors[field],
+            self._suppressed.pop(field, 0),
+        )
+
+    def succeeded(self, field: str) -> None:
+        """Record successful decoding of a field."""
+        if self._errors.pop(field, None) is None:
+            return
+        self._last_logged.pop(field, None)
+        self._suppressed.pop(field, None)
+        LOGGER.info("Value of %s can be decoded again", field)
+
+
+class AskoheatCircuitBreaker:
+    """
+    Circuit breaker of the requests to a device.
+
+    Opens after consecutive requests the device didn't answer, failing further
+    requests without sending them. Once the open interval elapsed, the breaker is
+    half-open and a single probe decides whether it closes or opens again.
+    """
+
+    def __init__(self, failure_threshold: int, open_interval: float) -> None:
+        """Initialize."""
+        self._failure_threshold = failure_threshold
+        self._open_interval = open_interval
+        self._failures = 0
+        # monotonic time the breaker opened, None while closed
+        self._opened_at: float | None = None
+        self._listeners: list[Callable[[], None]] = []
+
+    def add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """
+        Add listener called when the breaker opens or closes.
+
+        The breaker turns half-open when the open interval elapsed without calling
+        the listeners. Return function removing the listener.
+        """
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _notify_listeners(self, previous: CircuitBreakerState) -> None:
+        if self.state is not previous:
+            for listener in list(self._listeners):
+                listener()
+
+    @property
+    def state(self) -> CircuitBreakerState:
+        """Return state of the breaker."""
+        if self._opened_at is None:
+            return CircuitBreakerState.CLOSED
+        if monotonic() - self._opened_at < self._open_interval:
+            return CircuitBreakerState.OPEN
+        return CircuitBreakerState.HALF_OPEN
+
+    def failed(self) -> None:
+        """Record a request the device didn't answer."""
+        self._failures += 1
+        if self._opened_at is None and self._failures < self._failure_threshold:
+            return
+        if self._opened_at is None:
+            LOGGER.warning(
+                "Device didn't answer %s requests, pausing requests for %s seconds",
+                self._failures,
+                self._open_interval,
+            )
+        previous = self.state
+        # a failed probe opens the breaker for another interval
+        self._opened_at = monotonic()
+        self._notify_listeners(previous)
+
+    def succeeded(self) -> None:
+        """Record a request the device answered."""
+        previous = self.state
+        if self._opened_at is not None:
+            LOGGER.info("Device answers again, resuming requests")
+        self._failures = 0
+        self._opened_at = None
+        self._notify_listeners(previous)
+
+
+class AskoheatTokenBucket:
+    """
+    Token bucket limiting the rate of requests to a device.
+
+    Holds up to capacity tokens refilled at rate tokens per second, a request takes
+    one token. Requests exceeding the bucket reserve a token ahead and wait until
+    it is refilled, so waiting requests are sent in order at the rate.
+    """
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        """Initialize."""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = monotonic()
+
+    def _refill(self) -> float:
+        """Add the tokens refilled since the last update and return the tokens."""
+        now = monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        return self._tokens
+
+    async def async_acquire(self) -> None:
+        """Take a token, waiting until it is refilled if the bucket is exhausted."""
+        self._refill()
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return
+        try:
+            await asyncio.sleep(-self._tokens / self.rate)
+        except asyncio.CancelledError:
+            # hand back the reserved token
+            self._tokens += 1
+            raise
+
+
+@dataclass(frozen=True)
+class AskoheatModbusConnectionConfig:
+    """Parameters describing how to reach the modbus bus of a device."""
+
+    host: str
+    port: int
+    transport: ModbusTransport = ModbusTransport.TCP
+    serial_port: str | None = None
+    baudrate: int = DEFAULT_BAUDRATE
+
+    @property
+    def pool_key(self) -> tuple[str, ...]:
+        """Return key identifying the bus shared by several devices."""
+        if self.transport == ModbusTransport.SERIAL:
+            return (self.transport, str(self.serial_port))
+        return (self.transport, self.host, str(self.port))
+
+    @property
+    def inter_frame_delay(self) -> float:
+        """Return silent interval in seconds required between two frames."""
+        if self.transport != ModbusTransport.SERIAL:
+            # the gateway takes care of the timing on the serial bus
+            return 0
+        if self.baudrate > MODBUS_RTU_FIXED_TIMING_BAUDRATE:
+            return MODBUS_RTU_FIXED_INTER_FRAME_DELAY
+        return 3.5 * MODBUS_RTU_BITS_PER_CHARACTER / self.baudrate
+
+
+def connection_parameters(data: Mapping[str, Any]) -> dict[str, Any]:
+    """Return transport parameters of the api client from the configuration."""
+    connection = data.get(CONF_CONNECTION) or {}
+    return {
+        "transport": ModbusTransport(
+            connection.get(CONF_TRANSPORT) or ModbusTransport.TCP
+        ),
+        "serial_port": connection.get(CONF_SERIAL_PORT) or None,
+        "baudrate": int(connection.get(CONF_BAUDRATE) or DEFAULT_BAUDRATE),
+        "read_chunk_size": int(
+            connection.get(CONF_READ_CHUNK_SIZE) or MODBUS_MAX_READ_REGISTERS
+        ),
+        "stale_data_grace_period": float(
+            connection.get(
+                CONF_STALE_DATA_GRACE_PERIOD, DEFAULT_STALE_DATA_GRACE_PERIOD
+            )
+        ),
+        "read_rate_limit": float(
+            connection.get(CONF_READ_RATE_LIMIT) or DEFAULT_READ_RATE_LIMIT
+        ),
+        "write_rate_limit": float(
+            connection.get(CONF_WRITE_RATE_LIMIT) or DEFAULT_WRITE_RATE_LIMIT
+        ),
+    }
+
+
+def _create_modbus_client(
+    config: AskoheatModbusConnectionConfig,
+) -> AsyncModbusTcpClient | AsyncModbusSerialClient:
+    match config.transport:
+        case ModbusTransport.SERIAL:
+            return AsyncModbusSerialClient(
+                port=str(config.serial_port), baudrate=config.baudrate
+            )
+        case ModbusTransport.RTU_OVER_TCP:
+            return AsyncModbusTcpClient(
+                host=config.host, port=config.port, framer=FramerType.RTU
+            )
+        case _:
+            return AsyncModbusTcpClient(host=config.host, port=config.port)
+
+
+class AskoheatModbusConnection:
+    """Modbus connection shared by all askoheat devices on the same bus."""
+
+    def __init__(self, config: AskoheatModbusConnectionConfig) -> None:
+        """Initialize."""
+        self.config = config
+        self.client = _create_modbus_client(config)
+        self.references = 0
+        self._connect_lock = asyncio.Lock()
+        self._request_lock = asyncio.Lock()
+
+    async def connect(self) -> Any:
+        """Connect to modbus client if not connected yet."""
+        async with self._connect_lock:
+            if not self.client.connected:
+                return await self.client.connect()
+        return self.client.connected
+
+    async def execute[T](
+        self,
+        request: Callable[
+            [AsyncModbusTcpClient | AsyncModbusSerialClient], Awaitable[T]
+        ],
+    ) -> T:
+        """Execute request, multiplexing the requests of all devices."""
+        async with self._request_lock:
+            try:
+                return await request(self.client)
+            finally:
+                if self.config.inter_frame_delay > 0:
+                    await asyncio.sleep(self.config.inter_frame_delay)
+
+    def close(self) -> None:
+        """Close connection to modbus client."""
+        self.client.close()
+
+
+class AskoheatModbusConnectionPool:
+    """Pool of modbus connections shared by devices on the same bus."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._connections: dict[tuple[str, ...], AskoheatModbusConnection] = {}
+
+    def acquire(
+        self, config: AskoheatModbusConnectionConfig
+    ) -> AskoheatModbusConnection:
+        """
+        Return connection to the bus, opening a new one if needed.
+
+        Raise AskoheatModbusApiClientError if the bus is open with another baudrate.
+        """
+        connection = self._connections.get(config.pool_key)
+        if connection is None:
+            connection = self._connections[config.pool_key] = AskoheatModbusConnection(
+                config
+            )
+        elif (
+            config.transport == ModbusTransport.SERIAL
+            and connection.config.baudrate != config.baudrate
+        ):
+            msg = "baudrate_mismatch"
+            raise AskoheatModbusApiClientError(
+                translation_domain=DOMAIN,
+                translation_key=msg,
+                translation_placeholders={
+                    "serial_port": str(config.serial_port),
+                    "baudrate": str(connection.config.baudrate),
+                },
+            )
+        connection.references += 1
+        return connection
+
+    def release(self, connection: AskoheatModbusConnection) -> None:
+        """Release connection, closing it if no device uses it anymore."""
+        connection.references -= 1
+        if connection.references > 0:
+            return
+        connection.close()
+        self._connections.pop(connection.config.pool_key, None)
+
+
 class AskoheatModbusApiClient:
     """Sample API Client."""
 
-    def __init__(self, host: str, port: int) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        host: str,
+        port: int,
+        unit_id: int = DEFAULT_UNIT_ID,
+        pool: AskoheatModbusConnectionPool | None = None,
+        *,
+        transport: ModbusTransport = ModbusTransport.TCP,
+        serial_port: str | None = None,
+        baudrate: int = DEFAULT_BAUDRATE,
+        read_chunk_size: int = MODBUS_MAX_READ_REGISTERS,
+        stale_data_grace_period: float = 0,
+        read_rate_limit: float = DEFAULT_READ_RATE_LIMIT,
+        write_rate_limit: float = DEFAULT_WRITE_RATE_LIMIT,
+    ) -> None:
         """Askoheat Modbus API Client."""
         self._host = host
         self._port = port
-        self._client = self._create_client(host=host, port=port)
+        self._unit_id = unit_id
+        self._pool = pool
+        self._read_chunk_size = max(1, min(read_chunk_size, MODBUS_MAX_READ_REGISTERS))
+        # largest chunk size the device answered reliably, by block starting register
+        self._learned_read_chunk_sizes: dict[int, int] = {}
+        self._successful_block_reads: dict[int, int] = {}
+        # registers not supported by the firmware of the device
+        self._register_map_variant: RegisterMapVariant | None = None
+        self._register_maps: dict[BlockKey, RegisterMap] = {}
+        self._decode_errors = AskoheatDecodeErrorLog(
+            DECODE_ERROR_LOG_INTERVAL.total_seconds()
+        )
+        # files keeping raw snapshots of polled blocks, by block
+        self._register_histories: dict[BlockKey, RegisterHistory] = {}
+        # raw value of the status register of the last block read, by block
+        self._status_words: dict[BlockKey, int | None] = {}
+        self._circuit_breaker = AskoheatCircuitBreaker(
+            CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+            CIRCUIT_BREAKER_OPEN_INTERVAL.total_seconds(),
+        )
+        # held while probing a device, other requests fail meanwhile
+        self._probe_lock = asyncio.Lock()
+        self._read_limiter = AskoheatTokenBucket(read_rate_limit, READ_RATE_LIMIT_BURST)
+        self._write_limiter = AskoheatTokenBucket(
+            write_rate_limit, WRITE_RATE_LIMIT_BURST
+        )
+        config = AskoheatModbusConnectionConfig(
+            host=host,
+            port=port,
+            transport=transport,
+            serial_port=serial_port,
+            baudrate=baudrate,
+        )
+        self._connection = (
+            pool.acquire(config)
+            if pool is not None
+            else AskoheatModbusConnection(config)
+        )
+        self._client = self._connection.client
         self._last_communication_success = True
-
-    def _create_client(self, host: str, port: int) -> AsyncModbusTcpClient:
-        return AsyncModbusTcpClient(host=host, port=port)
+        # seconds the last good data is served after communication failed
+        self._stale_data_grace_period = stale_data_grace_period
+        # monotonic time of the first failure since the last successful request
+        self._failing_since: float | None = None
 
     async def connect(self) -> Any:
         """Connect to modbus client."""
-        return await self._client.connect()
+        return await self._connection.connect()
+
+    @property
+    def unit_id(self) -> int:
+        """Return modbus unit id of the device."""
+        return self._unit_id
+
+    def read_chunk_size(self, descr: RegisterBlockDescriptor) -> int:
+        """Return number of registers currently read at once for a block."""
+        return self._learned_read_chunk_sizes.get(
+            descr.starting_register, self._read_chunk_size
+        )
+
+    @property
+    def register_map_variant(self) -> RegisterMapVariant | None:
+        """Return register map variant of the device firmware, None for all."""
+        return self._register_map_variant
+
+    @register_map_variant.setter
+    def register_map_variant(self, variant: RegisterMapVariant | None) -> None:
+        self._register_map_variant = variant
+        self._register_maps.clear()
+
+    def register_map(self, block_key: BlockKey) -> RegisterMap:
+        """Return register map of a block without registers the device lacks."""
+        register_map = self._register_maps.get(block_key)
+        if register_map is None:
+            register_map = register_block(block_key).register_map
+            if self._register_map_variant is not None:
+                register_map = register_map.without(
+                    self._register_map_variant.unsupported.get(block_key, ())
+                )
+            self._register_maps[block_key] = register_map
+        return register_map
+
+    @property
+    def register_histories(self) -> dict[BlockKey, RegisterHistory]:
+        """Return files keeping raw snapshots of the polled blocks by block."""
+        return self._register_histories
+
+    @register_histories.setter
+    def register_histories(self, histories: dict[BlockKey, RegisterHistory]) -> None:
+        self._register_histories = histories
+
+    def status_word(self, block_key: BlockKey) -> int | None:
+        """Return raw status register of the last read of a block, None if unread."""
+        return self._status_words.get(block_key)
+
+    def decode_block(
+        self, block_key: BlockKey, registers: Sequence[int | None]
+    ) -> AskoheatDataBlock:
+        """Decode raw registers of a whole block, like a snapshot of the history."""
+        block = register_block(block_key)
+        if len(registers) != block.number_of_registers:
+            msg = (
+                f"Expected {block.number_of_registers} registers of block "
+                f"{block_key}, got {len(registers)}"
+            )
+            raise ValueError(msg)
+        return self.__map_data(
+            block,
+            self.register_map(block_key),
+            list(registers),
+            # decoding past snapshots doesn't affect the status of current values
+            errors=AskoheatDecodeErrorLog(DECODE_ERROR_LOG_INTERVAL.total_seconds()),
+        )
+
+    @property
+    def decode_errors(self) -> dict[str, str]:
+        """Return decode errors of values which currently cannot be read."""
+        return self._decode_errors.errors
 
     @property
     def is_connected(self) -> bool:
@@ -82,173 +559,399 @@ class AskoheatModbusApiClient:
         """Return true if connected and no communication error occurred."""
         return self.is_connected and self._last_communication_success
 
+    @property
+    def is_available(self) -> bool:
+        """
+        Return true if ready or communication failed within the grace period.
+
+        Entities keep serving the last good data during short outages instead of
+        turning unavailable with every failed poll.
+        """
+        if self.is_ready:
+            return True
+        return (
+            self._failing_since is not None
+            and monotonic() - self._failing_since < self._stale_data_grace_period
+        )
+
+    @property
+    def stale_data_expires_in(self) -> float | None:
+        """Return seconds until the grace period ends, None if not failing."""
+        if self.is_ready or self._failing_since is None:
+            return None
+        return max(
+            0.0, self._failing_since + self._stale_data_grace_period - monotonic()
+        )
+
+    @property
+    def rate_limits(self) -> dict[str, dict[str, float]]:
+        """Return requests per second and burst of the read and write limiters."""
+        return {
+            name: {"rate": limiter.rate, "burst": limiter.capacity}
+            for name, limiter in (
+                ("read", self._read_limiter),
+                ("write", self._write_limiter),
+            )
+        }
+
+    @property
+    def circuit_breaker_state(self) -> CircuitBreakerState:
+        """Return state of the circuit breaker of the requests to the device."""
+        return self._circuit_breaker.state
+
+    def add_circuit_breaker_listener(
+        self, listener: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Add listener called when the circuit breaker opens or closes."""
+        return self._circuit_breaker.add_listener(listener)
+
     def last_communication_failed(self) -> None:
         """Mark last communication with the API as failed."""
         self._last_communication_success = False
+        if self._failing_since is None:
+            self._failing_since = monotonic()
 
     def close(self) -> None:
         """Close comnection to modbus client."""
-        self._client.close()
+        if self._pool is not None:
+            self._pool.release(self._connection)
+        else:
+            self._connection.close()
 
     async def async_read_ema_data(self) -> AskoheatDataBlock:
         """Read EMA states."""
-        data = await self.__async_read_input_registers_data(
-            EMA_REGISTER_BLOCK_DESCRIPTOR.starting_register,
-            EMA_REGISTER_BLOCK_DESCRIPTOR.number_of_registers,
-        )
-        if len(data.registers) != EMA_REGISTER_BLOCK_DESCRIPTOR.number_of_registers:
-            msg = "Unexpected number of registers read."
-            LOGGER.error(
-                "%s: number of registers=%s, expected=%s",
-                msg,
-                len(data.registers),
-                EMA_REGISTER_BLOCK_DESCRIPTOR.number_of_registers,
-            )
-            raise AskoheatModbusApiClientCommunicationError(
-                translation_domain=DOMAIN, translation_key=msg
-            )
+        block = register_block(BlockKey.EMA)
+        register_map = self.register_map(BlockKey.EMA)
+        data = await self.__async_read_block(
+            block,
+            register_map,
+            self.__async_read_input_registers_data,
+        )
         LOGGER.debug("async_read_ema_data %s", data)
-        return self.__map_data(EMA_REGISTER_BLOCK_DESCRIPTOR, data)
+        self.__record_snapshot(BlockKey.EMA, data)
+        return self.__map_data(block, register_map, data)
 
     async def async_write_ema_data(
         self, api_desc: RegisterInputDescriptor, value: object
-    ) -> AskoheatDataBlock:
-        """Write EMA parameter."""
+    ) -> None:
+        """Write EMA parameter, the block must be re-read to get the new state."""
         LOGGER.debug(
             f"async write ema parameter at {api_desc.starting_register}, value={value}"
         )
+        register = register_block(BlockKey.EMA).absolute_register_index(api_desc)
         register_values = await self._prepare_register_value(
             api_desc,
             value,
-            lambda: self.__async_read_single_input_register(
-                EMA_REGISTER_BLOCK_DESCRIPTOR.absolute_register_index(api_desc)
-            ),
+            lambda: self.__async_read_single_input_register(register),
         )
         if len(register_values) > 0:
             await self.__async_write_register_values(
-                EMA_REGISTER_BLOCK_DESCRIPTOR.absolute_register_index(api_desc),
+                register,
                 register_values,
             )
-        return await self.async_read_ema_data()
 
     async def async_read_par_data(self) -> AskoheatDataBlock:
         """Read PAR states."""
-        data = await self.__async_read_input_registers_data(
-            PARAM_REGISTER_BLOCK_DESCRIPTOR.starting_register,
-            PARAM_REGISTER_BLOCK_DESCRIPTOR.number_of_registers,
-        )
-        if len(data.registers) != PARAM_REGISTER_BLOCK_DESCRIPTOR.number_of_registers:
-            msg = "Unexpected number of registers read."
-            LOGGER.error(
-                "%s: number of registers=%s, expected=%s",
-                msg,
-                len(data.registers),
-                PARAM_REGISTER_BLOCK_DESCRIPTOR.number_of_registers,
-            )
-            raise AskoheatModbusApiClientCommunicationError(
-                translation_domain=DOMAIN, translation_key=msg
-            )
+        block = register_block(BlockKey.PAR)
+        register_map = self.register_map(BlockKey.PAR)
+        data = await self.__async_read_block(
+            block,
+            register_map,
+            self.__async_read_input_registers_data,
+        )
         LOGGER.debug("async_read_par_data %s", data)
-        return self.__map_data(PARAM_REGISTER_BLOCK_DESCRIPTOR, data)
+        return self.__map_data(block, register_map, data)
 
     async def async_read_config_data(self) -> AskoheatDataBlock:
         """Read config states."""
-        data = await self.__async_read_holding_registers_data(
-            CONF_REGISTER_BLOCK_DESCRIPTOR.starting_register,
-            CONF_REGISTER_BLOCK_DESCRIPTOR.number_of_registers,
-        )
-        if len(data.registers) != CONF_REGISTER_BLOCK_DESCRIPTOR.number_of_registers:
-            msg = "Unexpected number of registers read."
-            LOGGER.error(
-                "%s: number of registers=%s, expected=%s",
-                msg,
-                len(data.registers),
-                CONF_REGISTER_BLOCK_DESCRIPTOR.number_of_registers,
-            )
-            raise AskoheatModbusApiClientCommunicationError(
-                translation_domain=DOMAIN, translation_key=msg
-            )
+        block = register_block(BlockKey.CONF)
+        register_map = self.register_map(BlockKey.CONF)
+        data = await self.__async_read_block(
+            block,
+            register_map,
+            self.__async_read_holding_registers_data,
+        )
         LOGGER.debug("async_read_config_data %s", data)
-        return self.__map_data(CONF_REGISTER_BLOCK_DESCRIPTOR, data)
+        return self.__map_data(block, register_map, data)
 
     async def async_write_config_data(
         self, api_desc: RegisterInputDescriptor, value: object
-    ) -> AskoheatDataBlock:
-        """Write EMA parameter."""
+    ) -> None:
+        """Write config parameter, the block must be re-read to get the new state."""
         LOGGER.debug(
             "async write config parameter at %i, value=%r",
             api_desc.starting_register,
             value,
         )
+        register = register_block(BlockKey.CONF).absolute_register_index(api_desc)
         register_values = await self._prepare_register_value(
             api_desc,
             value,
-            lambda: self.__async_read_single_holding_register(
-                CONF_REGISTER_BLOCK_DESCRIPTOR.absolute_register_index(api_desc)
-            ),
+            lambda: self.__async_read_single_holding_register(register),
         )
         if len(register_values) > 0:
             await self.__async_write_register_values(
-                CONF_REGISTER_BLOCK_DESCRIPTOR.absolute_register_index(api_desc),
+                register,
                 register_values,
             )
-        return await self.async_read_config_data()
 
     async def async_read_op_data(self) -> AskoheatDataBlock:
         """Read OP data states."""
-        data = await self.__async_read_input_registers_data(
-            DATA_REGISTER_BLOCK_DESCRIPTOR.starting_register,
-            DATA_REGISTER_BLOCK_DESCRIPTOR.number_of_registers,
+        block = register_block(BlockKey.DATA)
+        register_map = self.register_map(BlockKey.DATA)
+        data = await self.__async_read_block(
+            block,
+            register_map,
+            self.__async_read_input_registers_data,
+        )
+        LOGGER.debug("async_read_op_data %s", data)
+        self.__record_snapshot(BlockKey.DATA, data)
+        return self.__map_data(block, register_map, data)
+
+    async def async_read_registers(
+        self, block_key: BlockKey, start: int, end: int
+    ) -> AskoheatDataBlock:
+        """Read registers [start, end) of a block and the values depending on them."""
+        block = register_block(block_key)
+        register_map = self.register_map(block_key).within(start, end)
+        data = await self.__async_read_block(
+            block,
+            register_map,
+            self.__async_read_holding_registers_data
+            if block_key is BlockKey.CONF
+            else self.__async_read_input_registers_data,
         )
-        if len(data.registers) != DATA_REGISTER_BLOCK_DESCRIPTOR.number_of_registers:
-            msg = "Unexpected number of registers read."
+        LOGGER.debug("async_read_registers %s [%s, %s) %s", block_key, start, end, data)
+        return self.__map_data(block, register_map, data)
+
+    def __record_snapshot(self, block_key: BlockKey, data: list[int | None]) -> None:
+        """Keep status word and append raw registers of a block read to its history."""
+        if block_key in STATUS_REGISTERS:
+            self._status_words[block_key] = data[STATUS_REGISTERS[block_key]]
+        history = self._register_histories.get(block_key)
+        if history is not None:
+            history.append(dt_util.utcnow().timestamp(), data)
+
+    async def __async_read_block(
+        self,
+        descr: RegisterBlockDescriptor,
+        register_map: RegisterMap,
+        read: Callable[..., Coroutine[Any, Any, list[int]]],
+    ) -> list[int | None]:
+        """
+        Read registers of a block in chunks.
+
+        Registers the device doesn't support are not read. A failed chunk is split
+        in halves which are retried, registers which cannot be read at all and
+        unsupported registers are returned as None. A block read the device didn't
+        answer at all is recorded as a single failed request by the circuit breaker.
+        """
+        if not self._client.connected:
+            msg = "not_connected"
             raise AskoheatModbusApiClientCommunicationError(
                 translation_domain=DOMAIN, translation_key=msg
             )
-        LOGGER.debug("async_read_op_data %s", data)
-        return self.__map_data(DATA_REGISTER_BLOCK_DESCRIPTOR, data)
+
+        registers: list[int | None] = [None] * descr.number_of_registers
+        chunk_size = self.read_chunk_size(descr)
+        pending = deque(
+            (offset, min(chunk_size, end - offset))
+            for start, end in register_map.readable_ranges
+            for offset in range(start, end, chunk_size)
+        )
+        if not pending:
+            return registers
+        largest_read = 0
+        failed = unanswered = False
+        while pending:
+            offset, count = pending.popleft()
+            try:
+                chunk = await read(
+                    descr.starting_register + offset, count, record_failure=False
+                )
+            except (ModbusException, TimeoutError) as err:
+                LOGGER.debug(
+                    "Reading %s registers at %s failed: %s",
+                    count,
+                    descr.starting_register + offset,
+                    err,
+                )
+                unanswered = True
+                chunk = []
+            if len(chunk) == count:
+                registers[offset : offset + count] = chunk
+                largest_read = max(largest_read, count)
+                continue
+
+            failed = True
+            if count > 1:
+                # retry the failed chunk as two smaller requests
+                half = count // 2
+                pending.extendleft([(offset + half, count - half), (offset, half)])
+            else:
+                LOGGER.debug(
+                    "Register %s could not be read", descr.starting_register + offset
+                )
+
+        if largest_read == 0:
+            if unanswered:
+                # splitting the chunks must not open the breaker within one read
+                self._circuit_breaker.failed()
+            msg = "read_failed"
+            raise AskoheatModbusApiClientCommunicationError(
+                translation_domain=DOMAIN, translation_key=msg
+            )
+        self.__learn_read_chunk_size(descr, chunk_size, largest_read, failed=failed)
+        return registers
+
+    def __learn_read_chunk_size(
+        self,
+        descr: RegisterBlockDescriptor,
+        chunk_size: int,
+        largest_read: int,
+        *,
+        failed: bool,
+    ) -> None:
+        """Adapt chunk size of a block to the largest chunk the device answered."""
+        key = descr.starting_register
+        if failed:
+            self._successful_block_reads[key] = 0
+            if largest_read < chunk_size:
+                LOGGER.debug(
+                    "Reduce read chunk size of block %s to %s registers",
+                    key,
+                    largest_read,
+                )
+                self._learned_read_chunk_sizes[key] = largest_read
+            return
+
+        if chunk_size >= self._read_chunk_size:
+            return
+        successes = self._successful_block_reads.get(key, 0) + 1
+        if successes < READ_CHUNK_SIZE_PROBE_INTERVAL:
+            self._successful_block_reads[key] = successes
+            return
+        # probe whether the device answers larger chunks again
+        self._successful_block_reads[key] = 0
+        self._learned_read_chunk_sizes[key] = min(chunk_size * 2, self._read_chunk_size)
 
     async def __async_read_single_input_register(
         self,
         address: int,
     ) -> int:
-        return (await self.__async_read_input_registers_data(address, 1)).registers[0]
+        return (await self.__async_read_input_registers_data(address, 1))[0]
 
     async def __async_read_input_registers_data(
-        self, address: int, count: int
-    ) -> ModbusPDU:
-        """Read holding registers through modbus."""
+        self, address: int, count: int, *, record_failure: bool = True
+    ) -> list[int]:
+        """Read input registers through modbus."""
         if not self._client.connected:
             msg = "not_connected"
             raise AskoheatModbusApiClientCommunicationError(
                 translation_domain=DOMAIN, translation_key=msg
             )
 
+        await self._read_limiter.async_acquire()
         try:
-            return await self._client.read_input_registers(address=address, count=count)
+            response = await self.__async_execute(
+                lambda client: client.read_input_registers(
+                    address=address, count=count, slave=self._unit_id
+                ),
+                record_failure=record_failure,
+            )
+            self._failing_since = None
+            return response.registers
         finally:
             self._last_communication_success = True
 
+    async def __async_execute[T](
+        self,
+        request: Callable[
+            [AsyncModbusTcpClient | AsyncModbusSerialClient], Awaitable[T]
+        ],
+        *,
+        record_failure: bool = True,
+    ) -> T:
+        """Send request unless the circuit breaker is open, probing if half-open."""
+        if self._circuit_breaker.state is not CircuitBreakerState.CLOSED:
+            await self.__async_probe()
+        return await self.__async_send(request, record_failure=record_failure)
+
+    async def __async_probe(self) -> None:
+        """Probe device with a single register read, raising unless it answers."""
+        if (
+            self._circuit_breaker.state is CircuitBreakerState.OPEN
+            or self._probe_lock.locked()
+        ):
+            msg = "circuit_open"
+            raise AskoheatModbusApiClientCommunicationError(
+                translation_domain=DOMAIN, translation_key=msg
+            )
+        async with self._probe_lock:
+            try:
+                await self.__async_send(
+                    lambda client: client.read_input_registers(
+                        address=CIRCUIT_BREAKER_PROBE_REGISTER,
+                        count=1,
+                        slave=self._unit_id,
+                    )
+                )
+            except (ModbusException, TimeoutError) as err:
+                # the failure got recorded, opening the breaker again
+                msg = "circuit_open"
+                raise AskoheatModbusApiClientCommunicationError(
+                    translation_domain=DOMAIN, translation_key=msg
+                ) from err
+
+    async def __async_send[T](
+        self,
+        request: Callable[
+            [AsyncModbusTcpClient | AsyncModbusSerialClient], Awaitable[T]
+        ],
+        *,
+        record_failure: bool = True,
+    ) -> T:
+        """
+        Send request, recording whether the device answered.
+
+        Cancelled requests are not recorded, unanswered ones only if record_failure
+        is set, otherwise the caller records the failure.
+        """
+        try:
+            response = await self._connection.execute(request)
+        except (ModbusException, TimeoutError):
+            if record_failure:
+                self._circuit_breaker.failed()
+            raise
+        self._circuit_breaker.succeeded()
+        return response
+
     async def __async_read_single_holding_register(
         self,
         address: int,
     ) -> int:
-        return (await self.__async_read_holding_registers_data(address, 1)).registers[0]
+        return (await self.__async_read_holding_registers_data(address, 1))[0]
 
     async def __async_read_holding_registers_data(
-        self, address: int, count: int
-    ) -> ModbusPDU:
-        """Read input registers through modbus."""
+        self, address: int, count: int, *, record_failure: bool = True
+    ) -> list[int]:
+        """Read holding registers through modbus."""
         if not self._client.connected:
             msg = "not_connected"
             raise AskoheatModbusApiClientCommunicationError(
                 translation_domain=DOMAIN, translation_key=msg
             )
 
+        await self._read_limiter.async_acquire()
         try:
-            return await self._client.read_holding_registers(
-                address=address, count=count
+            response = await self.__async_execute(
+                lambda client: client.read_holding_registers(
+                    address=address, count=count, slave=self._unit_id
+                ),
+                record_failure=record_failure,
             )
+            self._failing_since = None
+            return response.registers
         finally:
             self._last_communication_success = True
 
@@ -262,8 +965,14 @@ class AskoheatModbusApiClient:
                 translation_domain=DOMAIN, translation_key=msg
             )
 
+        await self._write_limiter.async_acquire()
         try:
-            await self._client.write_registers(address=address, values=values)
+            await self.__async_execute(
+                lambda client: client.write_registers(
+                    address=address, values=values, slave=self._unit_id
+                )
+            )
+            self._failing_since = None
         finally:
             self._last_communication_success = True
 
@@ -306,130 +1015,148 @@ class AskoheatModbusApiClient:
         return cast("list[int]", result)
 
     def __map_data(
-        self, descr: RegisterBlockDescriptor, data: ModbusPDU
+        self,
+        descr: RegisterBlockDescriptor,
+        register_map: RegisterMap,
+        data: list[int | None],
+        *,
+        errors: AskoheatDecodeErrorLog | None = None,
     ) -> AskoheatDataBlock:
-        binary_sensors = {
-            k: v
-            for k, v in {
-                item.key: _read_register_boolean_input(data, item.api_descriptor)  # type: ignore  # noqa: PGH003
-                for item in descr.binary_sensors
-            }.items()
-            if v is not None
-        }
-        number_inputs = {
-            k: v
-            for k, v in {
-                item.key: _read_register_number_input(data, item.api_descriptor)  # type: ignore  # noqa: PGH003
-                for item in descr.number_inputs
-            }.items()
-            if v is not None
-        }
-        sensors = {
-            k: v
-            for k, v in {
-                item.key: _read_register_input(data, item.api_descriptor)  # type: ignore  # noqa: PGH003
-                for item in descr.sensors
-            }.items()
-            if v is not None
-        }
-        switches = {
-            k: v
-            for k, v in {
-                item.key: _read_register_boolean_input(data, item.api_descriptor)  # type: ignore  # noqa: PGH003
-                for item in descr.switches
-            }.items()
-            if v is not None
-        }
-        text_inputs = {
-            k: v
-            for k, v in {
-                item.key: _read_register_string_input(data, item.api_descriptor)  # type: ignore  # noqa: PGH003
-                for item in descr.text_inputs
-            }.items()
-            if v is not None
-        }
-        time_inputs = {
-            k: v
-            for k, v in {
-                item.key: _read_register_time_input(data, item.api_descriptor)  # type: ignore  # noqa: PGH003
-                for item in descr.time_inputs
-            }.items()
-            if v is not None
-        }
-        select_inputs = dict(
-            {
-                item.key: _read_register_enum_input(data, item.api_descriptor)  # type: ignore  # noqa: PGH003
-                for item in descr.select_inputs
-            }.items()
-        )
+        errors = errors or self._decode_errors
         return AskoheatDataBlock(
-            binary_sensors=binary_sensors,
-            sensors=sensors,
-            switches=switches,
-            number_inputs=number_inputs,
-            text_inputs=text_inputs,
-            time_inputs=time_inputs,
-            select_inputs=select_inputs,
+            binary_sensors=self.__decode_fields(
+                "binary_sensor",
+                descr.binary_sensors,
+                data,
+                register_map,
+                _read_register_boolean_input,
+                errors=errors,
+            ),
+            sensors=self.__decode_fields(
+                "sensor",
+                descr.sensors,
+                data,
+                register_map,
+                _read_register_input,
+                errors=errors,
+            ),
+            switches=self.__decode_fields(
+                "switch",
+                descr.switches,
+                data,
+                register_map,
+                _read_register_boolean_input,
+                errors=errors,
+            ),
+            number_inputs=self.__decode_fields(
+                "number",
+                descr.number_inputs,
+                data,
+                register_map,
+                _read_register_number_input,
+                errors=errors,
+            ),
+            text_inputs=self.__decode_fields(
+                "text",
+                descr.text_inputs,
+                data,
+                register_map,
+                _read_register_string_input,
+                errors=errors,
+            ),
+            time_inputs=self.__decode_fields(
+                "time",
+                descr.time_inputs,
+                data,
+                register_map,
+                _read_register_time_input,
+                errors=errors,
+            ),
+            # select entities show an unknown option for values without match
+            select_inputs=self.__decode_fields(
+                "select",
+                descr.select_inputs,
+                data,
+                register_map,
+                _read_register_enum_input,
+                keep_missing=True,
+                errors=errors,
+            ),
         )
 
+    def __decode_fields(  # noqa: PLR0913
+        self,
+        platform: str,
+        items: Sequence[AskoheatEntityDescription[Any, Any]],
+        data: list[int | None],
+        register_map: RegisterMap,
+        read: Callable[[Sequence[int | None], RegisterInputDescriptor], Any],
+        *,
+        keep_missing: bool = False,
+        errors: AskoheatDecodeErrorLog,
+    ) -> dict[Any, Any]:
+        """Decode values of entities, isolating errors of single values."""
+        result: dict[Any, Any] = {}
+        for item in items:
+            field = f"{platform}.{item.key}"
+            register_field = register_map.field(field)
+            if item.api_descriptor is None or register_field is None:
+                continue
+            if None in data[register_field.offset : register_field.end]:
+                # skip values touching registers which could not be read
+                value = None
+            else:
+                try:
+                    value = read(data, item.api_descriptor)
+                except _DECODE_ERRORS as err:
+                    errors.failed(field, err)
+                    value = None
+                else:
+                    errors.succeeded(field)
+            if value is not None or keep_missing:
+                result[item.key] = value
+        return result
+
 
 def _read_register_input(  # noqa: PLR0912
-    data: ModbusPDU, desc: RegisterInputDescriptor
+    register_values: Sequence[int | None], desc: RegisterInputDescriptor
 ) -> Any:
+    data = cast("list[int]", register_values)
     result: Any = None
     match desc:
         case FlagRegisterInputDescriptor(starting_register, bit):
-            result = _read_flag(data.registers[starting_register], bit)
+            result = _read_flag(data[starting_register], bit)
         case IntEnumInputDescriptor(starting_register, factory):
-            try:
-                value = _read_byte(data.registers[starting_register])
-                result = None if value is None else factory(int(value))
-            except ValueError as err:
-                LOGGER.warning(err)
-                result = None
+            value = _read_byte(data[starting_register])
+            result = None if value is None else factory(int(value))
         case ByteRegisterInputDescriptor(starting_register):
-            result = _read_byte(data.registers[starting_register])
+            result = _read_byte(data[starting_register])
         case UnsignedInt16RegisterInputDescriptor(starting_register):
-            result = _read_uint16(data.registers[starting_register])
+            result = _read_uint16(data[starting_register])
         case UnsignedInt32RegisterInputDescriptor(starting_register):
-            result = _read_uint32(
-                data.registers[starting_register : starting_register + 2]
-            )
+            result = _read_uint32(data[starting_register : starting_register + 2])
         case UnsignedInt32RegisterInputDescriptor(starting_register):
-            result = _read_uint32(
-                data.registers[starting_register : starting_register + 2]
-            )
+            result = _read_uint32(data[starting_register : starting_register + 2])
         case SignedInt16RegisterInputDescriptor(starting_register):
-            result = _read_int16(data.registers[starting_register])
+            result = _read_int16(data[starting_register])
         case Float32RegisterInputDescriptor(starting_register):
-            result = _read_float32(
-                data.registers[starting_register : starting_register + 2]
-            )
+            result = _read_float32(data[starting_register : starting_register + 2])
         case StrEnumInputDescriptor(starting_register, number_of_words, factory):
-            try:
-                result = factory(
-                    _read_str(
-                        data.registers[
-                            starting_register : starting_register + number_of_words
-                        ]
-                    )
-                )
-            except ValueError as err:
-                LOGGER.warning(err)
-                result = None
-
+            result = factory(
+                _read_str(data[starting_register : starting_register + number_of_words])
+            )
         case StringRegisterInputDescriptor(starting_register, number_of_words):
             result = _read_str(
-                data.registers[starting_register : starting_register + number_of_words]
+                data[starting_register : starting_register + number_of_words]
             )
         case TimeRegisterInputDescriptor(starting_register):
             result = _read_time(
-                register_value_hours=data.registers[starting_register],
-                register_value_minutes=data.registers[starting_register + 1],
+                register_value_hours=data[starting_register],
+                register_value_minutes=data[starting_register + 1],
             )
         case StructRegisterInputDescriptor(starting_register, bytes, structure):
             result = _read_struct(
-                data.registers[starting_register : starting_register + bytes], structure
+                data[starting_register : starting_register + bytes], structure
             )
         case _:
             LOGGER.error("Cannot read number input from descriptor %r", desc)
@@ -438,7 +1165,7 @@ def _read_register_input(  # noqa: PLR0912
 
 
 def _read_register_boolean_input(
-    data: ModbusPDU, desc: RegisterInputDescriptor
+    data: Sequence[int | None], desc: RegisterInputDescriptor
 ) -> bool | None:
     result = _read_register_input(data, desc)
     if isinstance(result, bool):
@@ -448,75 +1175,60 @@ def _read_register_boolean_input(
         return bool(result == 1)
 
     if result is not None:
-        LOGGER.error(
-            "Cannot read bool input from descriptor %r, unsupported value %r",
-            desc,
-            result,
-        )
+        msg = f"Unsupported bool value {result!r} of descriptor {desc!r}"
+        raise AskoheatModbusApiClientDecodeError(msg)
     return None
 
 
 def _read_register_number_input(
-    data: ModbusPDU, desc: RegisterInputDescriptor
+    data: Sequence[int | None], desc: RegisterInputDescriptor
 ) -> int | float | None:
     result = _read_register_input(data, desc)
     if isinstance(result, int | float):
         return result
 
     if result is not None:
-        LOGGER.error(
-            "Cannot read number input from descriptor %r, unsupported value %r",
-            desc,
-            type(result),
-        )
+        msg = f"Unsupported number value {result!r} of descriptor {desc!r}"
+        raise AskoheatModbusApiClientDecodeError(msg)
     return None
 
 
 def _read_register_string_input(
-    data: ModbusPDU, desc: RegisterInputDescriptor
+    data: Sequence[int | None], desc: RegisterInputDescriptor
 ) -> str | None:
     result = _read_register_input(data, desc)
     if isinstance(result, str):
         return result
 
     if result is not None:
-        LOGGER.error(
-            "Cannot read str input from descriptor %r, unsupported value %r",
-            desc,
-            result,
-        )
+        msg = f"Unsupported str value {result!r} of descriptor {desc!r}"
+        raise AskoheatModbusApiClientDecodeError(msg)
     return None
 
 
 def _read_register_time_input(
-    data: ModbusPDU, desc: RegisterInputDescriptor
+    data: Sequence[int | None], desc: RegisterInputDescriptor
 ) -> time | None:
     result = _read_register_input(data, desc)
     if isinstance(result, time):
         return result
 
     if result is not None:
-        LOGGER.error(
-            "Cannot read time input from descriptor %r, unsupported value %r",
-            desc,
-            result,
-        )
+        msg = f"Unsupported time value {result!r} of descriptor {desc!r}"
+        raise AskoheatModbusApiClientDecodeError(msg)
     return None
 
 
 def _read_register_enum_input(
-    data: ModbusPDU, desc: RegisterInputDescriptor
+    data: Sequence[int | None], desc: RegisterInputDescriptor
 ) -> ReprEnum | None:
     result = _read_register_input(data, desc)
     if isinstance(result, ReprEnum):
         return result
 
     if result is not None:
-        LOGGER.error(
-            "Cannot read enum input from descriptor %r, unsupported value %r",
-            desc,
-            result,
-        )
+        msg = f"Unsupported enum value {result!r} of descriptor {desc!r}"
+        raise AskoheatModbusApiClientDecodeError(msg)
     return None
 
 
@@ -584,7 +1296,7 @@ def _read_byte(register_value: int) -> int | None:
 
 def _prepare_byte(value: object) -> list[int]:
     """Prepare byte value for writing to registers."""
-    if not isinstance(value, number | float | bool | int):
+    if not isinstance(value, Real):
         LOGGER.error(
             "Cannot convert value %s as byte, wrong datatype %r", value, type(value)
         )
@@ -617,7 +1329,7 @@ def _read_int16(register_value: int) -> int | None:
 
 def _prepare_int16(value: object) -> list[int]:
     """Prepare signed int value for writing to registers."""
-    if not isinstance(value, number | float | int):
+    if not isinstance(value, Real):
         LOGGER.error(
             "Cannot convert value %s as signed int, wrong datatype %r",
             value,
@@ -647,7 +1359,7 @@ def _read_uint16(register_value: int) -> int | None:
 
 def _prepare_uint16(value: object) -> list[int]:
     """Prepare unsigned int 16 value for writing to registers."""
-    if not isinstance(value, number | float | int):
+    if not isinstance(value, Real):
         LOGGER.error(
             "Cannot convert value %s as unsigned int, wrong datatype %r",
             value,
@@ -677,7 +1389,7 @@ def _read_uint32(register_values: list[int]) -> int | None:
 
 def _prepare_uint32(value: object) -> list[int]:
     """Prepare unsigned int 32 value for writing to registers."""
-    if not isinstance(value, number | float | int):
+    if not isinstance(value, Real):
         LOGGER.error(
             "Cannot convert value %s as unsigned int, wrong datatype %r",
             value,
@@ -707,7 +1419,7 @@ def _read_float32(register_values: list[int]) -> float | None:
 
 def _prepare_float32(value: object) -> list[int]:
     """Prepare float32 value writing to registers."""
-    if not isinstance(value, number | float | int):
+    if not isinstance(value, Real):
         LOGGER.error(
             "Cannot convert value %s as float32, wrong datatype %r", value, type(value)
         )
@@ -747,13 +1459,7 @@ def _read_struct(register_values: list[int], structure: str | bytes) -> Any | No
     if byte_string == b"nan\x00":
         return None
 
-    try:
-        val = struct.unpack(structure, byte_string)
-    except struct.error as err:
-        recv_size = len(register_values) * 2
-        msg = f"Received {recv_size} bytes, unpack error {err}"
-        LOGGER.error(msg)
-        return None
+    val = struct.unpack(structure, byte_string)
     if len(val) == 1:
         return val[0]
     return val
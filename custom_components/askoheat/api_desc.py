@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import json
 import typing
 from abc import ABC
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from enum import IntEnum, StrEnum
-from typing import TYPE_CHECKING
+from functools import cache, cached_property
+from importlib import import_module
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from awesomeversion import AwesomeVersion, AwesomeVersionException
+
+from custom_components.askoheat.const import BlockKey
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -102,6 +111,303 @@ class IntEnumInputDescriptor[E: IntEnum](ByteRegisterInputDescriptor):
     values: list[E] = field(hash=False)
 
 
+# data block attributes holding the values of each platform of a register block
+BLOCK_PLATFORM_ATTRIBUTES: typing.Final = (
+    ("binary_sensors", "binary_sensor"),
+    ("sensors", "sensor"),
+    ("switches", "switch"),
+    ("number_inputs", "number"),
+    ("text_inputs", "text"),
+    ("select_inputs", "select"),
+    ("time_inputs", "time"),
+)
+
+
+@dataclass(frozen=True)
+class RegisterBlockLayout:
+    """Fixed slots holding the values of all entities of a register block."""
+
+    # data key of the value in each slot
+    keys: tuple[str, ...]
+    # slot of each entity key, by data block attribute
+    slots: dict[str, dict[StrEnum, int]] = field(hash=False)
+
+    @cached_property
+    def indices(self) -> dict[str, int]:
+        """Return slot by data key."""
+        return {key: index for index, key in enumerate(self.keys)}
+
+    def index(self, data_key: str) -> int | None:
+        """Return slot of a data key, None if the value isn't part of the block."""
+        return self.indices.get(data_key)
+
+
+# version of the register map variants format, other versions are rejected
+REGISTER_MAP_VERSION: typing.Final = 1
+# registers not supported by firmware versions
+REGISTER_MAP_VARIANTS_FILE: typing.Final = (
+    Path(__file__).parent / "register_map_variants.json"
+)
+
+
+class RegisterMapError(ValueError):
+    """Register map with unsupported version, out of range or overlapping fields."""
+
+
+class RegisterType(StrEnum):
+    """Encoding of a value within its registers."""
+
+    FLAG = "flag"
+    BYTE = "byte"
+    INT16 = "int16"
+    UINT16 = "uint16"
+    UINT32 = "uint32"
+    FLOAT32 = "float32"
+    STRING = "string"
+    TIME = "time"
+    STRUCT = "struct"
+
+
+@dataclass(frozen=True)
+class RegisterField:
+    """Registers a value is decoded from, relative to the start of its block."""
+
+    key: str
+    offset: int
+    count: int
+    type: RegisterType
+    bit: int | None = None
+
+    @property
+    def end(self) -> int:
+        """Return offset of the first register after the value."""
+        return self.offset + self.count
+
+    def overlaps(self, other: RegisterField) -> bool:
+        """Return True if both values are decoded from the same register bits."""
+        if self.offset >= other.end or other.offset >= self.end:
+            return False
+        # flags of different bits share their register
+        return self.bit is None or other.bit is None or self.bit == other.bit
+
+
+def _register_encoding(
+    desc: RegisterInputDescriptor,
+) -> tuple[RegisterType, int, int | None]:
+    """Return encoding, number of registers and bit of a register input."""
+    match desc:
+        case FlagRegisterInputDescriptor(_, bit):
+            encoding = (RegisterType.FLAG, 1, bit)
+        case ByteRegisterInputDescriptor():
+            encoding = (RegisterType.BYTE, 1, None)
+        case SignedInt16RegisterInputDescriptor():
+            encoding = (RegisterType.INT16, 1, None)
+        case UnsignedInt16RegisterInputDescriptor():
+            encoding = (RegisterType.UINT16, 1, None)
+        case UnsignedInt32RegisterInputDescriptor():
+            encoding = (RegisterType.UINT32, 2, None)
+        case Float32RegisterInputDescriptor():
+            encoding = (RegisterType.FLOAT32, 2, None)
+        case StringRegisterInputDescriptor(_, number_of_words):
+            encoding = (RegisterType.STRING, number_of_words, None)
+        case TimeRegisterInputDescriptor():
+            encoding = (RegisterType.TIME, 2, None)
+        case StructRegisterInputDescriptor(_, number_of_bytes):
+            encoding = (RegisterType.STRUCT, number_of_bytes, None)
+        case _:
+            msg = f"Unsupported register input descriptor {desc!r}"
+            raise RegisterMapError(msg)
+    return encoding
+
+
+def register_field(key: str, desc: RegisterInputDescriptor) -> RegisterField:
+    """Return registers the value of a register input is decoded from."""
+    register_type, count, bit = _register_encoding(desc)
+    return RegisterField(key, desc.starting_register, count, register_type, bit)
+
+
+def register_range(desc: RegisterInputDescriptor) -> tuple[int, int]:
+    """Return range [start, end) of the registers of a register input."""
+    _, count, _ = _register_encoding(desc)
+    return desc.starting_register, desc.starting_register + count
+
+
+@dataclass(frozen=True)
+class RegisterMap:
+    """Compiled register layout of the values of a register block."""
+
+    starting_register: int
+    number_of_registers: int
+    # fields ordered by offset and bit
+    fields: tuple[RegisterField, ...]
+    # ordered ranges [start, end) of registers not supported by the device
+    unsupported: tuple[tuple[int, int], ...] = ()
+
+    @cached_property
+    def by_key(self) -> dict[str, RegisterField]:
+        """Return field by data key."""
+        return {field.key: field for field in self.fields}
+
+    @cached_property
+    def _offsets(self) -> tuple[int, ...]:
+        """Return offsets of the fields, ordered."""
+        return tuple(field.offset for field in self.fields)
+
+    @cached_property
+    def _max_count(self) -> int:
+        """Return number of registers of the widest field."""
+        return max((field.count for field in self.fields), default=0)
+
+    def keys_in(self, start: int, end: int) -> tuple[str, ...]:
+        """
+        Return data keys of the values depending on registers [start, end).
+
+        Fields are ordered by offset and no wider than the widest field, only the
+        fields starting between start minus that width and end are inspected.
+        """
+        first = bisect_right(self._offsets, start - self._max_count)
+        last = bisect_left(self._offsets, end)
+        return tuple(
+            field.key for field in self.fields[first:last] if field.end > start
+        )
+
+    def within(self, start: int, end: int) -> RegisterMap:
+        """Return register map of the values depending on registers [start, end)."""
+        fields = [self.by_key[key] for key in self.keys_in(start, end)]
+        if not fields:
+            return self.without(((0, self.number_of_registers),))
+        # registers of the depending values may reach beyond the range
+        start = min(start, *(field.offset for field in fields))
+        end = max(end, *(field.end for field in fields))
+        return self.without(
+            tuple(
+                (range_start, range_end)
+                for range_start, range_end in (
+                    (0, start),
+                    (end, self.number_of_registers),
+                )
+                if range_start < range_end
+            )
+        )
+
+    @cached_property
+    def readable_ranges(self) -> tuple[tuple[int, int], ...]:
+        """Return ranges [start, end) of the registers to read."""
+        ranges: list[tuple[int, int]] = []
+        start = 0
+        for unsupported_start, unsupported_end in self.unsupported:
+            if unsupported_start > start:
+                ranges.append((start, unsupported_start))
+            start = max(start, unsupported_end)
+        if start < self.number_of_registers:
+            ranges.append((start, self.number_of_registers))
+        return tuple(ranges)
+
+    def without(self, unsupported: tuple[tuple[int, int], ...]) -> RegisterMap:
+        """Return register map without the fields of unsupported registers."""
+        if not unsupported:
+            return self
+        unsupported = tuple(sorted({*self.unsupported, *unsupported}))
+        return RegisterMap(
+            starting_register=self.starting_register,
+            number_of_registers=self.number_of_registers,
+            fields=tuple(
+                field
+                for field in self.fields
+                if not any(
+                    field.offset < end and start < field.end
+                    for start, end in unsupported
+                )
+            ),
+            unsupported=unsupported,
+        )
+
+    def field(self, data_key: str) -> RegisterField | None:
+        """Return field of a data key, None if the value isn't part of the block."""
+        return self.by_key.get(data_key)
+
+    def validate(self) -> None:
+        """Raise RegisterMapError if fields are out of range or overlap."""
+        if len(self.by_key) != len(self.fields):
+            msg = f"Duplicate keys in register map of block {self.starting_register}"
+            raise RegisterMapError(msg)
+        # fields still covering the registers of the current field
+        active: list[RegisterField] = []
+        for current in self.fields:
+            if current.offset < 0 or current.end > self.number_of_registers:
+                msg = (
+                    f"Registers [{current.offset}, {current.end}) of {current.key} "
+                    f"are outside of block {self.starting_register} with "
+                    f"{self.number_of_registers} registers"
+                )
+                raise RegisterMapError(msg)
+            active = [other for other in active if other.end > current.offset]
+            for other in active:
+                if current.overlaps(other):
+                    msg = (
+                        f"Registers of {current.key} overlap with {other.key} in "
+                        f"block {self.starting_register}"
+                    )
+                    raise RegisterMapError(msg)
+            active.append(current)
+
+
+@dataclass(frozen=True)
+class RegisterMapVariant:
+    """Registers not supported by a range of firmware versions."""
+
+    name: str
+    # ranges [start, end) of unsupported registers relative to their block
+    unsupported: dict[BlockKey, tuple[tuple[int, int], ...]] = field(hash=False)
+    min_software_version: str | None = None
+    # first software version supporting the registers again
+    max_software_version: str | None = None
+
+    def matches(self, software_version: str) -> bool:
+        """Return True if the variant applies to a software version."""
+        version = AwesomeVersion(software_version)
+        try:
+            return (
+                self.min_software_version is None
+                or version >= self.min_software_version
+            ) and (
+                self.max_software_version is None or version < self.max_software_version
+            )
+        except AwesomeVersionException:
+            return False
+
+    def validate(self, register_maps: dict[BlockKey, RegisterMap]) -> None:
+        """Raise RegisterMapError if unsupported ranges are out of their block."""
+        for block_key, ranges in self.unsupported.items():
+            number_of_registers = register_maps[block_key].number_of_registers
+            for start, end in ranges:
+                if not 0 <= start < end <= number_of_registers:
+                    msg = (
+                        f"Unsupported registers [{start}, {end}) of variant "
+                        f"{self.name} are outside of block {block_key}"
+                    )
+                    raise RegisterMapError(msg)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RegisterMapVariant:
+        """Return variant of a serialized dict."""
+        return cls(
+            name=data["name"],
+            unsupported={
+                BlockKey(block_key): tuple(
+                    sorted((start, end) for start, end in ranges)
+                )
+                for block_key, ranges in data["unsupported"].items()
+            },
+            min_software_version=data.get("min_software_version"),
+            max_software_version=data.get("max_software_version"),
+        )
+
+
+def _field_order(field: RegisterField) -> tuple[int, int, str]:
+    return (field.offset, -1 if field.bit is None else field.bit, field.key)
+
+
 @dataclass(frozen=True)
 class RegisterBlockDescriptor:
     """Based askoheat modbus block (range of registers) descriptor."""
@@ -122,3 +428,91 @@ class RegisterBlockDescriptor:
     def absolute_register_index(self, desc: RegisterInputDescriptor) -> int:
         """Return absolute index of register."""
         return self.starting_register + desc.starting_register
+
+    @cached_property
+    def layout(self) -> RegisterBlockLayout:
+        """Return slot layout of the values of this block."""
+        keys: list[str] = []
+        slots: dict[str, dict[StrEnum, int]] = {}
+        for attribute, platform in BLOCK_PLATFORM_ATTRIBUTES:
+            slots[attribute] = {}
+            for item in getattr(self, attribute):
+                slots[attribute][item.key] = len(keys)
+                keys.append(f"{platform}.{item.key}")
+        return RegisterBlockLayout(keys=tuple(keys), slots=slots)
+
+    @cached_property
+    def register_map(self) -> RegisterMap:
+        """Return validated register map of the values of this block."""
+        register_map = RegisterMap(
+            starting_register=self.starting_register,
+            number_of_registers=self.number_of_registers,
+            fields=tuple(
+                sorted(
+                    (
+                        register_field(f"{platform}.{item.key}", item.api_descriptor)
+                        for attribute, platform in BLOCK_PLATFORM_ATTRIBUTES
+                        for item in getattr(self, attribute)
+                        if item.api_descriptor is not None
+                    ),
+                    key=_field_order,
+                )
+            ),
+        )
+        register_map.validate()
+        return register_map
+
+
+# module and name of the descriptor of each register block, the descriptor modules
+# are large and only imported once the register block is needed
+REGISTER_BLOCK_MODULES: typing.Final = {
+    BlockKey.PAR: ("api_par_desc", "PARAM_REGISTER_BLOCK_DESCRIPTOR"),
+    BlockKey.EMA: ("api_ema_desc", "EMA_REGISTER_BLOCK_DESCRIPTOR"),
+    BlockKey.CONF: ("api_conf_desc", "CONF_REGISTER_BLOCK_DESCRIPTOR"),
+    BlockKey.DATA: ("api_op_desc", "DATA_REGISTER_BLOCK_DESCRIPTOR"),
+}
+
+
+@cache
+def register_block(block_key: BlockKey) -> RegisterBlockDescriptor:
+    """
+    Return descriptor of a register block, importing its module on first use.
+
+    Importing a descriptor module blocks, from within the event loop the register
+    blocks should be loaded in the import executor beforehand.
+    """
+    module_name, name = REGISTER_BLOCK_MODULES[block_key]
+    return getattr(import_module(f".{module_name}", __package__), name)
+
+
+def load_register_blocks() -> dict[BlockKey, RegisterBlockDescriptor]:
+    """Return descriptors of all register blocks, importing their modules."""
+    return {block_key: register_block(block_key) for block_key in BlockKey}
+
+
+@cache
+def load_register_map_variants(
+    path: Path = REGISTER_MAP_VARIANTS_FILE,
+) -> tuple[RegisterMapVariant, ...]:
+    """Return validated register map variants of a variants file, blocking."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("version") != REGISTER_MAP_VERSION:
+        msg = f"Unsupported register map variants version {data.get('version')}"
+        raise RegisterMapError(msg)
+    variants = tuple(RegisterMapVariant.from_dict(item) for item in data["variants"])
+    register_maps = {
+        block_key: block.register_map
+        for block_key, block in load_register_blocks().items()
+    }
+    for variant in variants:
+        variant.validate(register_maps)
+    return variants
+
+
+def select_register_map_variant(
+    variants: tuple[RegisterMapVariant, ...], software_version: str
+) -> RegisterMapVariant | None:
+    """Return first variant applying to a software version, None for the full map."""
+    return next(
+        (variant for variant in variants if variant.matches(software_version)), None
+    )
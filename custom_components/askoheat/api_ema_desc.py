@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
+
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.components.number import NumberMode
 from homeassistant.components.sensor.const import SensorDeviceClass, SensorStateClass
@@ -30,6 +32,12 @@ from custom_components.askoheat.model import (
     AskoheatSensorEntityDescription,
 )
 
+# temperatures and the analog input are polled every 5 seconds, jitter of their
+# float values is written at most every max silence interval
+EMA_TEMPERATURE_SIGNIFICANT_CHANGE = 0.2
+EMA_ANALOG_INPUT_SIGNIFICANT_CHANGE = 0.05
+EMA_MAX_SILENCE = timedelta(minutes=5)
+
 EMA_FEED_IN_VALUE_NUMBER_ENTITY_DESCRIPTOR = AskoheatNumberEntityDescription(
     key=NumberAttrKey.LOAD_FEEDIN_VALUE,
     device_key=DeviceKey.ENERGY_MANAGER,
@@ -210,6 +218,8 @@ EMA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_unit_of_measurement=UnitOfElectricPotential.VOLT,
             entity_category=None,
             api_descriptor=Float32RegisterInputDescriptor(23),
+            significant_change=EMA_ANALOG_INPUT_SIGNIFICANT_CHANGE,
+            max_silence=EMA_MAX_SILENCE,
             native_min_value=0,
             native_max_value=10,
         ),
@@ -223,6 +233,8 @@ EMA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             entity_category=None,
             api_descriptor=Float32RegisterInputDescriptor(25),
+            significant_change=EMA_TEMPERATURE_SIGNIFICANT_CHANGE,
+            max_silence=EMA_MAX_SILENCE,
             native_min_value=0,
             native_max_value=120,
         ),
@@ -236,6 +248,8 @@ EMA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             entity_category=None,
             api_descriptor=Float32RegisterInputDescriptor(27),
+            significant_change=EMA_TEMPERATURE_SIGNIFICANT_CHANGE,
+            max_silence=EMA_MAX_SILENCE,
             entity_registry_enabled_default=False,
             native_min_value=0,
             native_max_value=120,
@@ -250,6 +264,8 @@ EMA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             entity_category=None,
             api_descriptor=Float32RegisterInputDescriptor(29),
+            significant_change=EMA_TEMPERATURE_SIGNIFICANT_CHANGE,
+            max_silence=EMA_MAX_SILENCE,
             entity_registry_enabled_default=False,
             native_min_value=0,
             native_max_value=120,
@@ -264,6 +280,8 @@ EMA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             entity_category=None,
             api_descriptor=Float32RegisterInputDescriptor(31),
+            significant_change=EMA_TEMPERATURE_SIGNIFICANT_CHANGE,
+            max_silence=EMA_MAX_SILENCE,
             entity_registry_enabled_default=False,
             native_min_value=0,
             native_max_value=120,
@@ -278,6 +296,8 @@ EMA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             entity_category=None,
             api_descriptor=Float32RegisterInputDescriptor(33),
+            significant_change=EMA_TEMPERATURE_SIGNIFICANT_CHANGE,
+            max_silence=EMA_MAX_SILENCE,
             entity_registry_enabled_default=False,
             native_min_value=0,
             native_max_value=120,
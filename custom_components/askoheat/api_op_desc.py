@@ -5,7 +5,6 @@ from __future__ import annotations
 
 from homeassistant.components.sensor.const import (
     SensorDeviceClass,
-    SensorStateClass,
 )
 from homeassistant.const import EntityCategory, UnitOfTime
 
@@ -21,6 +20,7 @@ from custom_components.askoheat.const import (
     DATA_LEGIO_STATUS_REGISTER,
     BinarySensorAttrKey,
     DeviceKey,
+    LongTermStatistic,
     SensorAttrKey,
 )
 from custom_components.askoheat.model import (
@@ -39,9 +39,9 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_HEATER1_MINUTES,
@@ -49,9 +49,9 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_HEATER2_MINUTES,
@@ -59,9 +59,9 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_HEATER3_MINUTES,
@@ -69,9 +69,9 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_PUMP_MINUTES,
@@ -79,10 +79,10 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
             entity_registry_enabled_default=False,
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_VALVE_MINUTES,
@@ -90,10 +90,10 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:counter",
             entity_registry_enabled_default=False,
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatSensorEntityDescription(
             key=SensorAttrKey.DATA_SWITCH_COUNT_RELAY1,
@@ -101,9 +101,9 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_precision=0,
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             entity_registry_enabled_default=False,
             icon="mdi:counter",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatSensorEntityDescription(
             key=SensorAttrKey.DATA_SWITCH_COUNT_RELAY2,
@@ -111,9 +111,9 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_precision=0,
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             entity_registry_enabled_default=False,
             icon="mdi:counter",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatSensorEntityDescription(
             key=SensorAttrKey.DATA_SWITCH_COUNT_RELAY3,
@@ -121,9 +121,9 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_precision=0,
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             entity_registry_enabled_default=False,
             icon="mdi:counter",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatSensorEntityDescription(
             key=SensorAttrKey.DATA_SWITCH_COUNT_RELAY4,
@@ -131,9 +131,9 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_precision=0,
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             entity_registry_enabled_default=False,
             icon="mdi:counter",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_SINCE_LAST_LEGIO_ACTIVATION_MINUTES,
@@ -141,9 +141,9 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.LEGIO_PROTECTION_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:shield-home",
+            long_term_statistic=LongTermStatistic.MEAN,
         ),
         AskoheatSensorEntityDescription(
             key=SensorAttrKey.DATA_LEGIO_PLATEAU_TIMER,
@@ -182,11 +182,11 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
             native_min_value=0,
             native_max_value=1440,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
+            long_term_statistic=LongTermStatistic.MEAN,
         ),
         AskoheatSensorEntityDescription(
             key=SensorAttrKey.DATA_EMERGENCY_OFF_COUNTDOWN_MINUTES,
@@ -195,11 +195,11 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
             native_min_value=0,
             native_max_value=1440,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
+            long_term_statistic=LongTermStatistic.MEAN,
         ),
         AskoheatSensorEntityDescription(
             key=SensorAttrKey.DATA_BOOT_COUNT,
@@ -207,8 +207,8 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_precision=0,
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             icon="mdi:counter",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_SET_HEATER_STEP,
@@ -216,9 +216,9 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_LOAD_SETPOINT,
@@ -226,10 +226,10 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.ENERGY_MANAGER,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
             entity_registry_enabled_default=False,
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_LOAD_FEEDIN,
@@ -237,9 +237,9 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.ENERGY_MANAGER,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_HEATPUMP_REQUEST,
@@ -247,9 +247,9 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.HEATPUMP_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_ANALOG_INPUT,
@@ -257,9 +257,9 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.ANALOG_INPUT_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_EMERGENCY_MODE,
@@ -267,9 +267,9 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_LEGIO_PROTECTION,
@@ -277,9 +277,9 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.LEGIO_PROTECTION_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_LOW_TARIFF,
@@ -287,9 +287,9 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_MINIMAL_TEMP,
@@ -297,9 +297,9 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_HEATER_STEP1,
@@ -307,10 +307,10 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.ENERGY_MANAGER,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
             entity_registry_enabled_default=False,
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_HEATER_STEP2,
@@ -318,10 +318,10 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.ENERGY_MANAGER,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
             entity_registry_enabled_default=False,
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_HEATER_STEP3,
@@ -329,10 +329,10 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.ENERGY_MANAGER,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
             entity_registry_enabled_default=False,
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_HEATER_STEP4,
@@ -340,10 +340,10 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.ENERGY_MANAGER,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
             entity_registry_enabled_default=False,
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_HEATER_STEP5,
@@ -351,10 +351,10 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.ENERGY_MANAGER,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
             entity_registry_enabled_default=False,
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_HEATER_STEP6,
@@ -362,10 +362,10 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.ENERGY_MANAGER,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
             entity_registry_enabled_default=False,
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatDurationSensorEntityDescription(
             key=SensorAttrKey.DATA_OPERATING_TIME_HEATER_STEP7,
@@ -373,20 +373,20 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             device_key=DeviceKey.ENERGY_MANAGER,
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTime.MINUTES,
             icon="mdi:progress-clock",
             entity_registry_enabled_default=False,
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatSensorEntityDescription(
             key=SensorAttrKey.DATA_COUNT_SET_HEATER_STEP,
             api_descriptor=UnsignedInt32RegisterInputDescriptor(79),
             device_key=DeviceKey.ENERGY_MANAGER,
             entity_category=EntityCategory.DIAGNOSTIC,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             native_min_value=0,
             native_max_value=100000,
             icon="mdi:counter",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatSensorEntityDescription(
             key=SensorAttrKey.DATA_COUNT_LOAD_SETPOINT,
@@ -394,11 +394,11 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_precision=0,
             device_key=DeviceKey.ENERGY_MANAGER,
             entity_category=EntityCategory.DIAGNOSTIC,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             native_min_value=0,
             native_max_value=100000,
             icon="mdi:counter",
             entity_registry_enabled_default=False,
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatSensorEntityDescription(
             key=SensorAttrKey.DATA_COUNT_LOAD_FEEDIN,
@@ -406,10 +406,10 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_precision=0,
             device_key=DeviceKey.ENERGY_MANAGER,
             entity_category=EntityCategory.DIAGNOSTIC,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             native_min_value=0,
             native_max_value=100000,
             icon="mdi:counter",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatSensorEntityDescription(
             key=SensorAttrKey.DATA_COUNT_HEATPUMP_REQUEST,
@@ -417,10 +417,10 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_precision=0,
             device_key=DeviceKey.HEATPUMP_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             native_min_value=0,
             native_max_value=100000,
             icon="mdi:counter",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatSensorEntityDescription(
             key=SensorAttrKey.DATA_COUNT_ANALOG_INPUT,
@@ -428,10 +428,10 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_precision=0,
             device_key=DeviceKey.ANALOG_INPUT_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             native_min_value=0,
             native_max_value=100000,
             icon="mdi:counter",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatSensorEntityDescription(
             key=SensorAttrKey.DATA_COUNT_EMERGENCY_MODE,
@@ -439,10 +439,10 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_precision=0,
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             native_min_value=0,
             native_max_value=100000,
             icon="mdi:counter",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatSensorEntityDescription(
             key=SensorAttrKey.DATA_COUNT_LEGIO_PROTECTION,
@@ -450,10 +450,10 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_precision=0,
             device_key=DeviceKey.LEGIO_PROTECTION_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             native_min_value=0,
             native_max_value=100000,
             icon="mdi:counter",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatSensorEntityDescription(
             key=SensorAttrKey.DATA_COUNT_LOW_TARIFF,
@@ -461,10 +461,10 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_precision=0,
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             native_min_value=0,
             native_max_value=100000,
             icon="mdi:counter",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatSensorEntityDescription(
             key=SensorAttrKey.DATA_COUNT_MINIMAL_TEMP,
@@ -472,10 +472,10 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_precision=0,
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
-            state_class=SensorStateClass.TOTAL_INCREASING,
             native_min_value=0,
             native_max_value=100000,
             icon="mdi:counter",
+            long_term_statistic=LongTermStatistic.SUM,
         ),
         AskoheatSensorEntityDescription(
             key=SensorAttrKey.DATA_MAX_MEASURED_TEMP,
@@ -483,10 +483,10 @@ DATA_REGISTER_BLOCK_DESCRIPTOR = RegisterBlockDescriptor(
             native_precision=0,
             device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
             entity_category=EntityCategory.DIAGNOSTIC,
-            state_class=SensorStateClass.MEASUREMENT,
             native_min_value=0,
             native_max_value=255,
             icon="mdi:thermometer-high",
+            long_term_statistic=LongTermStatistic.MEAN,
         ),
     ],
     binary_sensors=[
@@ -8,15 +8,13 @@ from homeassistant.components.binary_sensor import (
     ENTITY_ID_FORMAT,
     BinarySensorEntity,
 )
+from homeassistant.const import Platform
 from homeassistant.core import callback
 
-from custom_components.askoheat.api_conf_desc import CONF_REGISTER_BLOCK_DESCRIPTOR
-from custom_components.askoheat.api_ema_desc import EMA_REGISTER_BLOCK_DESCRIPTOR
-from custom_components.askoheat.api_op_desc import DATA_REGISTER_BLOCK_DESCRIPTOR
-from custom_components.askoheat.api_par_desc import PARAM_REGISTER_BLOCK_DESCRIPTOR
 from custom_components.askoheat.model import AskoheatBinarySensorEntityDescription
 
 from .entity import AskoheatEntity
+from .entity_index import entity_descriptions
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -33,31 +31,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up the binary_sensor platform."""
     async_add_entities(
-        AskoheatBinarySensor(
-            entry=entry,
-            coordinator=coordinator,
-            entity_description=entity_description,
-        )
-        for entity_description, coordinator in {
-            **dict.fromkeys(
-                PARAM_REGISTER_BLOCK_DESCRIPTOR.binary_sensors,
-                entry.runtime_data.par_coordinator,
-            ),
-            **dict.fromkeys(
-                EMA_REGISTER_BLOCK_DESCRIPTOR.binary_sensors,
-                entry.runtime_data.ema_coordinator,
-            ),
-            **dict.fromkeys(
-                CONF_REGISTER_BLOCK_DESCRIPTOR.binary_sensors,
-                entry.runtime_data.config_coordinator,
-            ),
-            **dict.fromkeys(
-                DATA_REGISTER_BLOCK_DESCRIPTOR.binary_sensors,
-                entry.runtime_data.data_coordinator,
-            ),
-        }.items()
-        if entity_description.device_key is None
-        or entity_description.device_key in entry.runtime_data.supported_devices
+        [
+            AskoheatBinarySensor(
+                entry=entry,
+                coordinator=entry.runtime_data.coordinator(block_key),
+                entity_description=entity_description,
+            )
+            for entity_description, block_key in entity_descriptions(
+                Platform.BINARY_SENSOR, entry.runtime_data.supported_devices
+            )
+        ]
     )
 
 
@@ -85,19 +68,16 @@ class AskoheatBinarySensor(
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return (
-            super().available
-            and self.entity_description.data_key in self.coordinator.data
-        )
+        return super().available and self._has_value()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        data = self.coordinator.data
-        if data is None or data.get(self.entity_description.data_key) is None:
+        value = self._value()
+        if value is None:
             return
 
-        self._attr_state = data[self.entity_description.data_key]
+        self._attr_state = value
         if (
             self.entity_description.on_state is True
             or self.entity_description.on_state is False
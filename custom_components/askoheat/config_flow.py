@@ -21,6 +21,7 @@ from homeassistant.helpers import selector
 
 from custom_components.askoheat.coordinator import (
     AskoheatParameterDataUpdateCoordinator,
+    async_get_domain_coordinator,
 )
 from custom_components.askoheat.data import AskoheatDeviceInfos
 
@@ -28,20 +29,44 @@ from .api import (
     AskoheatModbusApiClient,
     AskoheatModbusApiClientCommunicationError,
     AskoheatModbusApiClientError,
+    connection_parameters,
 )
 from .const import (
     CONF_ANALOG_INPUT_UNIT,
+    CONF_BAUDRATE,
+    CONF_CONNECTION,
     CONF_DEVICE_UNITS,
     CONF_FEED_IN,
     CONF_HEATPUMP_UNIT,
     CONF_LEGIONELLA_PROTECTION_UNIT,
     CONF_MODBUS_MASTER_UNIT,
+    CONF_OPTIMISTIC_WRITES,
     CONF_POWER_ENTITY_ID,
     CONF_POWER_INVERT,
+    CONF_READ_CHUNK_SIZE,
+    CONF_READ_RATE_LIMIT,
+    CONF_REGISTER_HISTORY,
+    CONF_REGISTER_HISTORY_DAYS,
+    CONF_REGISTER_HISTORY_ENABLED,
+    CONF_SERIAL_PORT,
+    CONF_STALE_DATA_GRACE_PERIOD,
+    CONF_TRANSPORT,
+    CONF_UNIT_ID,
+    CONF_WRITE_RATE_LIMIT,
+    DEFAULT_BAUDRATE,
     DEFAULT_HOST,
+    DEFAULT_OPTIMISTIC_WRITES,
     DEFAULT_PORT,
+    DEFAULT_READ_RATE_LIMIT,
+    DEFAULT_REGISTER_HISTORY_DAYS,
+    DEFAULT_STALE_DATA_GRACE_PERIOD,
+    DEFAULT_UNIT_ID,
+    DEFAULT_WRITE_RATE_LIMIT,
     DOMAIN,
     LOGGER,
+    MODBUS_MAX_READ_REGISTERS,
+    Baudrate,
+    ModbusTransport,
 )
 
 if TYPE_CHECKING:
@@ -58,6 +83,62 @@ PORT_SELECTOR = vol.All(
     vol.Coerce(int),
 )
 
+UNIT_ID_SELECTOR = vol.All(
+    selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=1, step=1, max=247, mode=selector.NumberSelectorMode.BOX
+        )
+    ),
+    vol.Coerce(int),
+)
+
+READ_CHUNK_SIZE_SELECTOR = vol.All(
+    selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=1,
+            step=1,
+            max=MODBUS_MAX_READ_REGISTERS,
+            mode=selector.NumberSelectorMode.BOX,
+        )
+    ),
+    vol.Coerce(int),
+)
+
+STALE_DATA_GRACE_PERIOD_SELECTOR = vol.All(
+    selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=0,
+            step=1,
+            max=3600,
+            unit_of_measurement="s",
+            mode=selector.NumberSelectorMode.BOX,
+        )
+    ),
+    vol.Coerce(int),
+)
+
+RATE_LIMIT_SELECTOR = vol.All(
+    selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=0.1,
+            step=0.1,
+            max=100,
+            unit_of_measurement="1/s",
+            mode=selector.NumberSelectorMode.BOX,
+        )
+    ),
+    vol.Coerce(float),
+)
+
+REGISTER_HISTORY_DAYS_SELECTOR = vol.All(
+    selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=1, step=1, max=90, mode=selector.NumberSelectorMode.BOX
+        )
+    ),
+    vol.Coerce(int),
+)
+
 
 def _get_section_entry_or_none(
     data: MappingProxyType[str, Any] | None, section: str, entry: str
@@ -70,6 +151,14 @@ def _get_section_entry_or_none(
     return cast("str | None", section_values.get(entry))
 
 
+def _get_section_entry_or_default(
+    data: MappingProxyType[str, Any] | None, section: str, entry: str, default: Any
+) -> Any:
+    # unlike `or`, keeps configured falsy values such as a grace period of 0
+    value = _get_section_entry_or_none(data, section, entry)
+    return default if value is None else value
+
+
 class OptionalEntitySelector(selector.EntitySelector):
     """Optional entity selector."""
 
@@ -96,6 +185,84 @@ def _step_user_data_schema(
             vol.Required(
                 CONF_PORT, default=data[CONF_PORT] if data else DEFAULT_PORT
             ): PORT_SELECTOR,
+            vol.Required(
+                CONF_UNIT_ID,
+                default=data.get(CONF_UNIT_ID, DEFAULT_UNIT_ID)
+                if data
+                else DEFAULT_UNIT_ID,
+            ): UNIT_ID_SELECTOR,
+            vol.Required(
+                CONF_OPTIMISTIC_WRITES,
+                default=data.get(CONF_OPTIMISTIC_WRITES, DEFAULT_OPTIMISTIC_WRITES)
+                if data
+                else DEFAULT_OPTIMISTIC_WRITES,
+            ): cv.boolean,
+            vol.Required(CONF_CONNECTION): data_entry_flow.section(
+                vol.Schema(
+                    {
+                        vol.Required(
+                            CONF_TRANSPORT,
+                            default=_get_section_entry_or_none(
+                                data, CONF_CONNECTION, CONF_TRANSPORT
+                            )
+                            or ModbusTransport.TCP,
+                        ): selector.SelectSelector(
+                            selector.SelectSelectorConfig(
+                                options=list(ModbusTransport),
+                                translation_key=CONF_TRANSPORT,
+                            )
+                        ),
+                        vol.Optional(
+                            CONF_SERIAL_PORT,
+                            description={
+                                "suggested_value": _get_section_entry_or_none(
+                                    data, CONF_CONNECTION, CONF_SERIAL_PORT
+                                )
+                            },
+                        ): cv.string,
+                        vol.Required(
+                            CONF_BAUDRATE,
+                            default=_get_section_entry_or_none(
+                                data, CONF_CONNECTION, CONF_BAUDRATE
+                            )
+                            or str(DEFAULT_BAUDRATE),
+                        ): selector.SelectSelector(
+                            selector.SelectSelectorConfig(options=list(Baudrate))
+                        ),
+                        vol.Required(
+                            CONF_READ_CHUNK_SIZE,
+                            default=_get_section_entry_or_none(
+                                data, CONF_CONNECTION, CONF_READ_CHUNK_SIZE
+                            )
+                            or MODBUS_MAX_READ_REGISTERS,
+                        ): READ_CHUNK_SIZE_SELECTOR,
+                        vol.Required(
+                            CONF_STALE_DATA_GRACE_PERIOD,
+                            default=_get_section_entry_or_default(
+                                data,
+                                CONF_CONNECTION,
+                                CONF_STALE_DATA_GRACE_PERIOD,
+                                DEFAULT_STALE_DATA_GRACE_PERIOD,
+                            ),
+                        ): STALE_DATA_GRACE_PERIOD_SELECTOR,
+                        vol.Required(
+                            CONF_READ_RATE_LIMIT,
+                            default=_get_section_entry_or_none(
+                                data, CONF_CONNECTION, CONF_READ_RATE_LIMIT
+                            )
+                            or DEFAULT_READ_RATE_LIMIT,
+                        ): RATE_LIMIT_SELECTOR,
+                        vol.Required(
+                            CONF_WRITE_RATE_LIMIT,
+                            default=_get_section_entry_or_none(
+                                data, CONF_CONNECTION, CONF_WRITE_RATE_LIMIT
+                            )
+                            or DEFAULT_WRITE_RATE_LIMIT,
+                        ): RATE_LIMIT_SELECTOR,
+                    }
+                ),
+                {"collapsed": True},
+            ),
             vol.Required(CONF_FEED_IN): data_entry_flow.section(
                 vol.Schema(
                     {
@@ -132,6 +299,31 @@ def _step_user_data_schema(
                 ),
                 {"collapsed": True},
             ),
+            vol.Required(CONF_REGISTER_HISTORY): data_entry_flow.section(
+                vol.Schema(
+                    {
+                        vol.Required(
+                            CONF_REGISTER_HISTORY_ENABLED,
+                            default=_get_section_entry_or_none(
+                                data,
+                                CONF_REGISTER_HISTORY,
+                                CONF_REGISTER_HISTORY_ENABLED,
+                            )
+                            or False,
+                        ): cv.boolean,
+                        vol.Required(
+                            CONF_REGISTER_HISTORY_DAYS,
+                            default=_get_section_entry_or_none(
+                                data,
+                                CONF_REGISTER_HISTORY,
+                                CONF_REGISTER_HISTORY_DAYS,
+                            )
+                            or DEFAULT_REGISTER_HISTORY_DAYS,
+                        ): REGISTER_HISTORY_DAYS_SELECTOR,
+                    }
+                ),
+                {"collapsed": True},
+            ),
             vol.Required(CONF_DEVICE_UNITS): data_entry_flow.section(
                 vol.Schema(
                     {
@@ -206,6 +398,13 @@ def _step_user_data_schema(
 STEP_USER_DATA_SCHEMA = _step_user_data_schema()
 
 
+def _serial_port_missing(user_input: dict[str, Any]) -> bool:
+    connection = user_input.get(CONF_CONNECTION) or {}
+    return connection.get(
+        CONF_TRANSPORT
+    ) == ModbusTransport.SERIAL and not connection.get(CONF_SERIAL_PORT)
+
+
 class AskoheatFlowHandler(ConfigFlow, domain=DOMAIN):
     """Config flow for Blueprint."""
 
@@ -217,16 +416,21 @@ class AskoheatFlowHandler(ConfigFlow, domain=DOMAIN):
     ) -> ConfigFlowResult:
         """Handle a flow initialized by the user."""
         _errors = {}
-        if user_input is not None:
+        if user_input is not None and _serial_port_missing(user_input):
+            _errors["base"] = "serial_port_required"
+        elif user_input is not None:
+            # share the connection of config entries already set up on the same bus
+            client = AskoheatModbusApiClient(
+                host=user_input[CONF_HOST],
+                port=user_input[CONF_PORT],
+                unit_id=user_input[CONF_UNIT_ID],
+                pool=async_get_domain_coordinator(self.hass).connection_pool,
+                **connection_parameters(user_input),
+            )
             try:
-                client = AskoheatModbusApiClient(
-                    host=user_input[CONF_HOST], port=user_input[CONF_PORT]
-                )
                 await client.connect()
                 coordinator = AskoheatParameterDataUpdateCoordinator(self.hass, client)
                 parameters = await coordinator.load_parameters(client)
-
-                client.close()
             except AskoheatModbusApiClientCommunicationError as exception:
                 LOGGER.error(exception)
                 _errors["base"] = "connection"
@@ -272,6 +476,8 @@ class AskoheatFlowHandler(ConfigFlow, domain=DOMAIN):
                     data=user_input,
                     description_placeholders={"name": name},
                 )
+            finally:
+                client.close()
 
         return self.async_show_form(
             step_id="user",
@@ -11,13 +11,54 @@ ATTRIBUTION = "Data provided by http://jsonplaceholder.typicode.com/"
 
 DEFAULT_HOST = "askoheat.local"
 DEFAULT_PORT = 502
+DEFAULT_UNIT_ID = 1
+DEFAULT_BAUDRATE = 19200
 DEFAULT_SCAN_INTERVAL = 5
 
 # per coordinator scan intervals
 SCAN_INTERVAL_EMA = timedelta(seconds=5)
 SCAN_INTERVAL_CONFIG = timedelta(hours=1)
 SCAN_INTERVAL_OP_DATA = timedelta(minutes=1)
-
+# window of the statistics sensors over the sampled energymanager values
+EMA_STATISTICS_WINDOW = timedelta(minutes=15)
+# largest window of statistics, the energymanager samples held cover it
+EMA_SAMPLE_WINDOW = timedelta(hours=1)
+EMA_SAMPLE_BUFFER_CAPACITY = EMA_SAMPLE_WINDOW // SCAN_INTERVAL_EMA + 1
+# max interval between two energymanager polls the heater energy is integrated over
+HEATER_ENERGY_MAX_INTERVAL = 3 * SCAN_INTERVAL_EMA
+# min interval between two log entries about the same value failing to decode
+DECODE_ERROR_LOG_INTERVAL = timedelta(hours=1)
+
+# max number of concurrent modbus requests over all configured askoheat devices
+MAX_CONCURRENT_REQUESTS = 4
+# consecutive unanswered requests after which no more requests are sent to a device
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+# interval after which a device not answering is probed again
+CIRCUIT_BREAKER_OPEN_INTERVAL = timedelta(seconds=30)
+# requests sent at once before the rate limit of a device applies
+READ_RATE_LIMIT_BURST = 10
+WRITE_RATE_LIMIT_BURST = 4
+
+# max number of registers a single read request may return (253 bytes PDU)
+MODBUS_MAX_READ_REGISTERS = 125
+# one start bit, eight data bits, one parity or stop bit and one stop bit
+MODBUS_RTU_BITS_PER_CHARACTER = 11
+# above 19200 baud, the modbus spec requires a fixed silent interval of 1.75ms
+MODBUS_RTU_FIXED_TIMING_BAUDRATE = 19200
+MODBUS_RTU_FIXED_INTER_FRAME_DELAY = 0.00175
+# number of successful block reads before a larger read chunk size is probed again
+READ_CHUNK_SIZE_PROBE_INTERVAL = 60
+
+CONF_UNIT_ID = "unit_id"
+CONF_OPTIMISTIC_WRITES = "optimistic_writes"
+CONF_CONNECTION = "connection"
+CONF_TRANSPORT = "transport"
+CONF_SERIAL_PORT = "serial_port"
+CONF_BAUDRATE = "baudrate"
+CONF_READ_CHUNK_SIZE = "read_chunk_size"
+CONF_STALE_DATA_GRACE_PERIOD = "stale_data_grace_period"
+CONF_READ_RATE_LIMIT = "read_rate_limit"
+CONF_WRITE_RATE_LIMIT = "write_rate_limit"
 CONF_FEED_IN = "auto-feed-in"
 CONF_DEVICE_UNITS = "devices"
 CONF_ANALOG_INPUT_UNIT = "analog_input_unit"
@@ -26,6 +67,20 @@ CONF_MODBUS_MASTER_UNIT = "modbus_master_unit"
 CONF_HEATPUMP_UNIT = "heatpump_unit"
 CONF_POWER_ENTITY_ID = "power_entity_id"
 CONF_POWER_INVERT = "power_invert"
+CONF_REGISTER_HISTORY = "register_history"
+CONF_REGISTER_HISTORY_ENABLED = "enabled"
+CONF_REGISTER_HISTORY_DAYS = "days"
+
+# days of raw register snapshots kept in the register history files by default
+DEFAULT_REGISTER_HISTORY_DAYS = 7
+# seconds the last good data is served after communication with the device failed,
+# none by default to turn the entities unavailable with the first failed poll
+DEFAULT_STALE_DATA_GRACE_PERIOD = 0
+# read and write requests per second sent to a device by default
+DEFAULT_READ_RATE_LIMIT = 10.0
+DEFAULT_WRITE_RATE_LIMIT = 2.0
+# entities show written values at once and confirm them in the background
+DEFAULT_OPTIMISTIC_WRITES = False
 
 CONF_INPUT_SETTINGS_REGISTER = 2
 CONF_AUTO_HEATER_SETTINGS_REGISTER = 4
@@ -36,6 +91,8 @@ CONF_HOUSE_TYPE_REGISTER = 20
 DATA_LEGIO_STATUS_REGISTER = 27
 PAR_TYPE_REGISTER = 16
 EMA_STATUS_REGISTER = 16
+# input register read to probe whether a device answers again, the ema status word
+CIRCUIT_BREAKER_PROBE_REGISTER = 300 + EMA_STATUS_REGISTER
 
 
 class NumberAttrKey(StrEnum):
@@ -411,6 +468,40 @@ class SensorAttrKey(StrEnum):
     DATA_COUNT_MINIMAL_TEMP = "count_minimal_temp"
     DATA_MAX_MEASURED_TEMP = "max_measured_temp"
 
+    # -----------------------------------------------
+    # EMA statistics enums
+    # -----------------------------------------------
+    STATISTICS_HEATER1_ACTIVE = "heater1_active_statistics"
+    STATISTICS_HEATER2_ACTIVE = "heater2_active_statistics"
+    STATISTICS_HEATER3_ACTIVE = "heater3_active_statistics"
+    STATISTICS_LOAD_FEEDIN_VALUE = "load_feedin_statistics"
+    STATISTICS_ANALOG_INPUT_VALUE = "analog_input_statistics"
+    STATISTICS_INTERNAL_TEMPERATUR_SENSOR_VALUE = "internal_temp_sensor_statistics"
+    STATISTICS_EXTERNAL_TEMPERATUR_SENSOR1_VALUE = "external_temp_sensor1_statistics"
+    STATISTICS_EXTERNAL_TEMPERATUR_SENSOR2_VALUE = "external_temp_sensor2_statistics"
+    STATISTICS_EXTERNAL_TEMPERATUR_SENSOR3_VALUE = "external_temp_sensor3_statistics"
+    STATISTICS_EXTERNAL_TEMPERATUR_SENSOR4_VALUE = "external_temp_sensor4_statistics"
+
+    # -----------------------------------------------
+    # heater energy enums
+    # -----------------------------------------------
+    HEATER1_ENERGY = "heater1_energy"
+    HEATER2_ENERGY = "heater2_energy"
+    HEATER3_ENERGY = "heater3_energy"
+
+    # -----------------------------------------------
+    # diagnostic enums
+    # -----------------------------------------------
+    CIRCUIT_BREAKER = "circuit_breaker"
+
+
+class ModbusTransport(StrEnum):
+    """Supported transports to reach the askoheat modbus interface."""
+
+    TCP = "tcp"
+    RTU_OVER_TCP = "rtu_over_tcp"
+    SERIAL = "serial"
+
 
 class Baudrate(StrEnum):
     """Available Baudrates."""
@@ -456,6 +547,46 @@ class EnergyMeterType(IntEnum):
     EM300 = 0x010
 
 
+class BlockKey(StrEnum):
+    """Register block keys."""
+
+    PAR = "par"
+    EMA = "ema"
+    CONF = "conf"
+    DATA = "data"
+
+
+# status registers of which bit transitions are fired as events, by block
+STATUS_REGISTERS = {
+    BlockKey.EMA: EMA_STATUS_REGISTER,
+    BlockKey.DATA: DATA_LEGIO_STATUS_REGISTER,
+}
+# fired for every bit of a status register changed between two polls
+EVENT_STATUS_BIT_CHANGED = f"{DOMAIN}_status_bit_changed"
+# fired for every optimistic write which could not be confirmed
+EVENT_WRITE_FAILED = f"{DOMAIN}_write_failed"
+
+
+class CircuitBreakerState(StrEnum):
+    """State of the circuit breaker of the requests to a device."""
+
+    # requests are sent
+    CLOSED = "closed"
+    # device stopped answering, requests fail without being sent
+    OPEN = "open"
+    # open interval elapsed, the next request probes the device
+    HALF_OPEN = "half_open"
+
+
+class LongTermStatistic(StrEnum):
+    """Hourly long-term statistics imported for a value."""
+
+    # state at the end of the hour and running sum of the increases of a counter
+    SUM = "sum"
+    # mean, min and max of a measurement
+    MEAN = "mean"
+
+
 class DeviceKey(StrEnum):
     """Device keys."""
 
@@ -472,6 +603,12 @@ class AttributeKeys(StrEnum):
 
     API_DESCRIPTOR = "api_descriptor"
     FORMATTED = "formatted"
+    MINIMUM = "minimum"
+    MAXIMUM = "maximum"
+    RATE = "rate_per_hour"
+    SAMPLES = "samples"
+    WINDOW = "window"
+    DATA_AGE = "data_age"
 
 
 HTTP_RESPONSE_CODE_OK = 200
@@ -2,37 +2,128 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import abstractmethod
+from contextlib import nullcontext
+from itertools import count
+from time import monotonic
 from typing import TYPE_CHECKING, Any
 
 import async_timeout
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from pymodbus.exceptions import ModbusException
 
-from .api import AskoheatModbusApiClient, AskoheatModbusApiClientError
+from .api import (
+    AskoheatModbusApiClient,
+    AskoheatModbusApiClientError,
+    AskoheatModbusConnectionPool,
+)
+from .api_desc import register_block, register_range
 from .const import (
     DOMAIN,
+    EMA_SAMPLE_BUFFER_CAPACITY,
+    EVENT_STATUS_BIT_CHANGED,
+    HEATER_ENERGY_MAX_INTERVAL,
     LOGGER,
+    MAX_CONCURRENT_REQUESTS,
     SCAN_INTERVAL_CONFIG,
     SCAN_INTERVAL_EMA,
     SCAN_INTERVAL_OP_DATA,
+    STATUS_REGISTERS,
+    BlockKey,
+)
+from .data import AskoheatBlockState
+from .ema_statistics import EmaSampleBuffer
+from .heater_energy import HeaterEnergy
+from .status_events import (
+    ATTR_BIT,
+    ATTR_KEY,
+    ATTR_NEW,
+    ATTR_OLD,
+    ATTR_REGISTER,
+    changed_bits,
+    status_bit_descriptions,
 )
 
 if TYPE_CHECKING:
-    from datetime import timedelta
+    from collections.abc import Iterable, Mapping
+    from contextlib import AbstractAsyncContextManager
+    from datetime import datetime, timedelta
 
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 
-    from custom_components.askoheat.api_desc import RegisterInputDescriptor
+    from custom_components.askoheat.api_desc import (
+        RegisterBlockDescriptor,
+        RegisterBlockLayout,
+        RegisterInputDescriptor,
+    )
     from custom_components.askoheat.data import AskoheatDataBlock
 
+# Conjugate of the golden ratio, used to spread poll phases of config entries
+_GOLDEN_RATIO_CONJUGATE = 0.6180339887498949
+# marks values missing in the state of a coordinator
+_UNSET = object()
+
+
+class AskoheatDomainCoordinator:
+    """Coordinate polling of all askoheat config entries."""
+
+    def __init__(self, max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS) -> None:
+        """Initialize."""
+        self._request_limiter = asyncio.Semaphore(max_concurrent_requests)
+        self._slots: dict[str, int] = {}
+        self._connection_pool = AskoheatModbusConnectionPool()
+
+    @property
+    def connection_pool(self) -> AskoheatModbusConnectionPool:
+        """Return pool of modbus connections shared by all config entries."""
+        return self._connection_pool
+
+    @property
+    def request_limiter(self) -> asyncio.Semaphore:
+        """Return semaphore limiting concurrent requests of all config entries."""
+        return self._request_limiter
+
+    def register(self, entry_id: str) -> int:
+        """Register config entry and return its poll slot."""
+        if entry_id not in self._slots:
+            used_slots = set(self._slots.values())
+            self._slots[entry_id] = next(
+                slot for slot in count() if slot not in used_slots
+            )
+        return self._slots[entry_id]
+
+    def unregister(self, entry_id: str) -> None:
+        """Unregister config entry and release its poll slot."""
+        self._slots.pop(entry_id, None)
+
+    def poll_offset(self, entry_id: str, interval: timedelta) -> float:
+        """Return offset in seconds to shift the poll phase of a config entry."""
+        slot = self._slots.get(entry_id, 0)
+        # the golden ratio keeps the offsets evenly spread over the interval
+        # without knowing the number of config entries upfront
+        return (slot * _GOLDEN_RATIO_CONJUGATE) % 1 * interval.total_seconds()
+
+
+def async_get_domain_coordinator(hass: HomeAssistant) -> AskoheatDomainCoordinator:
+    """Return domain coordinator shared by all askoheat config entries."""
+    domain_coordinator = hass.data.get(DOMAIN)
+    if domain_coordinator is None:
+        domain_coordinator = hass.data[DOMAIN] = AskoheatDomainCoordinator()
+    return domain_coordinator
+
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-class AskoheatDataUpdateCoordinator(DataUpdateCoordinator):
+class AskoheatDataUpdateCoordinator(DataUpdateCoordinator[AskoheatBlockState]):
     """Class to manage fetching state of askoheat through a single API call."""
 
     _client: AskoheatModbusApiClient
-    _writing: bool = False
+    _block_key: BlockKey
 
     def __init__(
         self,
@@ -41,6 +132,7 @@ class AskoheatDataUpdateCoordinator(DataUpdateCoordinator):
         client: AskoheatModbusApiClient,
         *,
         config_entry: ConfigEntry | None = None,
+        domain_coordinator: AskoheatDomainCoordinator | None = None,
     ) -> None:
         """Initialize."""
         super().__init__(
@@ -55,88 +147,373 @@ class AskoheatDataUpdateCoordinator(DataUpdateCoordinator):
             config_entry=config_entry,
         )
         self._client = client
+        self._domain_coordinator = domain_coordinator
+        # serializes reads and write batches of the block
+        self._lock = asyncio.Lock()
+        # values waiting to be written, superseded values are replaced
+        self._pending_writes: dict[RegisterInputDescriptor, object] = {}
+        # resolves to the pending values which failed to write or to re-read
+        self._pending_batch: asyncio.Future[set[RegisterInputDescriptor]] | None = None
+        # raw status register of the last poll, to fire events of changed bits
+        self._status_word: int | None = None
+        # monotonic time the data was last read successfully
+        self._last_success: float | None = None
+        # cancels the state write scheduled for the end of the grace period
+        self._unsub_stale_data_expiry: CALLBACK_TYPE | None = None
+        # delay of the first scheduled refresh, shifting the poll phase to not poll
+        # all config entries at the same time
+        self._poll_offset = (
+            domain_coordinator.poll_offset(config_entry.entry_id, scan_interval)
+            if domain_coordinator is not None
+            and config_entry is not None
+            and scan_interval is not None
+            else 0.0
+        )
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next refresh, delaying only the first one by the offset."""
+        offset, self._poll_offset = self._poll_offset, 0.0
+        if offset <= 0 or self.update_interval is None:
+            super()._schedule_refresh()
+            return
+        # the coordinator adds its jitter to every refresh it schedules, shifting
+        # the phase through it would lengthen every interval by the offset
+        self._async_unsub_refresh()
+        self._unsub_refresh = async_call_later(
+            self.hass, offset, self._async_schedule_shifted_refresh
+        )
+
+    @callback
+    def _async_schedule_shifted_refresh(self, _: datetime) -> None:
+        """Schedule refreshes at the interval once the poll phase is shifted."""
+        self._unsub_refresh = None
+        super()._schedule_refresh()
+
+    @property
+    def _block(self) -> RegisterBlockDescriptor:
+        """Return descriptor of the register block of this coordinator."""
+        return register_block(self._block_key)
+
+    @property
+    def layout(self) -> RegisterBlockLayout:
+        """Return slot layout of the data of this coordinator."""
+        return self._block.layout
+
+    def _to_state(self, data: AskoheatDataBlock) -> AskoheatBlockState:
+        """Map askoheat data block to the slots of the block state."""
+        return AskoheatBlockState.from_data_block(self._block.layout, data)
+
+    def _request_limiter(self) -> AbstractAsyncContextManager[Any]:
+        """Return context limiting concurrent requests across config entries."""
+        if self._domain_coordinator is None:
+            return nullcontext()
+        return self._domain_coordinator.request_limiter
+
+    @property
+    def data_age(self) -> int | None:
+        """Return whole seconds since the data was last read, None if never read."""
+        if self._last_success is None:
+            return None
+        return int(monotonic() - self._last_success)
+
+    async def _async_update_data(self) -> AskoheatBlockState:
+        """Update data, never overlapping with writes."""
+        async with self._lock:
+            try:
+                state = await self._async_read_data()
+            except (UpdateFailed, TimeoutError):
+                self._async_schedule_stale_data_expiry()
+                if not self.last_update_success:
+                    # only the first failed refresh is passed to the listeners, keep
+                    # the age of the stale data served meanwhile up to date
+                    self.async_update_listeners()
+                raise
+        self._last_success = monotonic()
+        self._async_cancel_stale_data_expiry()
+        self._async_fire_status_events()
+        return state
+
+    @callback
+    def _async_schedule_stale_data_expiry(self) -> None:
+        """Write the state of the entities once they stop serving stale data."""
+        expires_in = self._client.stale_data_expires_in
+        if (
+            self._unsub_stale_data_expiry is not None
+            or expires_in is None
+            or expires_in <= 0
+        ):
+            return
+        self._unsub_stale_data_expiry = async_call_later(
+            self.hass, expires_in, self._async_stale_data_expired
+        )
+
+    @callback
+    def _async_stale_data_expired(self, _: datetime) -> None:
+        """Turn the entities unavailable at the end of the grace period."""
+        self._unsub_stale_data_expiry = None
+        self.async_update_listeners()
+
+    @callback
+    def _async_cancel_stale_data_expiry(self) -> None:
+        if self._unsub_stale_data_expiry is not None:
+            self._unsub_stale_data_expiry()
+            self._unsub_stale_data_expiry = None
+
+    async def async_shutdown(self) -> None:
+        """Cancel the scheduled state write on shutdown."""
+        self._async_cancel_stale_data_expiry()
+        await super().async_shutdown()
+
+    @callback
+    def _async_fire_status_events(self) -> None:
+        """Fire an event for every status register bit changed since the last poll."""
+        if self._block_key not in STATUS_REGISTERS or self.config_entry is None:
+            return
+        word = self._client.status_word(self._block_key)
+        previous, self._status_word = self._status_word, word
+        if previous is None or word is None:
+            return
+
+        descriptions = status_bit_descriptions(self._block_key)
+        device_registry = dr.async_get(self.hass)
+        register = self._block.starting_register + STATUS_REGISTERS[self._block_key]
+        for bit in changed_bits(previous, word):
+            description = descriptions.get(bit)
+            if description is None:
+                continue
+            device = device_registry.async_get_device(
+                identifiers={
+                    (DOMAIN, f"{description.device_key}.{self.config_entry.entry_id}")
+                }
+            )
+            self.hass.bus.async_fire(
+                EVENT_STATUS_BIT_CHANGED,
+                {
+                    ATTR_DEVICE_ID: device.id if device is not None else None,
+                    ATTR_KEY: description.key,
+                    ATTR_REGISTER: register,
+                    ATTR_BIT: bit,
+                    ATTR_OLD: bool(previous >> bit & 1),
+                    ATTR_NEW: bool(word >> bit & 1),
+                },
+            )
 
     @abstractmethod
+    async def _async_read_data(self) -> AskoheatBlockState:
+        """Read data of the block from Askoheat."""
+
     async def async_write(
         self, api_desc: RegisterInputDescriptor, value: object
+    ) -> bool:
+        """
+        Write parameter to Askoheat, returning once the value was written.
+
+        Return True if the value was written and re-read afterwards.
+        """
+        self._pending_writes[api_desc] = value
+        if self._pending_batch is None:
+            self._pending_batch = self.hass.loop.create_future()
+        # later batches must not decide whether this value was written
+        batch = self._pending_batch
+        async with self._lock:
+            # unless the value was already written by another caller of the batch
+            if batch is self._pending_batch:
+                writes = self._pending_writes
+                self._pending_writes = {}
+                self._pending_batch = None
+                try:
+                    batch.set_result(await self._async_write_batch(writes))
+                except BaseException:
+                    # the other callers of the batch must not wait forever
+                    batch.set_result(set(writes))
+                    raise
+        return api_desc not in batch.result()
+
+    async def _async_write_batch(
+        self, writes: dict[RegisterInputDescriptor, object]
+    ) -> set[RegisterInputDescriptor]:
+        """
+        Write all pending values and re-read the written registers afterwards.
+
+        Return descriptors of the values which failed to write or to re-read.
+        """
+        failed: set[RegisterInputDescriptor] = set()
+        for api_desc, value in writes.items():
+            try:
+                async with self._request_limiter(), async_timeout.timeout(10):
+                    await self._async_write_value(api_desc, value)
+            except (
+                AskoheatModbusApiClientError,
+                ModbusException,
+                TimeoutError,
+            ) as exception:
+                LOGGER.info(
+                    "Could not write state %s to askoheat register %s => %s",
+                    value,
+                    api_desc,
+                    exception,
+                )
+                self._client.last_communication_failed()
+                failed.add(api_desc)
+
+        try:
+            if self.data is None:
+                self.async_set_updated_data(await self._async_read_data())
+            else:
+                await self._async_refresh_registers(writes)
+        except (AskoheatModbusApiClientError, UpdateFailed, TimeoutError) as exception:
+            LOGGER.info("Could not read state after writing => %s", exception)
+            self._client.last_communication_failed()
+            return set(writes)
+        return failed
+
+    async def _async_refresh_registers(
+        self, writes: dict[RegisterInputDescriptor, object]
+    ) -> None:
+        """Re-read the written registers and update the entities depending on them."""
+        register_map = self._client.register_map(self._block_key)
+        ranges: list[tuple[int, int]] = []
+        for start, end in sorted(register_range(api_desc) for api_desc in writes):
+            if ranges and start <= ranges[-1][1]:
+                ranges[-1] = (ranges[-1][0], max(ranges[-1][1], end))
+            else:
+                ranges.append((start, end))
+
+        state = self.data
+        data_keys: list[str] = []
+        for start, end in ranges:
+            async with self._request_limiter(), async_timeout.timeout(10):
+                data = await self._client.async_read_registers(
+                    self._block_key, start, end
+                )
+            keys = register_map.keys_in(start, end)
+            state = state.updated(data, keys)
+            data_keys.extend(keys)
+        self._async_set_updated_values(state, data_keys)
+
+    @callback
+    def _async_set_updated_values(
+        self, state: AskoheatBlockState, data_keys: Iterable[str]
     ) -> None:
-        """Write parameter to Askoheat."""
+        """Set state of a targeted refresh, updating listeners of changed values."""
+        previous = self.data
+        self.data = state
+        self._last_success = monotonic()
+        changed = {
+            key
+            for key in data_keys
+            if previous is None or previous.get(key, _UNSET) != state.get(key, _UNSET)
+        }
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                update_callback()
+
+    @abstractmethod
+    async def _async_write_value(
+        self, api_desc: RegisterInputDescriptor, value: object
+    ) -> None:
+        """Write a single parameter to Askoheat."""
 
 
 class AskoheatEMADataUpdateCoordinator(AskoheatDataUpdateCoordinator):
     """Class to manage fetching askoheat energymanager states."""
 
-    def __init__(self, hass: HomeAssistant, client: AskoheatModbusApiClient, *, config_entry: ConfigEntry | None = None) -> None:
+    _block_key = BlockKey.EMA
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: AskoheatModbusApiClient,
+        *,
+        config_entry: ConfigEntry | None = None,
+        domain_coordinator: AskoheatDomainCoordinator | None = None,
+    ) -> None:
         """Initialize."""
-        super().__init__(hass=hass, scan_interval=SCAN_INTERVAL_EMA, client=client, config_entry=config_entry)
+        super().__init__(
+            hass=hass,
+            scan_interval=SCAN_INTERVAL_EMA,
+            client=client,
+            config_entry=config_entry,
+            domain_coordinator=domain_coordinator,
+        )
+        # raw samples of the polled values, set up once statistics are used
+        self.samples: EmaSampleBuffer | None = None
+        # energy of the heater stages, set up with the config entry
+        self.heater_energy: HeaterEnergy | None = None
+
+    async def async_setup_samples(self) -> EmaSampleBuffer:
+        """Return buffer of raw samples, set up off the event loop on first use."""
+        if self.samples is None:
+            samples = await self.hass.async_add_import_executor_job(
+                EmaSampleBuffer, EMA_SAMPLE_BUFFER_CAPACITY
+            )
+            # unless set up by another caller meanwhile
+            if self.samples is None:
+                self.samples = samples
+        return self.samples
+
+    @callback
+    def async_setup_heater_energy(self, parameters: Mapping[str, Any]) -> None:
+        """Integrate energy of the heater stages with the rated powers given."""
+        self.heater_energy = HeaterEnergy(
+            parameters, HEATER_ENERGY_MAX_INTERVAL.total_seconds()
+        )
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_read_data(self) -> AskoheatBlockState:
         """Update ema data via library."""
-        # prevent concurrent reads while writing is in progress
-        if self._writing:
-            return self.data
         try:
-            async with async_timeout.timeout(10):
+            async with self._request_limiter(), async_timeout.timeout(10):
                 data = await self._client.async_read_ema_data()
-                return _map_data_block_to_dict(data)
+                state = self._to_state(data)
         except AskoheatModbusApiClientError as exception:
             self._client.last_communication_failed()
             raise UpdateFailed(exception) from exception
         except TimeoutError as error:
             self._client.last_communication_failed()
             raise error from error
-
-    async def async_write(
+        timestamp = monotonic()
+        if self.samples is not None:
+            self.samples.append(timestamp, state)
+        if self.heater_energy is not None:
+            self.heater_energy.add(timestamp, state)
+        return state
+
+    async def _async_write_value(
         self, api_desc: RegisterInputDescriptor, value: object
     ) -> None:
         """Write parameter ema block of Askoheat."""
-        try:
-            self._writing = True
-            async with async_timeout.timeout(10):
-                data = await self._client.async_write_ema_data(api_desc, value)
-                self.data = _map_data_block_to_dict(data)
-        except AskoheatModbusApiClientError as exception:
-            LOGGER.info(
-                "Could not write state %s to askoheat register %s => %s",
-                value,
-                api_desc,
-                exception,
-            )
-            self._client.last_communication_failed()
-        except TimeoutError as error:
-            LOGGER.info(
-                "Could not write state %s to askoheat register %s => %s",
-                value,
-                api_desc,
-                error,
-            )
-            self._client.last_communication_failed()
-        finally:
-            self._writing = False
+        await self._client.async_write_ema_data(api_desc, value)
 
 
 class AskoheatConfigDataUpdateCoordinator(AskoheatDataUpdateCoordinator):
     """Class to manage fetching askoheat configuration states."""
 
+    _block_key = BlockKey.CONF
+
     def __init__(
         self,
         hass: HomeAssistant,
         client: AskoheatModbusApiClient,
         *,
         config_entry: ConfigEntry | None = None,
+        domain_coordinator: AskoheatDomainCoordinator | None = None,
     ) -> None:
         """Initialize."""
-        super().__init__(hass=hass, scan_interval=SCAN_INTERVAL_CONFIG, client=client, config_entry=config_entry)
+        super().__init__(
+            hass=hass,
+            scan_interval=SCAN_INTERVAL_CONFIG,
+            client=client,
+            config_entry=config_entry,
+            domain_coordinator=domain_coordinator,
+        )
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_read_data(self) -> AskoheatBlockState:
         """Update config data via library."""
-        # prevent concurrent reads while writing is in progress
-        if self._writing:
-            return self.data
         try:
-            async with async_timeout.timeout(10):
+            async with self._request_limiter(), async_timeout.timeout(10):
                 data = await self._client.async_read_config_data()
-                return _map_data_block_to_dict(data)
+                return self._to_state(data)
         except AskoheatModbusApiClientError as exception:
             self._client.last_communication_failed()
             raise UpdateFailed(exception) from exception
@@ -144,58 +521,49 @@ class AskoheatConfigDataUpdateCoordinator(AskoheatDataUpdateCoordinator):
             self._client.last_communication_failed()
             raise error from error
 
-    async def async_write(
+    async def _async_write_value(
         self, api_desc: RegisterInputDescriptor, value: object
     ) -> None:
-        """Write parameter ema block of Askoheat."""
-        try:
-            self._writing = True
-            async with async_timeout.timeout(10):
-                data = await self._client.async_write_config_data(api_desc, value)
-                self.data = _map_data_block_to_dict(data)
-        except AskoheatModbusApiClientError as exception:
-            LOGGER.info(
-                "Could not write state %s to askoheat register %s => %s",
-                value,
-                api_desc,
-                exception,
-            )
-            self._client.last_communication_failed()
-        except TimeoutError as error:
-            LOGGER.info(
-                "Could not write state %s to askoheat register %s => %s",
-                value,
-                api_desc,
-                error,
-            )
-            self._client.last_communication_failed()
-        finally:
-            self._writing = False
+        """Write parameter config block of Askoheat."""
+        await self._client.async_write_config_data(api_desc, value)
 
 
 class AskoheatParameterDataUpdateCoordinator(AskoheatDataUpdateCoordinator):
     """Class to manage fetching askoheat parameter states."""
 
+    _block_key = BlockKey.PAR
+
     def __init__(
         self,
         hass: HomeAssistant,
         client: AskoheatModbusApiClient,
         *,
         config_entry: ConfigEntry | None = None,
+        domain_coordinator: AskoheatDomainCoordinator | None = None,
     ) -> None:
         """Initialize."""
-        super().__init__(hass=hass, scan_interval=None, client=client, config_entry=config_entry)
+        super().__init__(
+            hass=hass,
+            scan_interval=None,
+            client=client,
+            config_entry=config_entry,
+            domain_coordinator=domain_coordinator,
+        )
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_read_data(self) -> AskoheatBlockState:
         """Update parameter data via library."""
         return await self.load_parameters(self._client)
 
-    async def load_parameters(self, client: AskoheatModbusApiClient) -> dict[str, Any]:
+    async def load_parameters(
+        self, client: AskoheatModbusApiClient
+    ) -> AskoheatBlockState:
         """Load askoheat parameters through provided client."""
+        # the descriptor module is imported on first use, keep it off the event loop
+        await self.hass.async_add_import_executor_job(register_block, self._block_key)
         try:
-            async with async_timeout.timeout(10):
+            async with self._request_limiter(), async_timeout.timeout(10):
                 data = await client.async_read_par_data()
-                return _map_data_block_to_dict(data)
+                return self._to_state(data)
         except AskoheatModbusApiClientError as exception:
             self._client.last_communication_failed()
             raise UpdateFailed(exception) from exception
@@ -203,7 +571,7 @@ class AskoheatParameterDataUpdateCoordinator(AskoheatDataUpdateCoordinator):
             self._client.last_communication_failed()
             raise error from error
 
-    async def async_write(self, _: RegisterInputDescriptor, __: object) -> None:
+    async def _async_write_value(self, _: RegisterInputDescriptor, __: object) -> None:
         """Write parameter par block of Askoheat."""
         msg = "Writing values to parameters not allowed"
         raise UpdateFailed(msg)
@@ -212,22 +580,31 @@ class AskoheatParameterDataUpdateCoordinator(AskoheatDataUpdateCoordinator):
 class AskoheatOperationDataUpdateCoordinator(AskoheatDataUpdateCoordinator):
     """Class to manage fetching askoheat operation data states."""
 
+    _block_key = BlockKey.DATA
+
     def __init__(
         self,
         hass: HomeAssistant,
         client: AskoheatModbusApiClient,
         *,
         config_entry: ConfigEntry | None = None,
+        domain_coordinator: AskoheatDomainCoordinator | None = None,
     ) -> None:
         """Initialize."""
-        super().__init__(hass=hass, scan_interval=SCAN_INTERVAL_OP_DATA, client=client, config_entry=config_entry)
+        super().__init__(
+            hass=hass,
+            scan_interval=SCAN_INTERVAL_OP_DATA,
+            client=client,
+            config_entry=config_entry,
+            domain_coordinator=domain_coordinator,
+        )
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Update config data via library."""
+    async def _async_read_data(self) -> AskoheatBlockState:
+        """Update operation data via library."""
         try:
-            async with async_timeout.timeout(10):
+            async with self._request_limiter(), async_timeout.timeout(10):
                 data = await self._client.async_read_op_data()
-                return _map_data_block_to_dict(data)
+                return self._to_state(data)
         except AskoheatModbusApiClientError as exception:
             self._client.last_communication_failed()
             raise UpdateFailed(exception) from exception
@@ -235,39 +612,7 @@ class AskoheatOperationDataUpdateCoordinator(AskoheatDataUpdateCoordinator):
             self._client.last_communication_failed()
             raise error from error
 
-    async def async_write(self, _: RegisterInputDescriptor, __: object) -> None:
+    async def _async_write_value(self, _: RegisterInputDescriptor, __: object) -> None:
         """Write parameter data block of Askoheat."""
         msg = "Writing values to data block not allowed"
         raise UpdateFailed(msg)
-
-
-def _map_data_block_to_dict(data: AskoheatDataBlock) -> dict[str, Any]:
-    """Map askoheat data block to dict."""
-    result: dict[str, Any] = {}
-    if data.binary_sensors:
-        result.update(
-            {f"binary_sensor.{k}": data.binary_sensors[k] for k in data.binary_sensors}
-        )
-
-    if data.sensors:
-        result.update({f"sensor.{k}": data.sensors[k] for k in data.sensors})
-
-    if data.switches:
-        result.update({f"switch.{k}": data.switches[k] for k in data.switches})
-
-    if data.number_inputs:
-        result.update(
-            {f"number.{k}": data.number_inputs[k] for k in data.number_inputs}
-        )
-
-    if data.text_inputs:
-        result.update({f"text.{k}": data.text_inputs[k] for k in data.text_inputs})
-
-    if data.select_inputs:
-        result.update(
-            {f"select.{k}": data.select_inputs[k] for k in data.select_inputs}
-        )
-
-    if data.time_inputs:
-        result.update({f"time.{k}": data.time_inputs[k] for k in data.time_inputs})
-    return result
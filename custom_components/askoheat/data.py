@@ -2,21 +2,25 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
-from custom_components.askoheat.const import SensorAttrKey
+from homeassistant.helpers.device_registry import DeviceInfo
+
+from custom_components.askoheat.api_desc import BLOCK_PLATFORM_ATTRIBUTES
+from custom_components.askoheat.const import BlockKey, DeviceKey, SensorAttrKey
 
 if TYPE_CHECKING:
     from datetime import time
     from enum import ReprEnum
 
     from homeassistant.config_entries import ConfigEntry
+    from homeassistant.const import Platform
     from homeassistant.loader import Integration
 
     from custom_components.askoheat.const import (
         BinarySensorAttrKey,
-        DeviceKey,
         NumberAttrKey,
         SelectAttrKey,
         SwitchAttrKey,
@@ -25,12 +29,15 @@ if TYPE_CHECKING:
     )
     from custom_components.askoheat.coordinator import (
         AskoheatConfigDataUpdateCoordinator,
+        AskoheatDataUpdateCoordinator,
         AskoheatEMADataUpdateCoordinator,
         AskoheatOperationDataUpdateCoordinator,
         AskoheatParameterDataUpdateCoordinator,
     )
 
     from .api import AskoheatModbusApiClient
+    from .api_desc import RegisterBlockLayout
+    from .long_term_statistics import AskoheatLongTermStatistics
 
 
 type AskoheatConfigEntry = ConfigEntry[AskoheatData]
@@ -47,12 +54,63 @@ class AskoheatData:
     data_coordinator: AskoheatOperationDataUpdateCoordinator
     integration: Integration
     supported_devices: list[DeviceKey]
+    # platforms set up for this entry, only those with enabled entities
+    platforms: list[Platform] = field(default_factory=list)
+    # device registry infos shared by all entities of a device unit
+    device_registry_infos: dict[DeviceKey | None, DeviceInfo] = field(
+        default_factory=dict
+    )
+    # hourly statistics of the operating data, only imported with the recorder
+    long_term_statistics: AskoheatLongTermStatistics | None = None
 
     @property
     def device_info(self) -> AskoheatDeviceInfos:
         """Resolve and return askoheat device infos."""
         return AskoheatDeviceInfos(self.par_coordinator.data)
 
+    def coordinator(self, block_key: BlockKey) -> AskoheatDataUpdateCoordinator:
+        """Return coordinator of a register block."""
+        match block_key:
+            case BlockKey.PAR:
+                return self.par_coordinator
+            case BlockKey.EMA:
+                return self.ema_coordinator
+            case BlockKey.CONF:
+                return self.config_coordinator
+            case BlockKey.DATA:
+                return self.data_coordinator
+
+    def device_registry_info(
+        self, entry: AskoheatConfigEntry, device_key: DeviceKey | None
+    ) -> DeviceInfo:
+        """Return device registry info of a device unit, built once per unit."""
+        device_info = self.device_registry_infos.get(device_key)
+        if device_info is not None:
+            return device_info
+
+        device_infos = self.device_info
+        via_device: tuple[str, str] | None = None
+        # Only set via_device for child units; the water heater control unit itself
+        # must not point to itself as a parent.
+        if device_key != DeviceKey.WATER_HEATER_CONTROL_UNIT:
+            parent_identifier = (
+                f"{DeviceKey.WATER_HEATER_CONTROL_UNIT}.{entry.entry_id}"
+            )
+            via_device = (entry.domain, parent_identifier)
+
+        device_info = self.device_registry_infos[device_key] = DeviceInfo(
+            identifiers={(entry.domain, f"{device_key}.{entry.entry_id}")},
+            translation_key=device_key,
+            manufacturer="Askoma AG",
+            model=device_infos.article_name,
+            model_id=device_infos.article_number,
+            sw_version=device_infos.software_version,
+            hw_version=device_infos.hardwareware_version,
+            serial_number=device_infos.serial_number,
+            via_device=via_device,
+        )
+        return device_info
+
 
 @dataclass
 class AskoheatDataBlock:
@@ -67,11 +125,89 @@ class AskoheatDataBlock:
     time_inputs: dict[TimeAttrKey, time] | None = None
 
 
+# marks a slot without value
+_MISSING: Any = object()
+
+
+class AskoheatBlockState(Mapping[str, Any]):
+    """Values of a register block, held in the fixed slots of the block layout."""
+
+    __slots__ = ("_layout", "_values")
+
+    def __init__(self, layout: RegisterBlockLayout, values: list[Any]) -> None:
+        """Initialize."""
+        self._layout = layout
+        self._values = values
+
+    @classmethod
+    def from_data_block(
+        cls, layout: RegisterBlockLayout, data: AskoheatDataBlock
+    ) -> AskoheatBlockState:
+        """Create state from the values of a data block."""
+        values = [_MISSING] * len(layout.keys)
+        for attribute, _ in BLOCK_PLATFORM_ATTRIBUTES:
+            block_values = getattr(data, attribute)
+            if not block_values:
+                continue
+            slots = layout.slots[attribute]
+            for key, value in block_values.items():
+                index = slots.get(key)
+                if index is not None:
+                    values[index] = value
+        return cls(layout, values)
+
+    def updated(
+        self, data: AskoheatDataBlock, data_keys: Iterable[str]
+    ) -> AskoheatBlockState:
+        """Return copy with the values of the data keys replaced by the data block."""
+        fresh = AskoheatBlockState.from_data_block(self._layout, data)
+        values = self._values.copy()
+        for key in data_keys:
+            index = self._layout.index(key)
+            if index is not None:
+                values[index] = (
+                    fresh.value_at(index) if fresh.has_value_at(index) else _MISSING
+                )
+        return AskoheatBlockState(self._layout, values)
+
+    def has_value_at(self, index: int) -> bool:
+        """Return True if the slot holds a value."""
+        return self._values[index] is not _MISSING
+
+    def value_at(self, index: int) -> Any:
+        """Return value of a slot, None if the slot holds no value."""
+        value = self._values[index]
+        return None if value is _MISSING else value
+
+    def __getitem__(self, key: str) -> Any:
+        """Return value of a data key."""
+        index = self._layout.index(key)
+        if index is None or self._values[index] is _MISSING:
+            raise KeyError(key)
+        return self._values[index]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate data keys of all slots holding a value."""
+        return (
+            key
+            for key, value in zip(self._layout.keys, self._values, strict=True)
+            if value is not _MISSING
+        )
+
+    def __len__(self) -> int:
+        """Return number of slots holding a value."""
+        return sum(value is not _MISSING for value in self._values)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return values by data key."""
+        return dict(self.items())
+
+
 @dataclass
 class AskoheatDeviceInfos:
     """Data class describing the askoheat device."""
 
-    def __init__(self, data: dict[str, Any]) -> None:
+    def __init__(self, data: Mapping[str, Any]) -> None:
         """Initialize device infos."""
         self._data = data
 
@@ -0,0 +1,105 @@
+"""Device triggers of the status register bits of askoheat."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
+from homeassistant.components.homeassistant.triggers import event as event_trigger
+from homeassistant.const import (
+    ATTR_DEVICE_ID,
+    CONF_DEVICE_ID,
+    CONF_DOMAIN,
+    CONF_PLATFORM,
+    CONF_TYPE,
+)
+from homeassistant.helpers import device_registry as dr
+
+from .const import DOMAIN, EVENT_STATUS_BIT_CHANGED, STATUS_REGISTERS
+from .status_events import ATTR_KEY, ATTR_NEW, status_bit_descriptions
+
+if TYPE_CHECKING:
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+    from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+    from homeassistant.helpers.typing import ConfigType
+
+    from .model import AskoheatBinarySensorEntityDescription
+
+CONF_SUBTYPE = "subtype"
+
+TRIGGER_TYPE_TURNED_ON = "turned_on"
+TRIGGER_TYPE_TURNED_OFF = "turned_off"
+TRIGGER_TYPES = (TRIGGER_TYPE_TURNED_ON, TRIGGER_TYPE_TURNED_OFF)
+
+TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
+    {
+        vol.Required(CONF_TYPE): vol.In(TRIGGER_TYPES),
+        vol.Required(CONF_SUBTYPE): str,
+    }
+)
+
+
+def _status_bit_descriptions() -> dict[str, AskoheatBinarySensorEntityDescription]:
+    """Return binary sensors decoded from all status registers by key."""
+    return {
+        description.key: description
+        for block_key in STATUS_REGISTERS
+        for description in status_bit_descriptions(block_key).values()
+    }
+
+
+async def async_get_triggers(
+    hass: HomeAssistant, device_id: str
+) -> list[dict[str, Any]]:
+    """Return triggers of the status bits of a device unit."""
+    device = dr.async_get(hass).async_get(device_id)
+    if device is None:
+        return []
+    device_keys = {
+        identifier.split(".")[0]
+        for domain, identifier in device.identifiers
+        if domain == DOMAIN
+    }
+    descriptions = await hass.async_add_import_executor_job(_status_bit_descriptions)
+    return [
+        {
+            CONF_PLATFORM: "device",
+            CONF_DOMAIN: DOMAIN,
+            CONF_DEVICE_ID: device_id,
+            CONF_TYPE: trigger_type,
+            CONF_SUBTYPE: key,
+        }
+        for key, description in descriptions.items()
+        if description.device_key in device_keys
+        for trigger_type in TRIGGER_TYPES
+    ]
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Attach trigger to the status bit events of a device unit."""
+    descriptions = await hass.async_add_import_executor_job(_status_bit_descriptions)
+    description = descriptions.get(config[CONF_SUBTYPE])
+    # raw bit value of the binary sensor turning on or off
+    new = (config[CONF_TYPE] == TRIGGER_TYPE_TURNED_ON) != (
+        description is not None and description.inverted
+    )
+    event_config = event_trigger.TRIGGER_SCHEMA(
+        {
+            event_trigger.CONF_PLATFORM: "event",
+            event_trigger.CONF_EVENT_TYPE: EVENT_STATUS_BIT_CHANGED,
+            event_trigger.CONF_EVENT_DATA: {
+                ATTR_DEVICE_ID: config[CONF_DEVICE_ID],
+                ATTR_KEY: config[CONF_SUBTYPE],
+                ATTR_NEW: new,
+            },
+        }
+    )
+    return await event_trigger.async_attach_trigger(
+        hass, event_config, action, trigger_info, platform_type="device"
+    )
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
-    from .data import AskoheatConfigEntry
+    from .data import AskoheatBlockState, AskoheatConfigEntry
 
 
 async def async_get_config_entry_diagnostics(
@@ -18,9 +18,32 @@ async def async_get_config_entry_diagnostics(
     return {
         "entry_data": dict(entry.data),
         "data": {
-            "energy_manager": entry.runtime_data.ema_coordinator.data,
-            "config": entry.runtime_data.config_coordinator.data,
-            "operation": entry.runtime_data.data_coordinator.data,
-            "parameter": entry.runtime_data.par_coordinator.data,
+            "energy_manager": _as_dict(entry.runtime_data.ema_coordinator.data),
+            "config": _as_dict(entry.runtime_data.config_coordinator.data),
+            "operation": _as_dict(entry.runtime_data.data_coordinator.data),
+            "parameter": _as_dict(entry.runtime_data.par_coordinator.data),
         },
+        "decode_errors": entry.runtime_data.client.decode_errors,
+        "register_map_variant": _variant_name(entry),
+        "register_history": _register_history(entry),
+        "rate_limits": entry.runtime_data.client.rate_limits,
+    }
+
+
+def _as_dict(data: AskoheatBlockState | None) -> dict[str, Any] | None:
+    """Return values of a block by data key."""
+    return None if data is None else data.as_dict()
+
+
+def _variant_name(entry: AskoheatConfigEntry) -> str | None:
+    """Return name of the register map variant in use, None for the full map."""
+    variant = entry.runtime_data.client.register_map_variant
+    return None if variant is None else variant.name
+
+
+def _register_history(entry: AskoheatConfigEntry) -> dict[str, Any]:
+    """Return size and time range of the register history files by block."""
+    return {
+        block_key: history.info()
+        for block_key, history in entry.runtime_data.client.register_histories.items()
     }
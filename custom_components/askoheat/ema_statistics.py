@@ -0,0 +1,283 @@
+"""Ring buffer of raw energymanager samples with windowed statistics."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import isnan
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from homeassistant.components.sensor.const import SensorDeviceClass, SensorStateClass
+from homeassistant.const import (
+    PERCENTAGE,
+    UnitOfElectricPotential,
+    UnitOfPower,
+    UnitOfTemperature,
+)
+
+from custom_components.askoheat.const import (
+    BinarySensorAttrKey,
+    DeviceKey,
+    NumberAttrKey,
+    SensorAttrKey,
+)
+from custom_components.askoheat.model import AskoheatSensorEntityDescription
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    import numpy as np
+    import numpy.typing as npt
+
+SECONDS_PER_HOUR = 3600
+
+
+@dataclass(frozen=True)
+class AskoheatEmaStatisticsSensorEntityDescription(AskoheatSensorEntityDescription):
+    """Class describing a sensor of windowed statistics of an energymanager value."""
+
+    # data key of the sampled energymanager value
+    source_key: str = ""
+
+
+EMA_STATISTICS_SENSOR_DESCRIPTIONS: tuple[
+    AskoheatEmaStatisticsSensorEntityDescription, ...
+] = (
+    *(
+        AskoheatEmaStatisticsSensorEntityDescription(
+            key=key,
+            device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
+            icon="mdi:power-plug",
+            native_unit_of_measurement=PERCENTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+            # mean of the flag is the share of time the heater was active
+            factor=100,
+            native_precision=0,
+            entity_registry_enabled_default=False,
+            source_key=f"binary_sensor.{source}",
+        )
+        for key, source in (
+            (
+                SensorAttrKey.STATISTICS_HEATER1_ACTIVE,
+                BinarySensorAttrKey.HEATER1_ACTIVE,
+            ),
+            (
+                SensorAttrKey.STATISTICS_HEATER2_ACTIVE,
+                BinarySensorAttrKey.HEATER2_ACTIVE,
+            ),
+            (
+                SensorAttrKey.STATISTICS_HEATER3_ACTIVE,
+                BinarySensorAttrKey.HEATER3_ACTIVE,
+            ),
+        )
+    ),
+    AskoheatEmaStatisticsSensorEntityDescription(
+        key=SensorAttrKey.STATISTICS_LOAD_FEEDIN_VALUE,
+        device_key=DeviceKey.ENERGY_MANAGER,
+        icon="mdi:solar-power",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_precision=0,
+        entity_registry_enabled_default=False,
+        source_key=f"number.{NumberAttrKey.LOAD_FEEDIN_VALUE}",
+    ),
+    AskoheatEmaStatisticsSensorEntityDescription(
+        key=SensorAttrKey.STATISTICS_ANALOG_INPUT_VALUE,
+        device_key=DeviceKey.ANALOG_INPUT_CONTROL_UNIT,
+        icon="mdi:gauge",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_precision=2,
+        entity_registry_enabled_default=False,
+        source_key=f"sensor.{SensorAttrKey.ANALOG_INPUT_VALUE}",
+    ),
+    *(
+        AskoheatEmaStatisticsSensorEntityDescription(
+            key=key,
+            device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
+            icon="mdi:thermometer",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            device_class=SensorDeviceClass.TEMPERATURE,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_precision=1,
+            entity_registry_enabled_default=False,
+            source_key=f"sensor.{source}",
+        )
+        for key, source in (
+            (
+                SensorAttrKey.STATISTICS_INTERNAL_TEMPERATUR_SENSOR_VALUE,
+                SensorAttrKey.INTERNAL_TEMPERATUR_SENSOR_VALUE,
+            ),
+            (
+                SensorAttrKey.STATISTICS_EXTERNAL_TEMPERATUR_SENSOR1_VALUE,
+                SensorAttrKey.EXTERNAL_TEMPERATUR_SENSOR1_VALUE,
+            ),
+            (
+                SensorAttrKey.STATISTICS_EXTERNAL_TEMPERATUR_SENSOR2_VALUE,
+                SensorAttrKey.EXTERNAL_TEMPERATUR_SENSOR2_VALUE,
+            ),
+            (
+                SensorAttrKey.STATISTICS_EXTERNAL_TEMPERATUR_SENSOR3_VALUE,
+                SensorAttrKey.EXTERNAL_TEMPERATUR_SENSOR3_VALUE,
+            ),
+            (
+                SensorAttrKey.STATISTICS_EXTERNAL_TEMPERATUR_SENSOR4_VALUE,
+                SensorAttrKey.EXTERNAL_TEMPERATUR_SENSOR4_VALUE,
+            ),
+        )
+    ),
+)
+
+# data keys of the sampled energymanager values, one column of the buffer each
+EMA_SAMPLE_KEYS: tuple[str, ...] = tuple(
+    description.source_key for description in EMA_STATISTICS_SENSOR_DESCRIPTIONS
+)
+
+
+class WindowStatistics(NamedTuple):
+    """Statistics of a sampled value over a window, None without samples."""
+
+    minimum: float | None
+    maximum: float | None
+    mean: float | None
+    # change per hour between the first and the last sample of the window
+    rate: float | None
+    samples: int
+
+
+def _optional(value: float) -> float | None:
+    return None if isnan(value) else float(value)
+
+
+class EmaSampleBuffer:
+    """
+    Fixed-size ring buffer of raw energymanager samples.
+
+    Every sample is stored twice, capacity rows apart, so the samples of any window
+    are a contiguous view of the buffer. Statistics reduce that view into arrays
+    allocated once, missing values are kept as NaN and skipped.
+    """
+
+    def __init__(self, capacity: int, keys: tuple[str, ...] = EMA_SAMPLE_KEYS) -> None:
+        """Initialize, numpy is imported on first use."""
+        import numpy as np
+
+        self._np = np
+        self._capacity = capacity
+        self._keys = keys
+        self._timestamps: npt.NDArray[np.float64] = np.full(2 * capacity, np.nan)
+        self._values: npt.NDArray[np.float64] = np.full(
+            (2 * capacity, len(keys)), np.nan
+        )
+        # position the next sample is written to, within [0, capacity)
+        self._next = 0
+        self._count = 0
+        # statistics of the latest samples by window, dropped on append
+        self._cache: dict[float, dict[str, WindowStatistics]] = {}
+        # scratch space of the reductions
+        self._scratch = np.empty_like(self._values)
+        self._missing = np.empty(self._values.shape, dtype=bool)
+        self._minimum = np.empty(len(keys))
+        self._maximum = np.empty(len(keys))
+        self._sum = np.empty(len(keys))
+        self._samples = np.empty(len(keys), dtype=np.intp)
+        self._first = np.empty(len(keys), dtype=np.intp)
+        self._last = np.empty(len(keys), dtype=np.intp)
+
+    @property
+    def capacity(self) -> int:
+        """Return max number of samples held."""
+        return self._capacity
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        """Return data keys of the sampled values."""
+        return self._keys
+
+    def __len__(self) -> int:
+        """Return number of samples held."""
+        return self._count
+
+    def append(self, timestamp: float, state: Mapping[str, Any]) -> None:
+        """Append sample of the values of a state, overwriting the oldest sample."""
+        row = self._values[self._next]
+        for column, key in enumerate(self._keys):
+            value = state.get(key)
+            row[column] = self._np.nan if value is None else float(value)
+        self._values[self._next + self._capacity] = row
+        self._timestamps[self._next] = timestamp
+        self._timestamps[self._next + self._capacity] = timestamp
+        self._next = (self._next + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+        self._cache.clear()
+
+    def statistics(
+        self, window: float, now: float | None = None
+    ) -> dict[str, WindowStatistics]:
+        """
+        Return statistics of the samples of the last window seconds by data key.
+
+        The window ends at the latest sample unless now is given.
+        """
+        if now is None:
+            statistics = self._cache.get(window)
+            if statistics is None:
+                statistics = self._cache[window] = self._statistics(window, None)
+            return statistics
+        return self._statistics(window, now)
+
+    def _statistics(
+        self, window: float, now: float | None
+    ) -> dict[str, WindowStatistics]:
+        np = self._np
+        end = self._next + self._capacity
+        timestamps = self._timestamps[end - self._count : end]
+        if now is None:
+            now = timestamps[-1] if self._count else 0.0
+        start = end - self._count + int(np.searchsorted(timestamps, now - window))
+        length = end - start
+        if length == 0:
+            return {
+                key: WindowStatistics(None, None, None, None, 0) for key in self._keys
+            }
+
+        values = self._values[start:end]
+        timestamps = self._timestamps[start:end]
+        missing = self._missing[:length]
+        scratch = self._scratch[:length]
+        np.isnan(values, out=missing)
+        np.fmin.reduce(values, axis=0, out=self._minimum)
+        np.fmax.reduce(values, axis=0, out=self._maximum)
+        np.copyto(scratch, values)
+        np.copyto(scratch, 0.0, where=missing)
+        np.add.reduce(scratch, axis=0, out=self._sum)
+        np.argmin(missing, axis=0, out=self._first)
+        np.argmin(missing[::-1], axis=0, out=self._last)
+        np.logical_not(missing, out=missing)
+        np.add.reduce(missing, axis=0, dtype=np.intp, out=self._samples)
+
+        result: dict[str, WindowStatistics] = {}
+        for column, key in enumerate(self._keys):
+            samples = int(self._samples[column])
+            if samples == 0:
+                result[key] = WindowStatistics(None, None, None, None, 0)
+                continue
+            first = int(self._first[column])
+            last = length - 1 - int(self._last[column])
+            elapsed = timestamps[last] - timestamps[first]
+            rate = (
+                (values[last, column] - values[first, column])
+                / elapsed
+                * SECONDS_PER_HOUR
+                if elapsed > 0
+                else None
+            )
+            result[key] = WindowStatistics(
+                minimum=_optional(self._minimum[column]),
+                maximum=_optional(self._maximum[column]),
+                mean=float(self._sum[column]) / samples,
+                rate=None if rate is None else float(rate),
+                samples=samples,
+            )
+        return result
@@ -2,21 +2,49 @@
 
 from __future__ import annotations
 
+import struct
+from math import isclose
+from numbers import Real
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.const import ATTR_ENTITY_ID
 from homeassistant.core import callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity, UpdateFailed
 
 from custom_components.askoheat.model import AskoheatEntityDescription
 
-from .const import ATTRIBUTION, AttributeKeys, DeviceKey
+from .const import (
+    ATTRIBUTION,
+    CONF_OPTIMISTIC_WRITES,
+    DEFAULT_OPTIMISTIC_WRITES,
+    EVENT_WRITE_FAILED,
+    LOGGER,
+    AttributeKeys,
+)
 from .coordinator import AskoheatDataUpdateCoordinator
 
 if TYPE_CHECKING:
+    from .api_desc import RegisterInputDescriptor
     from .data import AskoheatConfigEntry
 
+# keys of the event data of failed writes
+ATTR_KEY = "key"
+ATTR_VALUE = "value"
+
+_UNSET = object()
+
+
+def _is_read_back(written: object, read: object) -> bool:
+    """Return True if the value read back is the written raw value as stored."""
+    if isinstance(written, Real) and isinstance(read, Real):
+        if isinstance(read, int):
+            # integer registers store the written value truncated
+            return int(written) == read
+        # float registers store the written value in single precision
+        return isclose(float(written), float(read), rel_tol=1e-6)
+    return written == read
+
 
 class AskoheatBaseEntity[D: AskoheatEntityDescription[Any, Any]](Entity):
     """Base entity."""
@@ -28,24 +56,8 @@ class AskoheatBaseEntity[D: AskoheatEntityDescription[Any, Any]](Entity):
         """Initialize."""
         self._device_unique_id = entry.unique_id or "unknown"
         self.entry = entry
-        parent_identifier = f"{DeviceKey.WATER_HEATER_CONTROL_UNIT}.{entry.entry_id}"
-        device_identifier = f"{entity_description.device_key}.{entry.entry_id}"
-        via_device: tuple[str, str] | None = None
-        # Only set via_device for child units; the water heater control unit itself
-        # must not point to itself as a parent.
-        if entity_description.device_key != DeviceKey.WATER_HEATER_CONTROL_UNIT:
-            via_device = (entry.domain, parent_identifier)
-
-        self._attr_device_info = DeviceInfo(
-            identifiers={(entry.domain, device_identifier)},
-            translation_key=entity_description.device_key,
-            manufacturer="Askoma AG",
-            model=entry.runtime_data.device_info.article_name,
-            model_id=entry.runtime_data.device_info.article_number,
-            sw_version=entry.runtime_data.device_info.software_version,
-            hw_version=entry.runtime_data.device_info.hardwareware_version,
-            serial_number=entry.runtime_data.device_info.serial_number,
-            via_device=via_device,
+        self._attr_device_info = entry.runtime_data.device_registry_info(
+            entry, entity_description.device_key
         )
         self.entity_description = entity_description
         self.translation_key = (
@@ -60,7 +72,9 @@ class AskoheatEntity[D: AskoheatEntityDescription[Any, Any]](
 
     _attr_attribution = ATTRIBUTION
 
-    _unrecorded_attributes = frozenset({AttributeKeys.API_DESCRIPTOR})
+    _unrecorded_attributes = frozenset(
+        {AttributeKeys.API_DESCRIPTOR, AttributeKeys.DATA_AGE}
+    )
 
     def __init__(
         self,
@@ -69,7 +83,8 @@ class AskoheatEntity[D: AskoheatEntityDescription[Any, Any]](
         entity_description: D,
     ) -> None:
         """Initialize."""
-        super().__init__(coordinator=coordinator)
+        # the data key as context lets targeted refreshes update only this entity
+        super().__init__(coordinator=coordinator, context=entity_description.data_key)
         AskoheatBaseEntity.__init__(
             self=self, entry=entry, entity_description=entity_description
         )
@@ -77,6 +92,11 @@ class AskoheatEntity[D: AskoheatEntityDescription[Any, Any]](
         self._attr_extra_state_attributes = {
             AttributeKeys.API_DESCRIPTOR: f"{entity_description.api_descriptor}"
         }
+        # slot of the value within the state of the coordinator
+        self._data_index = coordinator.layout.index(entity_description.data_key)
+        # value shown while optimistic writes are being confirmed
+        self._optimistic_value: Any = _UNSET
+        self._unconfirmed_writes = 0
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -89,8 +109,80 @@ class AskoheatEntity[D: AskoheatEntityDescription[Any, Any]](
 
     @property
     def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.entry.runtime_data.client.is_ready
+        """Return True if entity is available, also while serving stale data."""
+        return self.entry.runtime_data.client.is_available
+
+    def _has_value(self) -> bool:
+        """Return True if the coordinator holds a value of this entity."""
+        if self._optimistic_value is not _UNSET:
+            return True
+        data = self.coordinator.data
+        return (
+            data is not None
+            and self._data_index is not None
+            and data.has_value_at(self._data_index)
+        )
+
+    def _value(self) -> Any:
+        """Return value of this entity held by the coordinator, None if missing."""
+        if self._optimistic_value is not _UNSET:
+            return self._optimistic_value
+        data = self.coordinator.data
+        if data is None or self._data_index is None:
+            return None
+        return data.value_at(self._data_index)
+
+    async def _async_write(
+        self, api_descriptor: RegisterInputDescriptor, value: object
+    ) -> None:
+        """
+        Write a raw value of this entity to the device.
+
+        With optimistic writes, the value is shown at once while it is written and
+        re-read in the background. If that fails or another value is read back, the
+        entity reverts to the value read and an event is fired.
+        """
+        if not self.entry.data.get(CONF_OPTIMISTIC_WRITES, DEFAULT_OPTIMISTIC_WRITES):
+            await self.coordinator.async_write(api_descriptor, value)
+            self._handle_coordinator_update()
+            return
+
+        self._optimistic_value = value
+        self._unconfirmed_writes += 1
+        self._handle_coordinator_update()
+        self.entry.async_create_task(
+            self.hass,
+            self._async_confirm_write(api_descriptor, value),
+            f"askoheat write {self.entity_id}",
+        )
+
+    async def _async_confirm_write(
+        self, api_descriptor: RegisterInputDescriptor, value: object
+    ) -> None:
+        """Write an optimistic value, then show the value read back."""
+        confirmed = False
+        try:
+            confirmed = await self.coordinator.async_write(api_descriptor, value)
+        except (UpdateFailed, ValueError, struct.error):
+            LOGGER.exception("Could not write %s of %s", value, self.entity_id)
+        finally:
+            self._unconfirmed_writes -= 1
+            if self._unconfirmed_writes == 0:
+                # a later write keeps its value shown until confirmed itself
+                self._optimistic_value = _UNSET
+        if confirmed and self._unconfirmed_writes == 0:
+            # the device may ignore or clamp a value without failing the write
+            confirmed = _is_read_back(value, self._value())
+        if not confirmed:
+            self.hass.bus.async_fire(
+                EVENT_WRITE_FAILED,
+                {
+                    ATTR_ENTITY_ID: self.entity_id,
+                    ATTR_KEY: self.entity_description.key,
+                    ATTR_VALUE: value,
+                },
+            )
+        self._handle_coordinator_update()
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -106,4 +198,8 @@ class AskoheatEntity[D: AskoheatEntityDescription[Any, Any]](
         else:
             self._attr_icon = descr.icon
 
+        self._attr_extra_state_attributes[AttributeKeys.DATA_AGE] = (
+            self.coordinator.data_age
+        )
+
         super()._handle_coordinator_update()
@@ -0,0 +1,47 @@
+"""Index of the entity descriptions of all askoheat register blocks."""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from custom_components.askoheat.api_desc import (
+    BLOCK_PLATFORM_ATTRIBUTES,
+    load_register_blocks,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from custom_components.askoheat.const import BlockKey, DeviceKey
+    from custom_components.askoheat.model import AskoheatEntityDescription
+
+type EntityIndexEntry = tuple[AskoheatEntityDescription[Any, Any], BlockKey]
+
+
+@cache
+def entity_index() -> dict[tuple[str, DeviceKey | None], tuple[EntityIndexEntry, ...]]:
+    """
+    Return entity descriptions with their register block by platform and device unit.
+
+    Built on first use, which imports all descriptor modules.
+    """
+    index: dict[tuple[str, DeviceKey | None], list[EntityIndexEntry]] = {}
+    for block_key, block in load_register_blocks().items():
+        for attribute, platform in BLOCK_PLATFORM_ATTRIBUTES:
+            for description in getattr(block, attribute):
+                index.setdefault((platform, description.device_key), []).append(
+                    (description, block_key)
+                )
+    return {key: tuple(entries) for key, entries in index.items()}
+
+
+def entity_descriptions(
+    platform: str, device_keys: Iterable[DeviceKey]
+) -> list[EntityIndexEntry]:
+    """Return entity descriptions of a platform for the given device units."""
+    index = entity_index()
+    result: list[EntityIndexEntry] = list(index.get((platform, None), ()))
+    for device_key in dict.fromkeys(device_keys):
+        result.extend(index.get((platform, device_key), ()))
+    return result
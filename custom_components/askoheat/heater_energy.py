@@ -0,0 +1,120 @@
+"""Energy of the heater stages integrated from the polled heater states."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.sensor.const import SensorDeviceClass, SensorStateClass
+from homeassistant.const import UnitOfEnergy
+
+from custom_components.askoheat.const import (
+    BinarySensorAttrKey,
+    DeviceKey,
+    SensorAttrKey,
+)
+from custom_components.askoheat.model import AskoheatSensorEntityDescription
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+SECONDS_PER_HOUR = 3600
+WATT_HOURS_PER_KILOWATT_HOUR = 1000
+
+
+@dataclass(frozen=True)
+class AskoheatHeaterEnergySensorEntityDescription(AskoheatSensorEntityDescription):
+    """Class describing a sensor of the energy converted by a heater stage."""
+
+    # data key of the energymanager flag of the active heater
+    active_key: str = ""
+    # data key of the rated power of the heater in the parameter block
+    power_key: str = ""
+
+
+HEATER_ENERGY_SENSOR_DESCRIPTIONS: tuple[
+    AskoheatHeaterEnergySensorEntityDescription, ...
+] = tuple(
+    AskoheatHeaterEnergySensorEntityDescription(
+        key=key,
+        device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
+        icon="mdi:lightning-bolt",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_precision=3,
+        # a state per 10 Wh instead of one per poll while the heater is active
+        significant_change=0.01,
+        active_key=f"binary_sensor.{active}",
+        power_key=f"sensor.{power}",
+    )
+    for key, active, power in (
+        (
+            SensorAttrKey.HEATER1_ENERGY,
+            BinarySensorAttrKey.HEATER1_ACTIVE,
+            SensorAttrKey.PAR_HEATER1_POWER,
+        ),
+        (
+            SensorAttrKey.HEATER2_ENERGY,
+            BinarySensorAttrKey.HEATER2_ACTIVE,
+            SensorAttrKey.PAR_HEATER2_POWER,
+        ),
+        (
+            SensorAttrKey.HEATER3_ENERGY,
+            BinarySensorAttrKey.HEATER3_ACTIVE,
+            SensorAttrKey.PAR_HEATER3_POWER,
+        ),
+    )
+)
+
+
+class HeaterEnergy:
+    """
+    Energy converted by the heater stages since set up, integrated at poll resolution.
+
+    A heater active at a poll adds its rated power over the interval to the next
+    poll. Intervals longer than the max interval, e.g. of failed polls, are skipped
+    rather than guessed.
+    """
+
+    def __init__(
+        self,
+        parameters: Mapping[str, Any],
+        max_interval: float,
+        descriptions: tuple[AskoheatHeaterEnergySensorEntityDescription, ...] = (
+            HEATER_ENERGY_SENSOR_DESCRIPTIONS
+        ),
+    ) -> None:
+        """Initialize with the rated powers of the parameter block."""
+        # heaters without a rated power are not integrated
+        self._heaters: list[tuple[str, str, float]] = [
+            (description.key, description.active_key, float(power))
+            for description in descriptions
+            if isinstance(power := parameters.get(description.power_key), int | float)
+        ]
+        self._max_interval = max_interval
+        # energy in Wh by description key
+        self._energy = dict.fromkeys((key for key, _, _ in self._heaters), 0.0)
+        self._timestamp: float | None = None
+        self._active: tuple[bool, ...] = ()
+
+    def energy(self, key: str) -> float | None:
+        """Return energy of a heater in kWh, None if its power is unknown."""
+        energy = self._energy.get(key)
+        return None if energy is None else energy / WATT_HOURS_PER_KILOWATT_HOUR
+
+    def add(self, timestamp: float, state: Mapping[str, Any]) -> None:
+        """Add heater states polled at the monotonic timestamp."""
+        if self._timestamp is not None:
+            interval = timestamp - self._timestamp
+            if 0 < interval <= self._max_interval:
+                hours = interval / SECONDS_PER_HOUR
+                for (key, _, power), active in zip(
+                    self._heaters, self._active, strict=True
+                ):
+                    if active:
+                        self._energy[key] += power * hours
+        self._timestamp = timestamp
+        self._active = tuple(
+            state.get(active_key) is True for _, active_key, _ in self._heaters
+        )
@@ -0,0 +1,290 @@
+"""Hourly long-term statistics of the operating data, imported into the recorder."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from custom_components.askoheat.api_desc import register_block
+from custom_components.askoheat.const import DOMAIN, LOGGER, BlockKey, LongTermStatistic
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.askoheat.coordinator import (
+        AskoheatOperationDataUpdateCoordinator,
+    )
+    from custom_components.askoheat.data import AskoheatConfigEntry
+    from custom_components.askoheat.model import AskoheatSensorEntityDescription
+
+HOUR = timedelta(hours=1)
+
+
+def long_term_statistics_descriptions() -> tuple[AskoheatSensorEntityDescription, ...]:
+    """Return descriptions of the operating data with long-term statistics."""
+    return tuple(
+        description
+        for description in register_block(BlockKey.DATA).sensors
+        if description.long_term_statistic is not None
+    )
+
+
+def statistic_id(device_id: str, description: AskoheatSensorEntityDescription) -> str:
+    """Return id of the external statistic of a value of a device."""
+    return f"{DOMAIN}:{slugify(device_id)}_{description.key}"
+
+
+def _increase(previous: float, value: float) -> float:
+    """Return increase of a counter, a smaller value is counted from a reset."""
+    return value - previous if value >= previous else value
+
+
+@dataclass
+class _LastStatistic:
+    """Last hour of a counter imported."""
+
+    start: datetime
+    state: float
+    sum: float
+
+
+@dataclass
+class _Hour:
+    """Values of a statistic polled within the current hour."""
+
+    first_timestamp: datetime
+    first: float
+    last: float
+    minimum: float
+    maximum: float
+    total: float = 0.0
+    count: int = 0
+    # sum of the increases between the polled values of a counter
+    increase: float = 0.0
+
+    def add(self, value: float) -> None:
+        """Add polled value."""
+        self.increase += _increase(self.last, value)
+        self.last = value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        self.total += value
+        self.count += 1
+
+
+class HourlyStatistics:
+    """
+    Hourly statistics of polled values, computed once an hour has ended.
+
+    Counters get the state at the end and the running sum of the increases of every
+    hour, measurements the mean, min and max. Hours between the last imported hour
+    of a counter and the first value polled again are backfilled by interpolating
+    the counter linearly, measurements are left without statistics for those hours.
+    """
+
+    def __init__(self, descriptions: Iterable[AskoheatSensorEntityDescription]) -> None:
+        """Initialize."""
+        self._descriptions = {
+            description.data_key: description for description in descriptions
+        }
+        self._hour: datetime | None = None
+        self._values: dict[str, _Hour] = {}
+        self._last: dict[str, _LastStatistic] = {}
+
+    @property
+    def descriptions(self) -> Mapping[str, AskoheatSensorEntityDescription]:
+        """Return descriptions of the values by data key."""
+        return self._descriptions
+
+    def restore(
+        self, data_key: str, start: datetime, state: float, sum_: float
+    ) -> None:
+        """Continue a counter from its last imported hour."""
+        self._last[data_key] = _LastStatistic(start, state, sum_)
+
+    def add(
+        self, timestamp: datetime, state: Mapping[str, Any]
+    ) -> dict[str, list[StatisticData]]:
+        """Add polled values, return statistics of the hour ended before by data key."""
+        hour = timestamp.replace(minute=0, second=0, microsecond=0)
+        statistics = (
+            self.flush() if self._hour is not None and hour > self._hour else {}
+        )
+        self._hour = hour
+        for data_key in self._descriptions:
+            value = state.get(data_key)
+            if not isinstance(value, int | float):
+                continue
+            values = self._values.get(data_key)
+            if values is None:
+                values = self._values[data_key] = _Hour(
+                    timestamp, value, value, value, value
+                )
+            values.add(value)
+        return statistics
+
+    def flush(self) -> dict[str, list[StatisticData]]:
+        """Return statistics of the current hour by data key and start a new hour."""
+        statistics: dict[str, list[StatisticData]] = {}
+        if self._hour is not None:
+            for data_key, values in self._values.items():
+                rows = (
+                    self._sum_statistics(data_key, self._hour, values)
+                    if self._descriptions[data_key].long_term_statistic
+                    is LongTermStatistic.SUM
+                    else [
+                        StatisticData(
+                            start=self._hour,
+                            mean=values.total / values.count,
+                            min=values.minimum,
+                            max=values.maximum,
+                        )
+                    ]
+                )
+                if rows:
+                    statistics[data_key] = rows
+        self._values = {}
+        return statistics
+
+    def _sum_statistics(
+        self, data_key: str, hour: datetime, values: _Hour
+    ) -> list[StatisticData]:
+        last = self._last.get(data_key)
+        if last is None:
+            # first hour of the counter, the sum starts at its value
+            last = _LastStatistic(hour - HOUR, values.first, 0.0)
+        elif last.start >= hour:
+            # hour got imported before a restart
+            return []
+
+        rows: list[StatisticData] = []
+        state, sum_ = last.state, last.sum
+        gap_start = last.start + HOUR
+        if gap_start < hour and values.first >= last.state:
+            elapsed = (values.first_timestamp - gap_start).total_seconds()
+            start = gap_start
+            while start < hour:
+                interpolated = last.state + (values.first - last.state) * (
+                    (start + HOUR - gap_start).total_seconds() / elapsed
+                )
+                sum_ += interpolated - state
+                state = interpolated
+                rows.append(StatisticData(start=start, state=state, sum=sum_))
+                start += HOUR
+
+        sum_ += _increase(state, values.first) + values.increase
+        rows.append(StatisticData(start=hour, state=values.last, sum=sum_))
+        self._last[data_key] = _LastStatistic(hour, values.last, sum_)
+        return rows
+
+
+def _get_last_statistics(
+    hass: HomeAssistant, statistic_ids: Iterable[str]
+) -> dict[str, tuple[float, float, float]]:
+    """Return start, state and sum of the last hour of counters imported."""
+    result: dict[str, tuple[float, float, float]] = {}
+    for statistic_id_ in statistic_ids:
+        rows = get_last_statistics(
+            hass, 1, statistic_id_, convert_units=False, types={"state", "sum"}
+        ).get(statistic_id_)
+        if rows and rows[0].get("state") is not None:
+            row = rows[0]
+            result[statistic_id_] = (row["start"], row["state"], row["sum"] or 0.0)
+    return result
+
+
+class AskoheatLongTermStatistics:
+    """
+    Import hourly statistics of the operating data into the recorder.
+
+    Statistics are computed from the polled values and imported in bulk as external
+    statistics once an hour has ended, instead of compiling them from state rows.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: AskoheatConfigEntry,
+        coordinator: AskoheatOperationDataUpdateCoordinator,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._hourly = HourlyStatistics(long_term_statistics_descriptions())
+        device_id = entry.unique_id or entry.entry_id
+        self._metadata = {
+            data_key: StatisticMetaData(
+                has_mean=description.long_term_statistic is LongTermStatistic.MEAN,
+                has_sum=description.long_term_statistic is LongTermStatistic.SUM,
+                name=f"{entry.title} {description.key.replace('_', ' ')}",
+                source=DOMAIN,
+                statistic_id=statistic_id(device_id, description),
+                unit_of_measurement=description.native_unit_of_measurement,
+            )
+            for data_key, description in self._hourly.descriptions.items()
+        }
+        self._unsubscribe: Callable[[], None] | None = None
+
+    @property
+    def statistic_ids(self) -> list[str]:
+        """Return ids of the imported statistics."""
+        return [metadata["statistic_id"] for metadata in self._metadata.values()]
+
+    async def async_setup(self) -> None:
+        """Continue counters from the last imported hours and listen for updates."""
+        counters = {
+            metadata["statistic_id"]: data_key
+            for data_key, metadata in self._metadata.items()
+            if metadata["has_sum"]
+        }
+        last_statistics = await get_instance(self._hass).async_add_executor_job(
+            _get_last_statistics, self._hass, list(counters)
+        )
+        for statistic_id_, (start, state, sum_) in last_statistics.items():
+            self._hourly.restore(
+                counters[statistic_id_], dt_util.utc_from_timestamp(start), state, sum_
+            )
+        self._unsubscribe = self._coordinator.async_add_listener(
+            self._async_handle_update
+        )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """
+        Stop listening for updates.
+
+        The current hour is not imported, it would be skipped when polled again
+        after a restart. Counters continue from the last hour imported instead.
+        """
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    @callback
+    def _async_handle_update(self) -> None:
+        if not self._coordinator.last_update_success or self._coordinator.data is None:
+            return
+        self._async_import(self._hourly.add(dt_util.utcnow(), self._coordinator.data))
+
+    @callback
+    def _async_import(self, statistics: dict[str, list[StatisticData]]) -> None:
+        for data_key, rows in statistics.items():
+            LOGGER.debug(
+                "Import %s hourly statistics of %s",
+                len(rows),
+                self._metadata[data_key]["statistic_id"],
+            )
+            async_add_external_statistics(self._hass, self._metadata[data_key], rows)
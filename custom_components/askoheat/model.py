@@ -35,6 +35,7 @@ from custom_components.askoheat.const import (
     DOMAIN,
     BinarySensorAttrKey,
     DeviceKey,
+    LongTermStatistic,
     NumberAttrKey,
     SelectAttrKey,
     SensorAttrKey,
@@ -42,12 +43,23 @@ from custom_components.askoheat.const import (
     TextAttrKey,
     TimeAttrKey,
 )
+from custom_components.askoheat.transform import (
+    DurationValue,
+    duration_transform,
+    number_transform,
+    sensor_transform,
+)
 
 if TYPE_CHECKING:
-    from datetime import date, datetime
+    from collections.abc import Callable
+    from datetime import date, datetime, timedelta
     from decimal import Decimal
 
 
+def _is_number(value: Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
 @dataclass(frozen=True)
 class AskoheatEntityDescription[K: StrEnum, A: RegisterInputDescriptor](
     EntityDescription
@@ -141,16 +153,54 @@ class AskoheatSensorEntityDescription(
     native_max_value: float | None = None
     native_min_value: float | None = None
 
+    # min change against the last written state to write a new state, absolute or
+    # relative to the last written value, every update is written without
+    significant_change: float | None = None
+    significant_change_relative: float | None = None
+    # max interval to not write insignificant changes
+    max_silence: timedelta | None = None
+    # hourly statistics computed from the polled values and imported into the
+    # recorder as external statistics, leave the state class unset to not compile
+    # them from the states as well
+    long_term_statistic: LongTermStatistic | None = None
+
     @cached_property
     def data_key(self) -> str:
         """Get data key."""
         return f"sensor.{self.key}"
 
+    def is_significant_change(self, previous: Any, value: Any) -> bool:
+        """Return True if the change of the native value is worth writing."""
+        if self.significant_change is None and self.significant_change_relative is None:
+            return True
+        if not (_is_number(previous) and _is_number(value)):
+            return previous != value
+        change = abs(value - previous)
+        if self.significant_change is not None and change >= self.significant_change:
+            return True
+        return self.significant_change_relative is not None and (
+            change >= abs(previous) * self.significant_change_relative
+            if previous
+            else change > 0
+        )
+
+    @cached_property
+    def value_transform(self) -> Callable[[Any], Any]:
+        """Get transform of raw values into native values."""
+        return sensor_transform(self.factor, self.native_precision)
+
 
 @dataclass(frozen=True)
 class AskoheatDurationSensorEntityDescription(AskoheatSensorEntityDescription):
     """Class describing an askoheat specific duration sensor entity."""
 
+    @cached_property
+    def value_transform(self) -> Callable[[Any], DurationValue]:
+        """Get transform of raw values into durations."""
+        return duration_transform(
+            self.native_unit_of_measurement, self.factor, self.native_precision
+        )
+
 
 @dataclass(frozen=True)
 class AskoheatNumberEntityDescription(
@@ -178,6 +228,11 @@ class AskoheatNumberEntityDescription(
         """Get data key."""
         return f"number.{self.key}"
 
+    @cached_property
+    def value_transform(self) -> Callable[[Any], Any]:
+        """Get transform of raw values into native values."""
+        return number_transform(self.factor, self.native_precision)
+
 
 @dataclass(frozen=True)
 class AskoheatTimeEntityDescription(
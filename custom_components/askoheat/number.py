@@ -11,18 +11,18 @@ from homeassistant.components.number import (
     RestoreNumber,
 )
 from homeassistant.const import (
+    Platform,
     UnitOfPower,
 )
 from homeassistant.core import callback
 
-from custom_components.askoheat.api_conf_desc import CONF_REGISTER_BLOCK_DESCRIPTOR
-from custom_components.askoheat.api_ema_desc import EMA_REGISTER_BLOCK_DESCRIPTOR
 from custom_components.askoheat.const import LOGGER, DeviceKey, NumberAttrKey
 from custom_components.askoheat.model import (
     AskoheatNumberEntityDescription,
 )
 
 from .entity import AskoheatBaseEntity, AskoheatEntity
+from .entity_index import entity_descriptions
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -41,23 +41,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up the number platform."""
     async_add_entities(
-        AskoheatNumber(
-            entry=entry,
-            coordinator=coordinator,
-            entity_description=entity_description,
-        )
-        for entity_description, coordinator in {
-            **dict.fromkeys(
-                EMA_REGISTER_BLOCK_DESCRIPTOR.number_inputs,
-                entry.runtime_data.ema_coordinator,
-            ),
-            **dict.fromkeys(
-                CONF_REGISTER_BLOCK_DESCRIPTOR.number_inputs,
-                entry.runtime_data.config_coordinator,
-            ),
-        }.items()
-        if entity_description.device_key is None
-        or entity_description.device_key in entry.runtime_data.supported_devices
+        [
+            AskoheatNumber(
+                entry=entry,
+                coordinator=entry.runtime_data.coordinator(block_key),
+                entity_description=entity_description,
+            )
+            for entity_description, block_key in entity_descriptions(
+                Platform.NUMBER, entry.runtime_data.supported_devices
+            )
+        ]
     )
     async_add_entities(
         [
@@ -102,26 +95,15 @@ class AskoheatNumber(AskoheatEntity[AskoheatNumberEntityDescription], NumberEnti
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return (
-            super().available
-            and self.entity_description.data_key in self.coordinator.data
-        )
+        return super().available and self._has_value()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        data = self.coordinator.data
-        if data is None or data.get(self.entity_description.data_key) is None:
+        value = self._value()
+        if value is None:
             return
-        self._attr_native_value = data[self.entity_description.data_key]
-
-        if self._attr_native_value is not None:
-            if self.entity_description.factor is not None:
-                self._attr_native_value *= self.entity_description.factor
-            if self.entity_description.native_precision is not None:
-                self._attr_native_value = self._attr_native_value.__round__(
-                    self.entity_description.native_precision
-                )
+        self._attr_native_value = self.entity_description.value_transform(value)
         super()._handle_coordinator_update()
 
     async def async_set_native_value(self, value: float) -> None:
@@ -139,10 +121,7 @@ class AskoheatNumber(AskoheatEntity[AskoheatNumberEntityDescription], NumberEnti
                 round(value / self.entity_description.native_step)
                 * self.entity_description.native_step
             )
-        await self.coordinator.async_write(
-            self.entity_description.api_descriptor, value
-        )
-        self._handle_coordinator_update()
+        await self._async_write(self.entity_description.api_descriptor, value)
 
 
 class AskoheatAutoFeedInBufferNumber(
@@ -0,0 +1,199 @@
+"""Memory-mapped on-disk history of raw register snapshots."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from custom_components.askoheat.api_desc import register_block
+from custom_components.askoheat.const import (
+    LOGGER,
+    SCAN_INTERVAL_EMA,
+    SCAN_INTERVAL_OP_DATA,
+    BlockKey,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from pathlib import Path
+
+    import numpy as np
+    import numpy.typing as npt
+
+REGISTER_HISTORY_MAGIC = b"ASKH"
+REGISTER_HISTORY_VERSION = 1
+# bytes reserved for the header in front of the records
+REGISTER_HISTORY_HEADER_SIZE = 64
+# blocks of which snapshots are kept, with the interval the block is polled at
+REGISTER_HISTORY_BLOCKS = {
+    BlockKey.EMA: SCAN_INTERVAL_EMA,
+    BlockKey.DATA: SCAN_INTERVAL_OP_DATA,
+}
+
+
+class RegisterHistory:
+    """
+    Fixed-width records of timestamped raw register snapshots of a block in a file.
+
+    The file is allocated once and memory-mapped, appending overwrites the oldest
+    record once the capacity is reached. Slices by time range are views of the
+    mapped file, registers which could not be read are masked as invalid.
+    """
+
+    def __init__(self, path: Path, number_of_registers: int, capacity: int) -> None:
+        """Open or create history file, numpy is imported on first use."""
+        import numpy as np
+
+        self._np = np
+        self._path = path
+        self._capacity = capacity
+        self._header_dtype = np.dtype(
+            [
+                ("magic", "S4"),
+                ("version", "<u2"),
+                ("registers", "<u2"),
+                ("capacity", "<u4"),
+                # position the next record is written to, within [0, capacity)
+                ("next", "<u4"),
+                ("count", "<u4"),
+            ]
+        )
+        self._record_dtype = np.dtype(
+            [
+                ("timestamp", "<f8"),
+                ("valid", "?", (number_of_registers,)),
+                ("registers", "<u2", (number_of_registers,)),
+            ]
+        )
+        size = REGISTER_HISTORY_HEADER_SIZE + capacity * self._record_dtype.itemsize
+        if not self._compatible(path, size, number_of_registers):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = np.memmap(path, dtype=np.uint8, mode="w+", shape=(size,))
+            self._header = self._header_view()
+            self._header["magic"] = REGISTER_HISTORY_MAGIC
+            self._header["version"] = REGISTER_HISTORY_VERSION
+            self._header["registers"] = number_of_registers
+            self._header["capacity"] = capacity
+        else:
+            self._file = np.memmap(path, dtype=np.uint8, mode="r+", shape=(size,))
+            self._header = self._header_view()
+        self._records: npt.NDArray[np.void] = self._file[
+            REGISTER_HISTORY_HEADER_SIZE:
+        ].view(self._record_dtype)
+
+    def _header_view(self) -> np.void:
+        return self._file[: self._header_dtype.itemsize].view(self._header_dtype)[0]
+
+    def _compatible(self, path: Path, size: int, number_of_registers: int) -> bool:
+        """Return True if the existing file has the layout of this history."""
+        if not path.exists():
+            return False
+        if path.stat().st_size != size:
+            LOGGER.warning("Register history %s has another size, recreate it", path)
+            return False
+        header = self._np.fromfile(path, dtype=self._header_dtype, count=1)[0]
+        if (
+            header["magic"] != REGISTER_HISTORY_MAGIC
+            or header["version"] != REGISTER_HISTORY_VERSION
+            or header["registers"] != number_of_registers
+            or header["capacity"] != self._capacity
+        ):
+            LOGGER.warning("Register history %s has another layout, recreate it", path)
+            return False
+        return True
+
+    @property
+    def path(self) -> Path:
+        """Return path of the history file."""
+        return self._path
+
+    @property
+    def capacity(self) -> int:
+        """Return max number of records held."""
+        return self._capacity
+
+    def __len__(self) -> int:
+        """Return number of records held."""
+        return int(self._header["count"])
+
+    def append(self, timestamp: float, registers: Sequence[int | None]) -> None:
+        """Append snapshot of the registers of a block, overwriting the oldest one."""
+        position = int(self._header["next"])
+        record = self._records[position]
+        record["timestamp"] = timestamp
+        record["valid"] = [value is not None for value in registers]
+        record["registers"] = [0 if value is None else value for value in registers]
+        self._header["next"] = (position + 1) % self._capacity
+        self._header["count"] = min(len(self) + 1, self._capacity)
+
+    def slice(self, start: float, end: float) -> list[npt.NDArray[np.void]]:
+        """
+        Return records with timestamps within [start, end) as views, oldest first.
+
+        The records of a time range are split in two views if they roll over the end
+        of the file.
+        """
+        count = len(self)
+        position = int(self._header["next"])
+        if count < self._capacity:
+            parts = [self._records[:count]]
+        else:
+            parts = [self._records[position:], self._records[:position]]
+        result = []
+        for part in parts:
+            timestamps = part["timestamp"]
+            first, last = self._np.searchsorted(timestamps, (start, end))
+            if first < last:
+                result.append(part[first:last])
+        return result
+
+    def snapshots(
+        self, start: float, end: float
+    ) -> Iterator[tuple[float, list[int | None]]]:
+        """Iterate snapshots within [start, end) as timestamp and register values."""
+        for part in self.slice(start, end):
+            for record in part:
+                yield (
+                    float(record["timestamp"]),
+                    [
+                        int(value) if valid else None
+                        for value, valid in zip(
+                            record["registers"], record["valid"], strict=True
+                        )
+                    ],
+                )
+
+    def info(self) -> dict[str, Any]:
+        """Return size and time range of the history."""
+        parts = self.slice(float("-inf"), float("inf"))
+        return {
+            "path": str(self._path),
+            "records": len(self),
+            "capacity": self._capacity,
+            "first": float(parts[0]["timestamp"][0]) if parts else None,
+            "last": float(parts[-1]["timestamp"][-1]) if parts else None,
+        }
+
+    def flush(self) -> None:
+        """Flush records to the file."""
+        self._file.flush()
+
+
+def open_register_histories(
+    directory: Path, days: int
+) -> dict[BlockKey, RegisterHistory]:
+    """Open history files of the blocks of a device holding the days given."""
+    return {
+        block_key: RegisterHistory(
+            directory / f"{block_key}.history",
+            register_block(block_key).number_of_registers,
+            timedelta(days=days) // interval,
+        )
+        for block_key, interval in REGISTER_HISTORY_BLOCKS.items()
+    }
+
+
+def close_register_histories(histories: dict[BlockKey, RegisterHistory]) -> None:
+    """Flush history files to disk."""
+    for history in histories.values():
+        history.flush()
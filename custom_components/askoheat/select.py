@@ -3,12 +3,10 @@
 from functools import cached_property
 
 from homeassistant.components.select import ENTITY_ID_FORMAT, SelectEntity
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from custom_components.askoheat.api_conf_desc import CONF_REGISTER_BLOCK_DESCRIPTOR
-from custom_components.askoheat.api_ema_desc import EMA_REGISTER_BLOCK_DESCRIPTOR
-from custom_components.askoheat.api_par_desc import PARAM_REGISTER_BLOCK_DESCRIPTOR
 from custom_components.askoheat.const import LOGGER
 from custom_components.askoheat.coordinator import AskoheatDataUpdateCoordinator
 from custom_components.askoheat.model import (
@@ -17,6 +15,7 @@ from custom_components.askoheat.model import (
 
 from .data import AskoheatConfigEntry
 from .entity import AskoheatEntity
+from .entity_index import entity_descriptions
 
 
 async def async_setup_entry(
@@ -26,27 +25,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up the select platform."""
     async_add_entities(
-        AskoheatSelect(
-            entry=entry,
-            coordinator=coordinator,
-            entity_description=entity_description,
-        )
-        for entity_description, coordinator in {
-            **dict.fromkeys(
-                PARAM_REGISTER_BLOCK_DESCRIPTOR.select_inputs,
-                entry.runtime_data.par_coordinator,
-            ),
-            **dict.fromkeys(
-                EMA_REGISTER_BLOCK_DESCRIPTOR.select_inputs,
-                entry.runtime_data.ema_coordinator,
-            ),
-            **dict.fromkeys(
-                CONF_REGISTER_BLOCK_DESCRIPTOR.select_inputs,
-                entry.runtime_data.config_coordinator,
-            ),
-        }.items()
-        if entity_description.device_key is None
-        or entity_description.device_key in entry.runtime_data.supported_devices
+        [
+            AskoheatSelect(
+                entry=entry,
+                coordinator=entry.runtime_data.coordinator(block_key),
+                entity_description=entity_description,
+            )
+            for entity_description, block_key in entity_descriptions(
+                Platform.SELECT, entry.runtime_data.supported_devices
+            )
+        ]
     )
 
 
@@ -102,18 +90,15 @@ class AskoheatSelect(AskoheatEntity[AskoheatSelectEntityDescription], SelectEnti
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return (
-            super().available
-            and self.entity_description.data_key in self.coordinator.data
-        )
+        return super().available and self._has_value()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        data = self.coordinator.data
-        if data is None or data.get(self.entity_description.data_key) is None:
+        value = self._value()
+        if value is None:
             return
-        enum = data[self.entity_description.data_key]
+        enum = value
         self.current_option = self._enum_to_options[enum]
         super()._handle_coordinator_update()
 
@@ -125,5 +110,4 @@ class AskoheatSelect(AskoheatEntity[AskoheatSelectEntityDescription], SelectEnti
             )
             return
         enum = self._options_to_enum[option]
-        await self.coordinator.async_write(self.entity_description.api_descriptor, enum)
-        self._handle_coordinator_update()
+        await self._async_write(self.entity_description.api_descriptor, enum)
@@ -2,35 +2,67 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+from decimal import Decimal
+from time import monotonic
 from typing import TYPE_CHECKING, Any, cast
 
-import numpy as np
-from homeassistant.components.sensor import ENTITY_ID_FORMAT, SensorEntity
-from homeassistant.const import UnitOfTime
+from homeassistant.components.sensor import (
+    ENTITY_ID_FORMAT,
+    RestoreSensor,
+    SensorDeviceClass,
+    SensorEntity,
+)
+from homeassistant.const import EntityCategory, Platform
 from homeassistant.core import callback
-
-from custom_components.askoheat.api_conf_desc import CONF_REGISTER_BLOCK_DESCRIPTOR
-from custom_components.askoheat.api_ema_desc import EMA_REGISTER_BLOCK_DESCRIPTOR
-from custom_components.askoheat.api_op_desc import DATA_REGISTER_BLOCK_DESCRIPTOR
-from custom_components.askoheat.api_par_desc import PARAM_REGISTER_BLOCK_DESCRIPTOR
-from custom_components.askoheat.const import AttributeKeys
+from homeassistant.helpers.event import async_call_later
+
+from custom_components.askoheat.const import (
+    CIRCUIT_BREAKER_OPEN_INTERVAL,
+    EMA_STATISTICS_WINDOW,
+    AttributeKeys,
+    CircuitBreakerState,
+    DeviceKey,
+    SensorAttrKey,
+)
+from custom_components.askoheat.ema_statistics import (
+    EMA_STATISTICS_SENSOR_DESCRIPTIONS,
+    AskoheatEmaStatisticsSensorEntityDescription,
+)
+from custom_components.askoheat.heater_energy import (
+    HEATER_ENERGY_SENSOR_DESCRIPTIONS,
+    AskoheatHeaterEnergySensorEntityDescription,
+)
 from custom_components.askoheat.model import (
     AskoheatDurationSensorEntityDescription,
     AskoheatSensorEntityDescription,
 )
 
 from .entity import AskoheatEntity
+from .entity_index import entity_descriptions
 
 if TYPE_CHECKING:
-    from decimal import Decimal
+    from datetime import date, datetime
 
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
     from homeassistant.helpers.typing import StateType
 
-    from .coordinator import AskoheatDataUpdateCoordinator
+    from .coordinator import (
+        AskoheatDataUpdateCoordinator,
+        AskoheatEMADataUpdateCoordinator,
+    )
     from .data import AskoheatConfigEntry
+    from .transform import DurationValue
+
+
+CIRCUIT_BREAKER_SENSOR_DESCRIPTION = AskoheatSensorEntityDescription(
+    key=SensorAttrKey.CIRCUIT_BREAKER,
+    device_key=DeviceKey.WATER_HEATER_CONTROL_UNIT,
+    icon="mdi:electric-switch",
+    device_class=SensorDeviceClass.ENUM,
+    options=list(CircuitBreakerState),
+    entity_category=EntityCategory.DIAGNOSTIC,
+)
 
 
 def _instanciate(
@@ -60,31 +92,46 @@ async def async_setup_entry(
 ) -> None:
     """Set up the sensor platform."""
     async_add_entities(
-        _instanciate(
-            entry=entry,
-            coordinator=coordinator,
-            entity_description=entity_description,
-        )
-        for entity_description, coordinator in {
-            **dict.fromkeys(
-                PARAM_REGISTER_BLOCK_DESCRIPTOR.sensors,
-                entry.runtime_data.par_coordinator,
-            ),
-            **dict.fromkeys(
-                EMA_REGISTER_BLOCK_DESCRIPTOR.sensors,
-                entry.runtime_data.ema_coordinator,
-            ),
-            **dict.fromkeys(
-                CONF_REGISTER_BLOCK_DESCRIPTOR.sensors,
-                entry.runtime_data.config_coordinator,
-            ),
-            **dict.fromkeys(
-                DATA_REGISTER_BLOCK_DESCRIPTOR.sensors,
-                entry.runtime_data.data_coordinator,
-            ),
-        }.items()
-        if entity_description.device_key is None
-        or entity_description.device_key in entry.runtime_data.supported_devices
+        [
+            _instanciate(
+                entry=entry,
+                coordinator=entry.runtime_data.coordinator(block_key),
+                entity_description=entity_description,
+            )
+            for entity_description, block_key in entity_descriptions(
+                Platform.SENSOR, entry.runtime_data.supported_devices
+            )
+        ]
+    )
+    async_add_entities(
+        [
+            AskoheatEmaStatisticsSensor(
+                entry=entry,
+                coordinator=entry.runtime_data.ema_coordinator,
+                entity_description=entity_description,
+            )
+            for entity_description in EMA_STATISTICS_SENSOR_DESCRIPTIONS
+            if entity_description.device_key in entry.runtime_data.supported_devices
+        ]
+    )
+    async_add_entities(
+        [
+            AskoheatHeaterEnergySensor(
+                entry=entry,
+                coordinator=entry.runtime_data.ema_coordinator,
+                entity_description=entity_description,
+            )
+            for entity_description in HEATER_ENERGY_SENSOR_DESCRIPTIONS
+        ]
+    )
+    async_add_entities(
+        [
+            AskoheatCircuitBreakerSensor(
+                entry=entry,
+                coordinator=entry.runtime_data.ema_coordinator,
+                entity_description=CIRCUIT_BREAKER_SENSOR_DESCRIPTION,
+            )
+        ]
     )
 
 
@@ -105,56 +152,58 @@ class AskoheatSensor(AskoheatEntity[AskoheatSensorEntityDescription], SensorEnti
             f"{self._device_unique_id}_{entity_description.key}"
         )
         self._attr_unique_id = self.entity_id
+        # monotonic time and availability of the last written state
+        self._last_write: float | None = None
+        self._last_written_available = False
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return (
-            super().available
-            and self.entity_description.data_key in self.coordinator.data
-        )
+        return super().available and self._has_value()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        data = self.coordinator.data
-        if data is None or data.get(self.entity_description.data_key) is None:
-            return
-
-        raw_value = data[self.entity_description.data_key]
-
+        raw_value = self._value()
         if raw_value is None:
-            self._attr_native_value = None
-
-        else:
-            converted_value = self._convert_value(raw_value)
-
-            if isinstance(converted_value, float | int | np.floating | np.integer) and (
-                self.entity_description.factor is not None
-                or self.entity_description.native_precision is not None
-            ):
-                float_value = float(converted_value)
-                if self.entity_description.factor is not None:
-                    float_value *= self.entity_description.factor
-                if self.entity_description.native_precision is not None:
-                    float_value = float_value.__round__(
-                        self.entity_description.native_precision
-                    )
-
-                self._attr_native_value = float_value
-            else:
-                self._attr_native_value = converted_value
+            return
 
+        native_value = self._transform_value(raw_value)
+        if not self._should_write(native_value):
+            return
+        self._attr_native_value = native_value
+        self._last_write = monotonic()
+        self._last_written_available = self.available
         super()._handle_coordinator_update()
 
-    def _convert_value(self, value: Any) -> StateType | date | datetime | Decimal:
-        return cast("StateType | date | datetime | Decimal", value)
+    def _should_write(self, native_value: Any) -> bool:
+        """Return True if the state must be written, skipping insignificant changes."""
+        descr = self.entity_description
+        if (
+            self._last_write is None
+            or self._last_written_available != self.available
+            or descr.is_significant_change(self._attr_native_value, native_value)
+        ):
+            return True
+        return (
+            descr.max_silence is not None
+            and monotonic() - self._last_write >= descr.max_silence.total_seconds()
+        )
+
+    def _transform_value(self, value: Any) -> StateType | date | datetime | Decimal:
+        return self.entity_description.value_transform(value)
 
 
 class AskoheatDurationSensor(AskoheatSensor):
     """askoheat Sensor class representing a duration."""
 
-    _unrecorded_attributes = frozenset({AttributeKeys.FORMATTED})
+    _unrecorded_attributes = frozenset(
+        {
+            AttributeKeys.API_DESCRIPTOR,
+            AttributeKeys.DATA_AGE,
+            AttributeKeys.FORMATTED,
+        }
+    )
 
     def __init__(
         self,
@@ -166,24 +215,165 @@ class AskoheatDurationSensor(AskoheatSensor):
         super().__init__(entry, coordinator, entity_description)
         self._attr_extra_state_attributes[AttributeKeys.FORMATTED] = None
 
-    def _convert_value(self, value: Any) -> StateType | date | datetime | Decimal:
-        time_as_int = int(value)
-        minutes = int(time_as_int / 2**0) & 0xFF
-        hours = int(time_as_int / 2**8) & 0xFF
-        days = int(time_as_int / 2**16) & 0xFFFF
-
+    def _transform_value(self, value: Any) -> StateType | date | datetime | Decimal:
+        duration = cast("DurationValue", self.entity_description.value_transform(value))
         # write formatted value additionally to attributes
-        self._attr_extra_state_attributes[AttributeKeys.FORMATTED] = timedelta(
-            days=days, hours=hours, minutes=minutes
-        ).__str__()
-
-        match self.entity_description.native_unit_of_measurement:
-            case UnitOfTime.DAYS:
-                converted_value = (minutes / (60 * 24)) + (hours / 24) + days
-            case UnitOfTime.HOURS:
-                converted_value = (minutes / 60) + hours + (days * 24)
-            case _:
-                # by default convert to minutes
-                converted_value = minutes + (hours * 60) + (days * 24 * 60)
-
-        return converted_value
+        self._attr_extra_state_attributes[AttributeKeys.FORMATTED] = duration.formatted
+        return duration.value
+
+
+class AskoheatHeaterEnergySensor(AskoheatSensor, RestoreSensor):
+    """askoheat Sensor class of the energy converted by a heater stage."""
+
+    entity_description: AskoheatHeaterEnergySensorEntityDescription
+
+    def __init__(
+        self,
+        entry: AskoheatConfigEntry,
+        coordinator: AskoheatEMADataUpdateCoordinator,
+        entity_description: AskoheatHeaterEnergySensorEntityDescription,
+    ) -> None:
+        """Initialize the heater energy sensor class."""
+        super().__init__(entry, coordinator, entity_description)
+        self._ema_coordinator = coordinator
+        # energy written before the coordinator started integrating, in kWh
+        self._restored_energy = 0.0
+
+    async def async_added_to_hass(self) -> None:
+        """Continue from the last state before the first update is written."""
+        last_sensor_data = await self.async_get_last_sensor_data()
+        if last_sensor_data is not None and isinstance(
+            last_sensor_data.native_value, int | float | Decimal
+        ):
+            self._restored_energy = float(last_sensor_data.native_value)
+        await super().async_added_to_hass()
+
+    def _has_value(self) -> bool:
+        return self._value() is not None
+
+    def _value(self) -> Any:
+        heater_energy = self._ema_coordinator.heater_energy
+        if heater_energy is None:
+            return None
+        energy = heater_energy.energy(self.entity_description.key)
+        return None if energy is None else self._restored_energy + energy
+
+
+class AskoheatCircuitBreakerSensor(AskoheatSensor):
+    """askoheat Sensor class of the circuit breaker of the requests to the device."""
+
+    _unsub_half_open: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Write the state whenever the breaker opens or closes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.entry.runtime_data.client.add_circuit_breaker_listener(
+                self._async_circuit_breaker_changed
+            )
+        )
+        self.async_on_remove(self._async_cancel_half_open)
+
+    @callback
+    def _async_circuit_breaker_changed(self) -> None:
+        """Write the state, and once more when the opened breaker turns half-open."""
+        self._async_cancel_half_open()
+        if self._value() is CircuitBreakerState.OPEN:
+            self._unsub_half_open = async_call_later(
+                self.hass, CIRCUIT_BREAKER_OPEN_INTERVAL, self._async_half_open
+            )
+        self.async_write_ha_state()
+
+    @callback
+    def _async_half_open(self, _: datetime) -> None:
+        self._unsub_half_open = None
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_half_open(self) -> None:
+        if self._unsub_half_open is not None:
+            self._unsub_half_open()
+            self._unsub_half_open = None
+
+    @property
+    def available(self) -> bool:
+        """Return True, the state of the breaker is known while the device is not."""
+        return True
+
+    def _has_value(self) -> bool:
+        return True
+
+    def _value(self) -> Any:
+        return self.entry.runtime_data.client.circuit_breaker_state
+
+
+class AskoheatEmaStatisticsSensor(
+    AskoheatEntity[AskoheatEmaStatisticsSensorEntityDescription], SensorEntity
+):
+    """askoheat Sensor class of the statistics over a sampled energymanager value."""
+
+    entity_description: AskoheatEmaStatisticsSensorEntityDescription
+
+    _unrecorded_attributes = frozenset(
+        {
+            AttributeKeys.API_DESCRIPTOR,
+            AttributeKeys.DATA_AGE,
+            AttributeKeys.MINIMUM,
+            AttributeKeys.MAXIMUM,
+            AttributeKeys.RATE,
+            AttributeKeys.SAMPLES,
+            AttributeKeys.WINDOW,
+        }
+    )
+
+    def __init__(
+        self,
+        entry: AskoheatConfigEntry,
+        coordinator: AskoheatEMADataUpdateCoordinator,
+        entity_description: AskoheatEmaStatisticsSensorEntityDescription,
+    ) -> None:
+        """Initialize the statistics sensor class."""
+        super().__init__(entry, coordinator, entity_description)
+        self.entity_id = ENTITY_ID_FORMAT.format(
+            f"{self._device_unique_id}_{entity_description.key}"
+        )
+        self._attr_unique_id = self.entity_id
+        self._ema_coordinator = coordinator
+        self._window = EMA_STATISTICS_WINDOW.total_seconds()
+        self._attr_extra_state_attributes[AttributeKeys.WINDOW] = self._window
+
+    async def async_added_to_hass(self) -> None:
+        """Start sampling the energymanager values, only done while enabled."""
+        await self._ema_coordinator.async_setup_samples()
+        await super().async_added_to_hass()
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return super().available and self._attr_native_value is not None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        samples = self._ema_coordinator.samples
+        if samples is None:
+            return
+
+        descr = self.entity_description
+        statistics = samples.statistics(self._window)[descr.source_key]
+        transform = descr.value_transform
+        attributes = self._attr_extra_state_attributes
+        self._attr_native_value = (
+            None if statistics.mean is None else transform(statistics.mean)
+        )
+        attributes[AttributeKeys.MINIMUM] = (
+            None if statistics.minimum is None else transform(statistics.minimum)
+        )
+        attributes[AttributeKeys.MAXIMUM] = (
+            None if statistics.maximum is None else transform(statistics.maximum)
+        )
+        attributes[AttributeKeys.RATE] = (
+            None if statistics.rate is None else transform(statistics.rate)
+        )
+        attributes[AttributeKeys.SAMPLES] = statistics.samples
+        super()._handle_coordinator_update()
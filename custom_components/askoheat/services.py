@@ -0,0 +1,75 @@
+"""Services of askoheat."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import ServiceCall, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN, EMA_STATISTICS_WINDOW
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceResponse
+
+    from .data import AskoheatConfigEntry
+
+SERVICE_GET_EMA_STATISTICS = "get_ema_statistics"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_WINDOW = "window"
+
+GET_EMA_STATISTICS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_WINDOW, default=EMA_STATISTICS_WINDOW): vol.All(
+            cv.time_period, cv.positive_timedelta
+        ),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register services of askoheat."""
+
+    async def async_get_ema_statistics(call: ServiceCall) -> ServiceResponse:
+        """Return statistics of the energymanager samples over a window."""
+        entry = _async_loaded_entry(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        # sampling starts with the first statistics requested
+        samples = await entry.runtime_data.ema_coordinator.async_setup_samples()
+        window = call.data[ATTR_WINDOW].total_seconds()
+        return {
+            "samples": len(samples),
+            "statistics": {
+                key: statistics._asdict()
+                for key, statistics in samples.statistics(window).items()
+            },
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_EMA_STATISTICS,
+        async_get_ema_statistics,
+        schema=GET_EMA_STATISTICS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+@callback
+def _async_loaded_entry(hass: HomeAssistant, entry_id: str) -> AskoheatConfigEntry:
+    """Return loaded askoheat config entry, raise if it isn't loaded."""
+    entry: AskoheatConfigEntry | None = hass.config_entries.async_get_entry(entry_id)
+    if (
+        entry is None
+        or entry.domain != DOMAIN
+        or entry.state is not ConfigEntryState.LOADED
+    ):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="entry_not_loaded",
+            translation_placeholders={"entry_id": entry_id},
+        )
+    return entry
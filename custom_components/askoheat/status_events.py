@@ -0,0 +1,48 @@
+"""Events of the bit transitions of the status registers."""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+from custom_components.askoheat.api_desc import (
+    FlagRegisterInputDescriptor,
+    register_block,
+)
+from custom_components.askoheat.const import STATUS_REGISTERS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from custom_components.askoheat.const import BlockKey
+    from custom_components.askoheat.model import AskoheatBinarySensorEntityDescription
+
+# keys of the event data
+ATTR_KEY = "key"
+ATTR_BIT = "bit"
+ATTR_REGISTER = "register"
+ATTR_OLD = "old"
+ATTR_NEW = "new"
+
+
+@cache
+def status_bit_descriptions(
+    block_key: BlockKey,
+) -> dict[int, AskoheatBinarySensorEntityDescription]:
+    """Return binary sensors decoded from the status register of a block by bit."""
+    register = STATUS_REGISTERS[block_key]
+    return {
+        description.api_descriptor.bit: description
+        for description in register_block(block_key).binary_sensors
+        if isinstance(description.api_descriptor, FlagRegisterInputDescriptor)
+        and description.api_descriptor.starting_register == register
+    }
+
+
+def changed_bits(previous: int, word: int) -> Iterator[int]:
+    """Iterate bits differing between two status words, lowest first."""
+    changed = previous ^ word
+    while changed:
+        lowest = changed & -changed
+        yield lowest.bit_length() - 1
+        changed ^= lowest
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import ENTITY_ID_FORMAT, SwitchEntity
-from homeassistant.const import CONF_HOST
+from homeassistant.const import CONF_HOST, Platform
 from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryError
 from homeassistant.helpers.event import async_track_state_change_event
@@ -13,14 +13,11 @@ from homeassistant.helpers.httpx_client import get_async_client
 
 from custom_components.askoheat.api_conf_desc import (
     CONF_FEED_IN_ENABLED_SWITCH_ENTITY_DESCRIPTOR,
-    CONF_REGISTER_BLOCK_DESCRIPTOR,
 )
 from custom_components.askoheat.api_ema_desc import (
     EMA_EMERGENCY_MODE_API_DESCRIPTOR,
     EMA_FEED_IN_VALUE_NUMBER_ENTITY_DESCRIPTOR,
-    EMA_REGISTER_BLOCK_DESCRIPTOR,
 )
-from custom_components.askoheat.api_par_desc import PARAM_REGISTER_BLOCK_DESCRIPTOR
 from custom_components.askoheat.const import (
     CONF_FEED_IN,
     CONF_POWER_ENTITY_ID,
@@ -37,6 +34,7 @@ from custom_components.askoheat.model import (
 )
 
 from .entity import AskoheatEntity
+from .entity_index import entity_descriptions
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -64,27 +62,16 @@ async def async_setup_entry(
 
     power_entity_id = config_power_entity()
     async_add_entities(
-        AskoheatSwitch(
-            entry=entry,
-            coordinator=coordinator,
-            entity_description=entity_description,
-        )
-        for entity_description, coordinator in {
-            **dict.fromkeys(
-                PARAM_REGISTER_BLOCK_DESCRIPTOR.switches,
-                entry.runtime_data.par_coordinator,
-            ),
-            **dict.fromkeys(
-                EMA_REGISTER_BLOCK_DESCRIPTOR.switches,
-                entry.runtime_data.ema_coordinator,
-            ),
-            **dict.fromkeys(
-                CONF_REGISTER_BLOCK_DESCRIPTOR.switches,
-                entry.runtime_data.config_coordinator,
-            ),
-        }.items()
-        if entity_description.device_key is None
-        or entity_description.device_key in entry.runtime_data.supported_devices
+        [
+            AskoheatSwitch(
+                entry=entry,
+                coordinator=entry.runtime_data.coordinator(block_key),
+                entity_description=entity_description,
+            )
+            for entity_description, block_key in entity_descriptions(
+                Platform.SWITCH, entry.runtime_data.supported_devices
+            )
+        ]
     )
     if power_entity_id is not None and power_entity_id != []:
         if isinstance(power_entity_id, list) and len(power_entity_id) != 1:
@@ -150,18 +137,15 @@ class AskoheatSwitch(AskoheatEntity[AskoheatSwitchEntityDescription], SwitchEnti
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return (
-            super().available
-            and self.entity_description.data_key in self.coordinator.data
-        )
+        return super().available and self._has_value()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        data = self.coordinator.data
-        if data.get(self.entity_description.data_key) is None:
+        value = self._value()
+        if value is None:
             return
-        self._attr_state = data[self.entity_description.data_key]
+        self._attr_state = value
         if (
             self.entity_description.on_state is True
             or self.entity_description.on_state is False
@@ -192,10 +176,7 @@ class AskoheatSwitch(AskoheatEntity[AskoheatSwitchEntityDescription], SwitchEnti
                 "Cannot set state, missing api_descriptor on entity %s", self.entity_id
             )
             return
-        await self.coordinator.async_write(
-            self.entity_description.api_descriptor, state
-        )
-        self._handle_coordinator_update()
+        await self._async_write(self.entity_description.api_descriptor, state)
 
 
 class AskoheatAutoFeedInSwitch(
@@ -1,12 +1,10 @@
 """Askoheat time entity."""
 
 from homeassistant.components.text import ENTITY_ID_FORMAT, TextEntity
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from custom_components.askoheat.api_conf_desc import CONF_REGISTER_BLOCK_DESCRIPTOR
-from custom_components.askoheat.api_ema_desc import EMA_REGISTER_BLOCK_DESCRIPTOR
-from custom_components.askoheat.api_par_desc import PARAM_REGISTER_BLOCK_DESCRIPTOR
 from custom_components.askoheat.const import LOGGER
 from custom_components.askoheat.coordinator import AskoheatDataUpdateCoordinator
 from custom_components.askoheat.model import (
@@ -15,6 +13,7 @@ from custom_components.askoheat.model import (
 
 from .data import AskoheatConfigEntry
 from .entity import AskoheatEntity
+from .entity_index import entity_descriptions
 
 
 async def async_setup_entry(
@@ -24,27 +23,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up the text platform."""
     async_add_entities(
-        AskoheatText(
-            entry=entry,
-            coordinator=coordinator,
-            entity_description=entity_description,
-        )
-        for entity_description, coordinator in {
-            **dict.fromkeys(
-                PARAM_REGISTER_BLOCK_DESCRIPTOR.text_inputs,
-                entry.runtime_data.par_coordinator,
-            ),
-            **dict.fromkeys(
-                EMA_REGISTER_BLOCK_DESCRIPTOR.text_inputs,
-                entry.runtime_data.ema_coordinator,
-            ),
-            **dict.fromkeys(
-                CONF_REGISTER_BLOCK_DESCRIPTOR.text_inputs,
-                entry.runtime_data.config_coordinator,
-            ),
-        }.items()
-        if entity_description.device_key is None
-        or entity_description.device_key in entry.runtime_data.supported_devices
+        [
+            AskoheatText(
+                entry=entry,
+                coordinator=entry.runtime_data.coordinator(block_key),
+                entity_description=entity_description,
+            )
+            for entity_description, block_key in entity_descriptions(
+                Platform.TEXT, entry.runtime_data.supported_devices
+            )
+        ]
     )
 
 
@@ -69,18 +57,15 @@ class AskoheatText(AskoheatEntity[AskoheatTextEntityDescription], TextEntity):
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return (
-            super().available
-            and self.entity_description.data_key in self.coordinator.data
-        )
+        return super().available and self._has_value()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        data = self.coordinator.data
-        if data is None or data.get(self.entity_description.data_key) is None:
+        value = self._value()
+        if value is None:
             return
-        self._attr_native_value = data[self.entity_description.data_key]
+        self._attr_native_value = value
         super()._handle_coordinator_update()
 
     async def async_set_value(self, value: str) -> None:
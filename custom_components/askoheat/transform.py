@@ -0,0 +1,99 @@
+"""Transforms of raw register values into native values of entities."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from homeassistant.const import UnitOfTime
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# number of distinct raw values cached per entity description
+TRANSFORM_CACHE_SIZE = 32
+
+
+class DurationValue(NamedTuple):
+    """Duration converted to the unit of the entity and its formatted value."""
+
+    value: Any
+    formatted: str
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def sensor_transform(
+    factor: float | None, precision: int | None
+) -> Callable[[Any], Any]:
+    """Return transform scaling and rounding numeric sensor values."""
+    if factor is None and precision is None:
+        return _identity
+
+    @lru_cache(maxsize=TRANSFORM_CACHE_SIZE, typed=True)
+    def transform(value: Any) -> Any:
+        if not isinstance(value, int | float):
+            return value
+        result = float(value)
+        if factor is not None:
+            result *= factor
+        if precision is not None:
+            result = round(result, precision)
+        return result
+
+    return transform
+
+
+def number_transform(
+    factor: float | None, precision: int | None
+) -> Callable[[Any], Any]:
+    """Return transform scaling and rounding number values."""
+    if factor is None and precision is None:
+        return _identity
+
+    @lru_cache(maxsize=TRANSFORM_CACHE_SIZE, typed=True)
+    def transform(value: Any) -> Any:
+        if factor is not None:
+            value *= factor
+        if precision is not None:
+            value = round(value, precision)
+        return value
+
+    return transform
+
+
+def duration_transform(
+    unit: str | None, factor: float | None, precision: int | None
+) -> Callable[[Any], DurationValue]:
+    """Return transform of a duration packed as days, hours and minutes."""
+    match unit:
+        case UnitOfTime.DAYS:
+
+            def convert(days: int, hours: int, minutes: int) -> Any:
+                return (minutes / (60 * 24)) + (hours / 24) + days
+        case UnitOfTime.HOURS:
+
+            def convert(days: int, hours: int, minutes: int) -> Any:
+                return (minutes / 60) + hours + (days * 24)
+        case _:
+            # by default convert to minutes
+            def convert(days: int, hours: int, minutes: int) -> Any:
+                return minutes + (hours * 60) + (days * 24 * 60)
+
+    scale = sensor_transform(factor, precision)
+
+    @lru_cache(maxsize=TRANSFORM_CACHE_SIZE, typed=True)
+    def transform(value: Any) -> DurationValue:
+        time_as_int = int(value)
+        minutes = time_as_int & 0xFF
+        hours = (time_as_int >> 8) & 0xFF
+        days = (time_as_int >> 16) & 0xFFFF
+        return DurationValue(
+            value=scale(convert(days, hours, minutes)),
+            formatted=str(timedelta(days=days, hours=hours, minutes=minutes)),
+        )
+
+    return transform
@@ -20,11 +20,14 @@ from custom_components.askoheat.api_op_desc import DATA_REGISTER_BLOCK_DESCRIPTO
 from custom_components.askoheat.api_par_desc import PARAM_REGISTER_BLOCK_DESCRIPTOR
 from custom_components.askoheat.const import (
     CONF_ANALOG_INPUT_UNIT,
+    CONF_CONNECTION,
     CONF_DEVICE_UNITS,
     CONF_FEED_IN,
     CONF_HEATPUMP_UNIT,
     CONF_LEGIONELLA_PROTECTION_UNIT,
     CONF_MODBUS_MASTER_UNIT,
+    CONF_OPTIMISTIC_WRITES,
+    DEFAULT_OPTIMISTIC_WRITES,
     DOMAIN,
     LOGGER,
     DeviceKey,
@@ -87,6 +90,18 @@ def conf_feedin() -> None | dict[str, Any]:
     return None
 
 
+@pytest.fixture
+def conf_connection() -> None | dict[str, Any]:
+    """Fixture returning connection configuration."""
+    return None
+
+
+@pytest.fixture
+def conf_optimistic_writes() -> bool:
+    """Fixture returning whether written values are shown at once."""
+    return DEFAULT_OPTIMISTIC_WRITES
+
+
 @pytest.fixture
 def mock_api_client(
     read_config_holding_registers_response: ReadHoldingRegistersResponse,
@@ -96,21 +111,59 @@ def mock_api_client(
 ) -> Any:
     """Fixture to pymodbus AsyncModbusTcpClient."""
 
+    def _in_block(address: int, register: RegisterBlockDescriptor) -> bool:
+        return (
+            register.starting_register
+            <= address
+            < register.starting_register + register.number_of_registers
+        )
+
+    def _read_registers(
+        response: ReadInputRegistersResponse | ReadHoldingRegistersResponse,
+        register: RegisterBlockDescriptor,
+        address: int,
+        count: int,
+    ) -> list[int]:
+        offset = address - register.starting_register
+        return response.registers[offset : offset + count]
+
     def dispatch_read_input_registers(
         address: int,
-        count: int,  # noqa: ARG001
+        count: int,
+        slave: int = 1,  # noqa: ARG001
     ) -> ReadInputRegistersResponse:
-        match address:
-            case PARAM_REGISTER_BLOCK_DESCRIPTOR.starting_register:
-                return read_par_input_registers_response
-            case DATA_REGISTER_BLOCK_DESCRIPTOR.starting_register:
-                return read_data_input_registers_response
-            case EMA_REGISTER_BLOCK_DESCRIPTOR.starting_register:
-                return read_ema_input_registers_response
-            case _:
-                return ReadInputRegistersResponse()
+        for register, response in (
+            (PARAM_REGISTER_BLOCK_DESCRIPTOR, read_par_input_registers_response),
+            (DATA_REGISTER_BLOCK_DESCRIPTOR, read_data_input_registers_response),
+            (EMA_REGISTER_BLOCK_DESCRIPTOR, read_ema_input_registers_response),
+        ):
+            if _in_block(address, register):
+                return ReadInputRegistersResponse(
+                    registers=_read_registers(response, register, address, count)
+                )
+        return ReadInputRegistersResponse()
 
-    def dispatch_write_input_registers(address: int, values: list[int]) -> None:
+    def dispatch_read_holding_registers(
+        address: int,
+        count: int,
+        slave: int = 1,  # noqa: ARG001
+    ) -> ReadHoldingRegistersResponse:
+        if _in_block(address, CONF_REGISTER_BLOCK_DESCRIPTOR):
+            return ReadHoldingRegistersResponse(
+                registers=_read_registers(
+                    read_config_holding_registers_response,
+                    CONF_REGISTER_BLOCK_DESCRIPTOR,
+                    address,
+                    count,
+                )
+            )
+        return ReadHoldingRegistersResponse()
+
+    def dispatch_write_input_registers(
+        address: int,
+        values: list[int],
+        slave: int = 1,  # noqa: ARG001
+    ) -> None:
         def _in_register(address: int, register: RegisterBlockDescriptor) -> bool:
             return (
                 address > register.starting_register
@@ -142,7 +195,7 @@ def mock_api_client(
         connect=mock.AsyncMock(),
         connected=True,
         read_holding_registers=mock.AsyncMock(
-            return_value=read_config_holding_registers_response
+            side_effect=dispatch_read_holding_registers
         ),
         read_input_registers=mock.AsyncMock(side_effect=dispatch_read_input_registers),
         write_registers=mock.AsyncMock(side_effect=dispatch_write_input_registers),
@@ -168,6 +221,8 @@ async def mock_config_entry_uninitialized(
     mock_api_client: AskoheatModbusApiClient,
     hass: HomeAssistant,
     conf_feedin: None | dict[str, Any],
+    conf_connection: None | dict[str, Any],
+    conf_optimistic_writes: bool,  # noqa: FBT001
 ) -> MockConfigEntry:
     """Fixture to mock an uninitialized config entry."""
     entry = MockConfigEntry(
@@ -182,6 +237,8 @@ async def mock_config_entry_uninitialized(
                 CONF_HEATPUMP_UNIT: True,
             },
             CONF_FEED_IN: conf_feedin,
+            CONF_CONNECTION: conf_connection,
+            CONF_OPTIMISTIC_WRITES: conf_optimistic_writes,
         },
         unique_id="test",
     )
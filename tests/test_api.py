@@ -0,0 +1,382 @@
+"""Tests for the modbus api client."""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Any
+from unittest import mock
+
+import numpy as np
+import pytest
+from pymodbus.exceptions import ModbusIOException
+from pymodbus.pdu.register_message import ReadHoldingRegistersResponse
+
+from custom_components.askoheat.api import (
+    AskoheatModbusApiClient,
+    AskoheatModbusApiClientCommunicationError,
+    AskoheatModbusApiClientError,
+    AskoheatModbusConnectionPool,
+    AskoheatTokenBucket,
+    _prepare_byte,
+    _prepare_float32,
+    _prepare_int16,
+    _prepare_uint16,
+    _prepare_uint32,
+)
+from custom_components.askoheat.api_conf_desc import CONF_REGISTER_BLOCK_DESCRIPTOR
+from custom_components.askoheat.api_desc import RegisterMapVariant
+from custom_components.askoheat.const import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_OPEN_INTERVAL,
+    BlockKey,
+    CircuitBreakerState,
+    ModbusTransport,
+    SelectAttrKey,
+)
+
+
+async def test_clients_behind_same_gateway_share_connection() -> None:
+    """Test that clients of the same gateway share one pooled connection."""
+    pool = AskoheatModbusConnectionPool()
+    with mock.patch(
+        "custom_components.askoheat.api.AsyncModbusTcpClient.close"
+    ) as mock_close:
+        client1 = AskoheatModbusApiClient(
+            host="192.199.1.2", port=502, unit_id=1, pool=pool
+        )
+        client2 = AskoheatModbusApiClient(
+            host="192.199.1.2", port=502, unit_id=2, pool=pool
+        )
+        client3 = AskoheatModbusApiClient(
+            host="192.199.1.3", port=502, unit_id=1, pool=pool
+        )
+
+        assert client1._client is client2._client  # noqa: SLF001
+        assert client1._client is not client3._client  # noqa: SLF001
+
+        client1.close()
+        mock_close.assert_not_called()
+
+        client2.close()
+        mock_close.assert_called_once()
+
+
+def test_clients_on_same_serial_port_share_baudrate() -> None:
+    """Test that a serial port open with another baudrate is not shared."""
+    pool = AskoheatModbusConnectionPool()
+    client = AskoheatModbusApiClient(
+        host="",
+        port=0,
+        unit_id=1,
+        pool=pool,
+        transport=ModbusTransport.SERIAL,
+        serial_port="/dev/ttyUSB0",
+        baudrate=19200,
+    )
+
+    with pytest.raises(AskoheatModbusApiClientError):
+        AskoheatModbusApiClient(
+            host="",
+            port=0,
+            unit_id=2,
+            pool=pool,
+            transport=ModbusTransport.SERIAL,
+            serial_port="/dev/ttyUSB0",
+            baudrate=9600,
+        )
+    client.close()
+
+
+def _patch_holding_registers(
+    read: Callable[[int, int], ReadHoldingRegistersResponse],
+) -> Any:
+    def read_holding_registers(
+        address: int,
+        count: int,
+        slave: int = 1,  # noqa: ARG001
+    ) -> ReadHoldingRegistersResponse:
+        return read(address, count)
+
+    return mock.patch.multiple(
+        "custom_components.askoheat.api.AsyncModbusTcpClient",
+        connected=True,
+        read_holding_registers=mock.AsyncMock(side_effect=read_holding_registers),
+    )
+
+
+async def test_read_block_splits_failed_chunks() -> None:
+    """Test that failed chunks are split and the working chunk size is learned."""
+    max_count = 30
+
+    def read(_: int, count: int) -> ReadHoldingRegistersResponse:
+        if count > max_count:
+            msg = "Request too large"
+            raise ModbusIOException(msg)
+        return ReadHoldingRegistersResponse(registers=[0] * count)
+
+    with _patch_holding_registers(read) as patched:
+        client = AskoheatModbusApiClient(host="192.199.1.2", port=502)
+        data = await client.async_read_config_data()
+
+        assert data.number_inputs is not None
+        assert len(data.number_inputs) == len(
+            CONF_REGISTER_BLOCK_DESCRIPTOR.number_inputs
+        )
+        assert client.read_chunk_size(CONF_REGISTER_BLOCK_DESCRIPTOR) == 25  # noqa: PLR2004
+
+        patched["read_holding_registers"].reset_mock()
+        await client.async_read_config_data()
+        assert patched["read_holding_registers"].await_count == 4  # noqa: PLR2004
+
+
+async def test_read_block_skips_fields_of_unreadable_registers() -> None:
+    """Test that a partially failing block still yields the readable values."""
+    failing = CONF_REGISTER_BLOCK_DESCRIPTOR.number_inputs[0]
+    failing_register = CONF_REGISTER_BLOCK_DESCRIPTOR.absolute_register_index(
+        failing.api_descriptor
+    )
+
+    def read(address: int, count: int) -> ReadHoldingRegistersResponse:
+        if address <= failing_register < address + count:
+            return ReadHoldingRegistersResponse()
+        return ReadHoldingRegistersResponse(registers=[0] * count)
+
+    with _patch_holding_registers(read):
+        client = AskoheatModbusApiClient(host="192.199.1.2", port=502)
+        data = await client.async_read_config_data()
+
+    assert data.number_inputs is not None
+    assert failing.key not in data.number_inputs
+    assert len(data.number_inputs) > 0
+
+
+async def test_read_block_fails_if_no_register_can_be_read() -> None:
+    """Test that reading a block fails if no chunk could be read at all."""
+    with _patch_holding_registers(lambda _, __: ReadHoldingRegistersResponse()):
+        client = AskoheatModbusApiClient(host="192.199.1.2", port=502)
+        with pytest.raises(AskoheatModbusApiClientCommunicationError):
+            await client.async_read_config_data()
+
+
+async def test_decode_errors_are_isolated_per_field(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that a value failing to decode neither fails the block nor spams logs."""
+    field = f"select.{SelectAttrKey.CON_RTU_BAUDRATE}"
+
+    with _patch_holding_registers(
+        # an empty string isn't a valid baudrate
+        lambda _, count: ReadHoldingRegistersResponse(registers=[0] * count)
+    ):
+        client = AskoheatModbusApiClient(host="192.199.1.2", port=502)
+        with caplog.at_level(logging.WARNING):
+            await client.async_read_config_data()
+            data = await client.async_read_config_data()
+
+    assert data.select_inputs is not None
+    assert data.select_inputs[SelectAttrKey.CON_RTU_BAUDRATE] is None
+    assert data.number_inputs
+    assert field in client.decode_errors
+    assert len([r for r in caplog.records if field in r.getMessage()]) == 1
+
+
+async def test_read_block_skips_registers_unsupported_by_firmware() -> None:
+    """Test that registers of the selected map variant are neither read nor decoded."""
+    unsupported = CONF_REGISTER_BLOCK_DESCRIPTOR.number_inputs[0]
+    offset = unsupported.api_descriptor.starting_register
+    requested: set[int] = set()
+
+    def read(address: int, count: int) -> ReadHoldingRegistersResponse:
+        requested.update(range(address, address + count))
+        return ReadHoldingRegistersResponse(registers=[0] * count)
+
+    with _patch_holding_registers(read):
+        client = AskoheatModbusApiClient(host="192.199.1.2", port=502)
+        client.register_map_variant = RegisterMapVariant(
+            name="test", unsupported={BlockKey.CONF: ((offset, offset + 1),)}
+        )
+        data = await client.async_read_config_data()
+
+    assert CONF_REGISTER_BLOCK_DESCRIPTOR.starting_register + offset not in requested
+    assert data.number_inputs is not None
+    assert unsupported.key not in data.number_inputs
+    assert len(data.number_inputs) > 0
+
+
+@pytest.mark.parametrize(
+    ("prepare", "value"),
+    [
+        (_prepare_byte, True),
+        (_prepare_int16, -3.0),
+        (_prepare_uint16, np.uint16(7)),
+        (_prepare_uint32, np.int64(70000)),
+        (_prepare_float32, np.float32(1.5)),
+    ],
+)
+def test_prepare_accepts_builtin_and_numpy_numbers(
+    prepare: Callable[[object], list[int]], value: object
+) -> None:
+    """Test that encoding accepts numpy scalars without depending on numpy."""
+    assert prepare(value) == prepare(
+        value.item() if isinstance(value, np.generic) else value
+    )
+    assert prepare(value)
+    assert prepare("7") == []
+
+
+async def test_client_stays_available_within_stale_data_grace_period() -> None:
+    """Test that failed communication only turns unavailable after the grace."""
+    with (
+        _patch_holding_registers(
+            lambda _, count: ReadHoldingRegistersResponse(registers=[0] * count)
+        ),
+        mock.patch("custom_components.askoheat.api.monotonic") as mock_monotonic,
+    ):
+        mock_monotonic.return_value = 100.0
+        client = AskoheatModbusApiClient(
+            host="192.199.1.2", port=502, stale_data_grace_period=60
+        )
+        assert client.stale_data_expires_in is None
+        client.last_communication_failed()
+        assert not client.is_ready
+        assert client.is_available
+        assert client.stale_data_expires_in == 60  # noqa: PLR2004
+
+        # further failures don't extend the grace period
+        mock_monotonic.return_value = 150.0
+        client.last_communication_failed()
+        assert client.is_available
+        assert client.stale_data_expires_in == 10  # noqa: PLR2004
+        mock_monotonic.return_value = 160.0
+        assert not client.is_available
+
+        # a successful request ends the outage
+        await client.async_read_config_data()
+        client.last_communication_failed()
+        assert client.is_available
+
+
+async def test_circuit_breaker_stops_requests_to_unanswering_device() -> None:
+    """Test that requests pause after consecutive failures until a probe answers."""
+    answering = False
+
+    def read(_: int, count: int) -> ReadHoldingRegistersResponse:
+        if not answering:
+            msg = "No response received"
+            raise ModbusIOException(msg)
+        return ReadHoldingRegistersResponse(registers=[0] * count)
+
+    with (
+        _patch_holding_registers(read) as patched,
+        mock.patch(
+            "custom_components.askoheat.api.AsyncModbusTcpClient.read_input_registers",
+            mock.AsyncMock(side_effect=lambda **_: read(0, 1)),
+        ) as mock_probe,
+        mock.patch("custom_components.askoheat.api.monotonic") as mock_monotonic,
+    ):
+        mock_monotonic.return_value = 100.0
+        client = AskoheatModbusApiClient(host="192.199.1.2", port=502)
+        changes: list[CircuitBreakerState] = []
+        client.add_circuit_breaker_listener(
+            lambda: changes.append(client.circuit_breaker_state)
+        )
+        # the requests of the split chunks of a block read count as one failure
+        for _ in range(CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+            assert client.circuit_breaker_state is CircuitBreakerState.CLOSED
+            with pytest.raises(AskoheatModbusApiClientCommunicationError):
+                await client.async_read_config_data()
+        assert client.circuit_breaker_state is CircuitBreakerState.OPEN
+        sent = patched["read_holding_registers"].await_count
+
+        # no requests are sent while open
+        with pytest.raises(AskoheatModbusApiClientCommunicationError):
+            await client.async_read_config_data()
+        assert patched["read_holding_registers"].await_count == sent
+
+        # a failed probe opens the breaker again
+        mock_monotonic.return_value += CIRCUIT_BREAKER_OPEN_INTERVAL.total_seconds()
+        assert client.circuit_breaker_state is CircuitBreakerState.HALF_OPEN
+        with pytest.raises(AskoheatModbusApiClientCommunicationError):
+            await client.async_read_config_data()
+        assert mock_probe.await_count == 1
+        assert client.circuit_breaker_state is CircuitBreakerState.OPEN
+
+        # an answered probe restores polling
+        answering = True
+        mock_monotonic.return_value += CIRCUIT_BREAKER_OPEN_INTERVAL.total_seconds()
+        await client.async_read_config_data()
+        assert mock_probe.await_count == 2  # noqa: PLR2004
+        assert client.circuit_breaker_state is CircuitBreakerState.CLOSED
+        assert changes == [
+            CircuitBreakerState.OPEN,
+            CircuitBreakerState.OPEN,
+            CircuitBreakerState.CLOSED,
+        ]
+
+
+async def test_circuit_breaker_probe_timing_out_opens_breaker() -> None:
+    """Test that a probe timing out fails like an unanswered one."""
+
+    def read(_: int, __: int) -> ReadHoldingRegistersResponse:
+        msg = "No response received"
+        raise ModbusIOException(msg)
+
+    with (
+        _patch_holding_registers(read),
+        mock.patch(
+            "custom_components.askoheat.api.AsyncModbusTcpClient.read_input_registers",
+            mock.AsyncMock(side_effect=TimeoutError),
+        ) as mock_probe,
+        mock.patch("custom_components.askoheat.api.monotonic") as mock_monotonic,
+    ):
+        mock_monotonic.return_value = 100.0
+        client = AskoheatModbusApiClient(host="192.199.1.2", port=502)
+        for _ in range(CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+            with pytest.raises(AskoheatModbusApiClientCommunicationError):
+                await client.async_read_config_data()
+
+        mock_monotonic.return_value += CIRCUIT_BREAKER_OPEN_INTERVAL.total_seconds()
+        assert client.circuit_breaker_state is CircuitBreakerState.HALF_OPEN
+        with pytest.raises(AskoheatModbusApiClientCommunicationError):
+            await client.async_read_config_data()
+        assert mock_probe.await_count == 1
+        assert client.circuit_breaker_state is CircuitBreakerState.OPEN
+
+
+async def test_cancelled_requests_are_not_recorded_as_failed() -> None:
+    """Test that requests cancelled while waiting for an answer don't count."""
+
+    def read(_: int, __: int) -> ReadHoldingRegistersResponse:
+        # as cancelled by the timeout of the coordinator
+        raise asyncio.CancelledError
+
+    with _patch_holding_registers(read):
+        client = AskoheatModbusApiClient(host="192.199.1.2", port=502)
+        for _ in range(CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+            with pytest.raises(asyncio.CancelledError):
+                await client.async_read_config_data()
+        assert client.circuit_breaker_state is CircuitBreakerState.CLOSED
+
+
+async def test_token_bucket_limits_request_rate() -> None:
+    """Test that requests exceeding the burst are sent at the rate."""
+    clock = [100.0]
+
+    async def sleep(delay: float) -> None:
+        clock[0] += delay
+
+    with (
+        mock.patch(
+            "custom_components.askoheat.api.monotonic", side_effect=lambda: clock[0]
+        ),
+        mock.patch("custom_components.askoheat.api.asyncio.sleep", sleep),
+    ):
+        bucket = AskoheatTokenBucket(rate=2, capacity=3)
+        for _ in range(3):
+            await bucket.async_acquire()
+        assert clock[0] == 100.0  # noqa: PLR2004
+
+        await bucket.async_acquire()
+        assert clock[0] == 100.5  # noqa: PLR2004
+        await bucket.async_acquire()
+        assert clock[0] == 101.0  # noqa: PLR2004
@@ -0,0 +1,117 @@
+"""Tests for the register block descriptors."""
+
+import pytest
+
+from custom_components.askoheat.api_desc import (
+    RegisterField,
+    RegisterMap,
+    RegisterMapError,
+    RegisterMapVariant,
+    RegisterType,
+    load_register_blocks,
+    load_register_map_variants,
+    select_register_map_variant,
+)
+from custom_components.askoheat.const import BlockKey
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        # out of range
+        (RegisterField("sensor.a", 9, 2, RegisterType.UINT32),),
+        # overlapping values
+        (
+            RegisterField("sensor.a", 0, 2, RegisterType.FLOAT32),
+            RegisterField("sensor.b", 1, 1, RegisterType.UINT16),
+        ),
+        # same bit of a register
+        (
+            RegisterField("binary_sensor.a", 3, 1, RegisterType.FLAG, 1),
+            RegisterField("binary_sensor.b", 3, 1, RegisterType.FLAG, 1),
+        ),
+    ],
+)
+def test_register_map_rejects_invalid_fields(
+    fields: tuple[RegisterField, ...],
+) -> None:
+    """Test that out of range and overlapping registers are rejected."""
+    register_map = RegisterMap(
+        starting_register=100, number_of_registers=10, fields=fields
+    )
+    with pytest.raises(RegisterMapError):
+        register_map.validate()
+
+
+def test_register_map_accepts_flags_sharing_a_register() -> None:
+    """Test that flags of different bits may share their register."""
+    RegisterMap(
+        starting_register=100,
+        number_of_registers=10,
+        fields=(
+            RegisterField("binary_sensor.a", 3, 1, RegisterType.FLAG, 0),
+            RegisterField("binary_sensor.b", 3, 1, RegisterType.FLAG, 1),
+            RegisterField("sensor.c", 4, 2, RegisterType.UINT32),
+        ),
+    ).validate()
+
+
+def test_register_map_variants_file_is_valid() -> None:
+    """Test that the shipped register map variants are valid."""
+    load_register_map_variants()
+
+
+def test_register_map_without_unsupported_registers() -> None:
+    """Test that fields of unsupported registers are dropped from the map."""
+    register_map = RegisterMap(
+        starting_register=100,
+        number_of_registers=10,
+        fields=(
+            RegisterField("sensor.a", 0, 2, RegisterType.UINT32),
+            RegisterField("sensor.b", 3, 1, RegisterType.UINT16),
+            RegisterField("sensor.c", 8, 2, RegisterType.FLOAT32),
+        ),
+    ).without(((2, 4), (9, 10)))
+
+    assert [field.key for field in register_map.fields] == ["sensor.a"]
+    assert register_map.readable_ranges == ((0, 2), (4, 9))
+
+
+def test_select_register_map_variant_by_software_version() -> None:
+    """Test that the variant covering the software version is selected."""
+    variant = RegisterMapVariant(
+        name="legacy",
+        unsupported={BlockKey.CONF: ((90, 100),)},
+        max_software_version="2.0.0",
+    )
+
+    assert select_register_map_variant((variant,), "1.4.2") is variant
+    assert select_register_map_variant((variant,), "2.0.0") is None
+
+    with pytest.raises(RegisterMapError):
+        RegisterMapVariant(
+            name="broken", unsupported={BlockKey.CONF: ((90, 101),)}
+        ).validate({BlockKey.CONF: load_register_blocks()[BlockKey.CONF].register_map})
+
+
+def test_register_map_keys_in_register_range() -> None:
+    """Test that the values depending on a register range are looked up."""
+    register_map = RegisterMap(
+        starting_register=100,
+        number_of_registers=20,
+        fields=(
+            RegisterField("sensor.a", 0, 16, RegisterType.STRING),
+            RegisterField("binary_sensor.b", 16, 1, RegisterType.FLAG, 0),
+            RegisterField("binary_sensor.c", 16, 1, RegisterType.FLAG, 1),
+            RegisterField("sensor.d", 17, 2, RegisterType.UINT32),
+        ),
+    )
+
+    assert register_map.keys_in(15, 16) == ("sensor.a",)
+    assert register_map.keys_in(16, 17) == ("binary_sensor.b", "binary_sensor.c")
+    assert register_map.keys_in(18, 20) == ("sensor.d",)
+    assert register_map.keys_in(19, 20) == ()
+
+    within = register_map.within(18, 19)
+    assert [field.key for field in within.fields] == ["sensor.d"]
+    assert within.readable_ranges == ((17, 19),)
@@ -9,14 +9,36 @@ from homeassistant.data_entry_flow import FlowResultType
 
 from custom_components.askoheat.const import (
     CONF_ANALOG_INPUT_UNIT,
+    CONF_BAUDRATE,
+    CONF_CONNECTION,
     CONF_DEVICE_UNITS,
     CONF_FEED_IN,
     CONF_HEATPUMP_UNIT,
     CONF_LEGIONELLA_PROTECTION_UNIT,
     CONF_MODBUS_MASTER_UNIT,
+    CONF_OPTIMISTIC_WRITES,
     CONF_POWER_ENTITY_ID,
     CONF_POWER_INVERT,
+    CONF_READ_CHUNK_SIZE,
+    CONF_READ_RATE_LIMIT,
+    CONF_REGISTER_HISTORY,
+    CONF_REGISTER_HISTORY_DAYS,
+    CONF_REGISTER_HISTORY_ENABLED,
+    CONF_SERIAL_PORT,
+    CONF_STALE_DATA_GRACE_PERIOD,
+    CONF_TRANSPORT,
+    CONF_UNIT_ID,
+    CONF_WRITE_RATE_LIMIT,
+    DEFAULT_BAUDRATE,
+    DEFAULT_OPTIMISTIC_WRITES,
+    DEFAULT_READ_RATE_LIMIT,
+    DEFAULT_REGISTER_HISTORY_DAYS,
+    DEFAULT_STALE_DATA_GRACE_PERIOD,
+    DEFAULT_UNIT_ID,
+    DEFAULT_WRITE_RATE_LIMIT,
     DOMAIN,
+    MODBUS_MAX_READ_REGISTERS,
+    ModbusTransport,
     SensorAttrKey,
 )
 from custom_components.askoheat.data import AskoheatDataBlock
@@ -56,8 +78,10 @@ async def test_config_flow_with_defaults(hass: HomeAssistant) -> None:
             {
                 CONF_HOST: "10.0.0.131",
                 CONF_PORT: 501,
+                CONF_CONNECTION: {},
                 CONF_DEVICE_UNITS: {},
                 CONF_FEED_IN: {},
+                CONF_REGISTER_HISTORY: {},
             },
         )
         assert result2.get("type") is FlowResultType.CREATE_ENTRY
@@ -65,10 +89,24 @@ async def test_config_flow_with_defaults(hass: HomeAssistant) -> None:
         assert result2.get("data") == {
             CONF_HOST: "10.0.0.131",
             CONF_PORT: 501,
+            CONF_UNIT_ID: DEFAULT_UNIT_ID,
+            CONF_OPTIMISTIC_WRITES: DEFAULT_OPTIMISTIC_WRITES,
+            CONF_CONNECTION: {
+                CONF_TRANSPORT: ModbusTransport.TCP,
+                CONF_BAUDRATE: str(DEFAULT_BAUDRATE),
+                CONF_READ_CHUNK_SIZE: MODBUS_MAX_READ_REGISTERS,
+                CONF_STALE_DATA_GRACE_PERIOD: DEFAULT_STALE_DATA_GRACE_PERIOD,
+                CONF_READ_RATE_LIMIT: DEFAULT_READ_RATE_LIMIT,
+                CONF_WRITE_RATE_LIMIT: DEFAULT_WRITE_RATE_LIMIT,
+            },
             CONF_FEED_IN: {
                 CONF_POWER_ENTITY_ID: [],
                 CONF_POWER_INVERT: False,
             },
+            CONF_REGISTER_HISTORY: {
+                CONF_REGISTER_HISTORY_ENABLED: False,
+                CONF_REGISTER_HISTORY_DAYS: DEFAULT_REGISTER_HISTORY_DAYS,
+            },
             CONF_DEVICE_UNITS: {
                 CONF_LEGIONELLA_PROTECTION_UNIT: True,  # defaults to true
                 CONF_ANALOG_INPUT_UNIT: False,
@@ -114,6 +152,9 @@ async def test_full_config_flow(hass: HomeAssistant) -> None:
             {
                 CONF_HOST: "10.0.0.131",
                 CONF_PORT: 501,
+                CONF_CONNECTION: {
+                    CONF_TRANSPORT: ModbusTransport.RTU_OVER_TCP,
+                },
                 CONF_DEVICE_UNITS: {
                     CONF_LEGIONELLA_PROTECTION_UNIT: False,
                     CONF_ANALOG_INPUT_UNIT: True,
@@ -124,6 +165,10 @@ async def test_full_config_flow(hass: HomeAssistant) -> None:
                     CONF_POWER_ENTITY_ID: "sensor.my_power_entity",
                     CONF_POWER_INVERT: True,
                 },
+                CONF_REGISTER_HISTORY: {
+                    CONF_REGISTER_HISTORY_ENABLED: True,
+                    CONF_REGISTER_HISTORY_DAYS: 2,
+                },
             },
         )
         assert result2.get("type") is FlowResultType.CREATE_ENTRY
@@ -131,10 +176,24 @@ async def test_full_config_flow(hass: HomeAssistant) -> None:
         assert result2.get("data") == {
             CONF_HOST: "10.0.0.131",
             CONF_PORT: 501,
+            CONF_UNIT_ID: DEFAULT_UNIT_ID,
+            CONF_OPTIMISTIC_WRITES: DEFAULT_OPTIMISTIC_WRITES,
+            CONF_CONNECTION: {
+                CONF_TRANSPORT: ModbusTransport.RTU_OVER_TCP,
+                CONF_BAUDRATE: str(DEFAULT_BAUDRATE),
+                CONF_READ_CHUNK_SIZE: MODBUS_MAX_READ_REGISTERS,
+                CONF_STALE_DATA_GRACE_PERIOD: DEFAULT_STALE_DATA_GRACE_PERIOD,
+                CONF_READ_RATE_LIMIT: DEFAULT_READ_RATE_LIMIT,
+                CONF_WRITE_RATE_LIMIT: DEFAULT_WRITE_RATE_LIMIT,
+            },
             CONF_FEED_IN: {
                 CONF_POWER_ENTITY_ID: "sensor.my_power_entity",
                 CONF_POWER_INVERT: True,
             },
+            CONF_REGISTER_HISTORY: {
+                CONF_REGISTER_HISTORY_ENABLED: True,
+                CONF_REGISTER_HISTORY_DAYS: 2,
+            },
             CONF_DEVICE_UNITS: {
                 CONF_LEGIONELLA_PROTECTION_UNIT: False,
                 CONF_ANALOG_INPUT_UNIT: True,
@@ -144,3 +203,27 @@ async def test_full_config_flow(hass: HomeAssistant) -> None:
         }
         await hass.async_block_till_done()
         assert len(mock_setup_entry.mock_calls) == 1
+
+
+async def test_config_flow_serial_transport_requires_serial_port(
+    hass: HomeAssistant,
+) -> None:
+    """Test the config flow rejects serial transport without serial port."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            CONF_HOST: "10.0.0.131",
+            CONF_PORT: 501,
+            CONF_CONNECTION: {CONF_TRANSPORT: ModbusTransport.SERIAL},
+            CONF_DEVICE_UNITS: {},
+            CONF_FEED_IN: {},
+            CONF_REGISTER_HISTORY: {},
+        },
+    )
+    assert result2.get("type") is FlowResultType.FORM
+    assert result2.get("errors") == {"base": "serial_port_required"}
+    assert CONF_SERIAL_PORT not in (result2.get("data") or {})
@@ -0,0 +1,182 @@
+"""Tests for the askoheat data update coordinators."""
+
+import asyncio
+from datetime import timedelta
+from itertools import pairwise
+from typing import Any
+from unittest import mock
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.askoheat.api import AsyncModbusTcpClient
+from custom_components.askoheat.api_conf_desc import CONF_REGISTER_BLOCK_DESCRIPTOR
+from custom_components.askoheat.api_desc import (
+    UnsignedInt16RegisterInputDescriptor,
+    register_range,
+)
+from custom_components.askoheat.api_par_desc import PARAM_REGISTER_BLOCK_DESCRIPTOR
+from custom_components.askoheat.const import DOMAIN, BlockKey, SensorAttrKey
+from custom_components.askoheat.coordinator import (
+    AskoheatDataUpdateCoordinator,
+    AskoheatDomainCoordinator,
+)
+from custom_components.askoheat.data import AskoheatBlockState, AskoheatDataBlock
+
+number_descriptor = next(
+    descr
+    for descr in CONF_REGISTER_BLOCK_DESCRIPTOR.number_inputs
+    if isinstance(descr.api_descriptor, UnsignedInt16RegisterInputDescriptor)
+    and descr.api_descriptor.starting_register > 0
+)
+
+
+async def test_superseded_writes_are_merged(
+    mock_config_entry: MockConfigEntry,
+    hass: HomeAssistant,  # noqa: ARG001
+) -> None:
+    """Test that writes queued while writing are merged, last value wins."""
+    coordinator = mock_config_entry.runtime_data.config_coordinator
+    api_desc = number_descriptor.api_descriptor
+    assert api_desc
+    write_registers = AsyncModbusTcpClient.write_registers
+    write_registers.reset_mock()
+    dispatch_write = write_registers.side_effect
+
+    async def slow_write(*args: Any, **kwargs: Any) -> Any:
+        # hand over to the other writers while the value is being written
+        await asyncio.sleep(0)
+        return dispatch_write(*args, **kwargs)
+
+    write_registers.side_effect = slow_write
+
+    await asyncio.gather(
+        coordinator.async_write(api_desc, 1),
+        coordinator.async_write(api_desc, 2),
+        coordinator.async_write(api_desc, 3),
+    )
+
+    # the first value is written right away, the second one is superseded by the
+    # third one while the first write is in progress
+    assert write_registers.await_count == 2  # noqa: PLR2004
+    assert write_registers.await_args.kwargs["values"] == [3]
+    assert coordinator.data[number_descriptor.data_key] == 3  # noqa: PLR2004
+
+
+async def test_write_refreshes_only_written_registers(
+    mock_config_entry: MockConfigEntry,
+    hass: HomeAssistant,  # noqa: ARG001
+) -> None:
+    """Test that after writing only the written registers are read again."""
+    coordinator = mock_config_entry.runtime_data.config_coordinator
+    api_desc = number_descriptor.api_descriptor
+    assert api_desc
+    read_registers = AsyncModbusTcpClient.read_holding_registers
+    read_registers.reset_mock()
+    updated: list[str] = []
+    for data_key in (number_descriptor.data_key, "number.unrelated"):
+        coordinator.async_add_listener(
+            lambda data_key=data_key: updated.append(data_key), data_key
+        )
+
+    await coordinator.async_write(api_desc, 42)
+
+    start, end = register_range(api_desc)
+    read_registers.assert_awaited_once()
+    assert read_registers.await_args.kwargs["address"] == (
+        CONF_REGISTER_BLOCK_DESCRIPTOR.starting_register + start
+    )
+    assert read_registers.await_args.kwargs["count"] == end - start
+    assert coordinator.data[number_descriptor.data_key] == 42  # noqa: PLR2004
+    assert updated == [number_descriptor.data_key]
+
+
+class _RecordingCoordinator(AskoheatDataUpdateCoordinator):
+    """Coordinator recording the loop time of its refreshes."""
+
+    _block_key = BlockKey.PAR
+
+    refreshed_at: list[float]
+
+    async def _async_update_data(self) -> AskoheatBlockState:
+        self.refreshed_at.append(self.hass.loop.time())
+        return AskoheatBlockState.from_data_block(
+            self._block.layout, AskoheatDataBlock()
+        )
+
+    async def _async_read_data(self) -> AskoheatBlockState:
+        raise NotImplementedError
+
+    async def _async_write_value(self, *_: Any) -> None:
+        raise NotImplementedError
+
+
+async def test_poll_offset_shifts_only_first_refresh(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test that the poll offset does not lengthen the interval of refreshes."""
+    freezer.move_to("2024-01-01 00:00:00+00:00")
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    domain_coordinator = AskoheatDomainCoordinator()
+    # take the first slot to shift the poll phase of the entry
+    domain_coordinator.register("other_entry_id")
+    domain_coordinator.register(entry.entry_id)
+    interval = timedelta(seconds=5)
+    offset = domain_coordinator.poll_offset(entry.entry_id, interval)
+    assert offset > 0
+    coordinator = _RecordingCoordinator(
+        hass,
+        interval,
+        mock.MagicMock(),
+        config_entry=entry,
+        domain_coordinator=domain_coordinator,
+    )
+    coordinator.refreshed_at = []
+    start = hass.loop.time()
+
+    unsub = coordinator.async_add_listener(lambda: None)
+    for _ in range(60):
+        freezer.tick(timedelta(seconds=0.5))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+    unsub()
+
+    refreshed_at = coordinator.refreshed_at
+    assert len(refreshed_at) > 3  # noqa: PLR2004
+    # the coordinator truncates the time of scheduling to whole seconds
+    assert refreshed_at[0] - start > offset + interval.total_seconds() - 1
+    assert {later - earlier for earlier, later in pairwise(refreshed_at)} == {
+        interval.total_seconds()
+    }
+
+
+def test_block_state_provides_dict_view() -> None:
+    """Test that the slotted block state behaves like the mapping of data keys."""
+    layout = PARAM_REGISTER_BLOCK_DESCRIPTOR.layout
+    state = AskoheatBlockState.from_data_block(
+        layout,
+        AskoheatDataBlock(
+            sensors={
+                SensorAttrKey.PAR_ID: "1234",
+                SensorAttrKey.PAR_ARTICLE_NAME: "test_article",
+            }
+        ),
+    )
+
+    expected = {
+        f"sensor.{SensorAttrKey.PAR_ID}": "1234",
+        f"sensor.{SensorAttrKey.PAR_ARTICLE_NAME}": "test_article",
+    }
+    assert state.as_dict() == expected
+    assert dict(state) == expected
+    assert f"sensor.{SensorAttrKey.PAR_ARTICLE_NUMBER}" not in state
+
+    index = layout.index(f"sensor.{SensorAttrKey.PAR_ID}")
+    assert index is not None
+    assert state.has_value_at(index)
+    assert state.value_at(index) == "1234"
@@ -0,0 +1,106 @@
+"""Tests for the statistics over the sampled energymanager values."""
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.askoheat.const import DOMAIN
+from custom_components.askoheat.ema_statistics import EMA_SAMPLE_KEYS, EmaSampleBuffer
+from custom_components.askoheat.services import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_WINDOW,
+    SERVICE_GET_EMA_STATISTICS,
+)
+
+
+def test_sample_buffer_statistics_over_window() -> None:
+    """Test statistics of the latest samples, overwriting the oldest ones."""
+    buffer = EmaSampleBuffer(4, ("a", "b", "c"))
+    for second in range(6):
+        buffer.append(
+            second * 5.0,
+            {"a": second, "b": second % 2 == 0, "c": None if second < 5 else 1.0},  # noqa: PLR2004
+        )
+
+    assert len(buffer) == 4  # noqa: PLR2004
+    statistics = buffer.statistics(100)
+    # only the last four samples are held
+    assert statistics["a"].minimum == 2  # noqa: PLR2004
+    assert statistics["a"].maximum == 5  # noqa: PLR2004
+    assert statistics["a"].mean == 3.5  # noqa: PLR2004
+    # changed by 3 within 15 seconds
+    assert statistics["a"].rate == 720  # noqa: PLR2004
+    assert statistics["b"].mean == 0.5  # noqa: PLR2004
+    # missing values are skipped
+    assert statistics["c"].samples == 1
+    assert statistics["c"].mean == 1
+    assert statistics["c"].rate is None
+
+    statistics = buffer.statistics(5)
+    assert statistics["a"].samples == 2  # noqa: PLR2004
+    assert statistics["a"].mean == 4.5  # noqa: PLR2004
+
+
+def test_sample_buffer_without_samples() -> None:
+    """Test that statistics without samples in the window are None."""
+    buffer = EmaSampleBuffer(4, ("a",))
+    assert buffer.statistics(60)["a"].mean is None
+
+    buffer.append(0.0, {"a": 1})
+    assert buffer.statistics(60, now=120)["a"].samples == 0
+
+
+async def test_get_ema_statistics_service(
+    mock_config_entry: MockConfigEntry,
+    hass: HomeAssistant,
+) -> None:
+    """Test that the service returns the statistics of all sampled values."""
+    ema_coordinator = mock_config_entry.runtime_data.ema_coordinator
+    # the statistics sensors are disabled, nothing is sampled before requested
+    assert ema_coordinator.samples is None
+
+    service_data = {
+        ATTR_CONFIG_ENTRY_ID: mock_config_entry.entry_id,
+        ATTR_WINDOW: {"minutes": 5},
+    }
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_EMA_STATISTICS,
+        service_data,
+        blocking=True,
+        return_response=True,
+    )
+    assert response is not None
+    assert response["samples"] == 0
+
+    await ema_coordinator.async_refresh()
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_EMA_STATISTICS,
+        service_data,
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response is not None
+    assert response["samples"] == 1
+    assert set(response["statistics"]) == set(EMA_SAMPLE_KEYS)
+    for statistics in response["statistics"].values():
+        assert statistics["samples"] == 1
+        assert statistics["mean"] == 0
+
+
+async def test_get_ema_statistics_of_unknown_entry(
+    mock_config_entry: MockConfigEntry,  # noqa: ARG001
+    hass: HomeAssistant,
+) -> None:
+    """Test that the service fails for config entries which aren't loaded."""
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_EMA_STATISTICS,
+            {ATTR_CONFIG_ENTRY_ID: "unknown"},
+            blocking=True,
+            return_response=True,
+        )
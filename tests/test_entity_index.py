@@ -0,0 +1,66 @@
+"""Tests for the index of entity descriptions."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from homeassistant.const import Platform
+
+from custom_components.askoheat.api_desc import (
+    REGISTER_BLOCK_MODULES,
+    load_register_blocks,
+    register_block,
+)
+from custom_components.askoheat.const import BlockKey, DeviceKey
+from custom_components.askoheat.entity_index import entity_descriptions
+
+
+def test_entity_descriptions_of_platform_and_devices() -> None:
+    """Test that the index returns the descriptions of the given device units."""
+    expected = [
+        (id(description), block_key)
+        for block_key, block in load_register_blocks().items()
+        for description in block.sensors
+    ]
+
+    result = entity_descriptions(Platform.SENSOR, list(DeviceKey))
+    assert sorted((id(description), key) for description, key in result) == sorted(
+        expected
+    )
+
+    result = entity_descriptions(Platform.SENSOR, [DeviceKey.ENERGY_MANAGER])
+    assert result
+    assert all(
+        description.device_key in (None, DeviceKey.ENERGY_MANAGER)
+        for description, _ in result
+    )
+
+
+def test_entity_descriptions_reference_their_register_block() -> None:
+    """Test that each description is indexed with the block it is read from."""
+    for description, block_key in entity_descriptions(Platform.NUMBER, list(DeviceKey)):
+        assert description in register_block(block_key).number_inputs
+    assert BlockKey.DATA not in {
+        block_key
+        for _, block_key in entity_descriptions(Platform.NUMBER, list(DeviceKey))
+    }
+
+
+def test_descriptor_modules_are_imported_on_first_use() -> None:
+    """Test that importing the integration doesn't import the descriptor modules."""
+    descriptor_modules = [
+        f"custom_components.askoheat.{module_name}"
+        for module_name, _ in REGISTER_BLOCK_MODULES.values()
+    ]
+    output = subprocess.check_output(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            "import sys\n"
+            "import custom_components.askoheat\n"
+            f"print([m for m in {descriptor_modules!r} if m in sys.modules])",
+        ],
+        cwd=Path(__file__).parent.parent,
+        text=True,
+    )
+    assert output.strip() == "[]"
@@ -0,0 +1,64 @@
+"""Tests for the energy of the heater stages."""
+
+import pytest
+from homeassistant.core import HomeAssistant, State
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    mock_restore_cache_with_extra_data,
+)
+
+from custom_components.askoheat.const import BinarySensorAttrKey, SensorAttrKey
+from custom_components.askoheat.heater_energy import HeaterEnergy
+
+HEATER1_ACTIVE = f"binary_sensor.{BinarySensorAttrKey.HEATER1_ACTIVE}"
+HEATER2_ACTIVE = f"binary_sensor.{BinarySensorAttrKey.HEATER2_ACTIVE}"
+HEATER1_ENERGY_ENTITY_ID = f"sensor.test_{SensorAttrKey.HEATER1_ENERGY}"
+
+
+def test_heater_energy_integrates_active_heaters() -> None:
+    """Test that active heaters add their rated power over the poll interval."""
+    energy = HeaterEnergy(
+        {
+            f"sensor.{SensorAttrKey.PAR_HEATER1_POWER}": 1200,
+            f"sensor.{SensorAttrKey.PAR_HEATER2_POWER}": 2400,
+        },
+        max_interval=15,
+    )
+    for timestamp, heater1, heater2 in ((0, True, False), (3, True, True), (6, 0, 0)):
+        energy.add(timestamp, {HEATER1_ACTIVE: heater1, HEATER2_ACTIVE: heater2})
+
+    # 1200 W over 6 seconds and 2400 W over 3 seconds
+    assert energy.energy(SensorAttrKey.HEATER1_ENERGY) == pytest.approx(0.002)
+    assert energy.energy(SensorAttrKey.HEATER2_ENERGY) == pytest.approx(0.002)
+    # heater without rated power
+    assert energy.energy(SensorAttrKey.HEATER3_ENERGY) is None
+
+    # intervals of failed polls are skipped
+    energy.add(60, {HEATER1_ACTIVE: True})
+    energy.add(63, {HEATER1_ACTIVE: False})
+    assert energy.energy(SensorAttrKey.HEATER1_ENERGY) == pytest.approx(0.003)
+
+
+@pytest.fixture
+def restored_heater_energy(hass: HomeAssistant) -> None:
+    """Fixture restoring the last state of the heater energy sensor."""
+    mock_restore_cache_with_extra_data(
+        hass,
+        (
+            (
+                State(HEATER1_ENERGY_ENTITY_ID, "1.5"),
+                {"native_value": 1.5, "native_unit_of_measurement": "kWh"},
+            ),
+        ),
+    )
+
+
+async def test_heater_energy_sensor_continues_restored_state(
+    restored_heater_energy: None,  # noqa: ARG001
+    mock_config_entry: MockConfigEntry,  # noqa: ARG001
+    hass: HomeAssistant,
+) -> None:
+    """Test that the heater energy sensor continues from its last state."""
+    state = hass.states.get(HEATER1_ENERGY_ENTITY_ID)
+    assert state
+    assert float(state.state) == 1.5  # noqa: PLR2004
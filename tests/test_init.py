@@ -0,0 +1,80 @@
+"""Tests for setting up the askoheat integration."""
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pymodbus.exceptions import ModbusException
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.askoheat.api import AsyncModbusTcpClient
+from custom_components.askoheat.coordinator import async_get_domain_coordinator
+
+
+async def test_platforms_without_enabled_entities_are_not_set_up(
+    mock_config_entry: MockConfigEntry,
+    hass: HomeAssistant,
+) -> None:
+    """Test that platforms of which all entities are disabled are skipped."""
+    assert Platform.TEXT in mock_config_entry.runtime_data.platforms
+
+    entity_registry = er.async_get(hass)
+    for registry_entry in er.async_entries_for_config_entry(
+        entity_registry, mock_config_entry.entry_id
+    ):
+        if registry_entry.domain == Platform.TEXT:
+            entity_registry.async_update_entity(
+                registry_entry.entity_id,
+                disabled_by=er.RegistryEntryDisabler.USER,
+            )
+
+    await hass.config_entries.async_reload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert Platform.TEXT not in mock_config_entry.runtime_data.platforms
+    assert Platform.SENSOR in mock_config_entry.runtime_data.platforms
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+
+
+async def test_platforms_with_unindexed_entities_are_set_up(
+    mock_config_entry: MockConfigEntry,
+    hass: HomeAssistant,
+) -> None:
+    """Test that platforms owning entities outside of the index are kept."""
+    entity_registry = er.async_get(hass)
+    for registry_entry in er.async_entries_for_config_entry(
+        entity_registry, mock_config_entry.entry_id
+    ):
+        if registry_entry.domain == Platform.NUMBER:
+            entity_registry.async_update_entity(
+                registry_entry.entity_id,
+                disabled_by=er.RegistryEntryDisabler.USER,
+            )
+
+    await hass.config_entries.async_reload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    # the auto feed-in buffer number is not part of the entity index
+    assert Platform.NUMBER in mock_config_entry.runtime_data.platforms
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+
+
+async def test_failed_setup_releases_connection_and_poll_slot(
+    mock_config_entry_uninitialized: MockConfigEntry,
+    hass: HomeAssistant,
+) -> None:
+    """Test that a setup failing after connecting releases the connection."""
+    AsyncModbusTcpClient.read_input_registers.side_effect = ModbusException(
+        "no response"
+    )
+    entry = mock_config_entry_uninitialized
+    entry.add_to_hass(hass)
+
+    assert not await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+    domain_coordinator = async_get_domain_coordinator(hass)
+    assert not domain_coordinator.connection_pool._connections  # noqa: SLF001
+    assert entry.entry_id not in domain_coordinator._slots  # noqa: SLF001
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,106 @@
+"""Tests for the hourly long-term statistics of the operating data."""
+
+from datetime import UTC, datetime, timedelta
+
+from custom_components.askoheat.api_op_desc import DATA_REGISTER_BLOCK_DESCRIPTOR
+from custom_components.askoheat.const import LongTermStatistic, SensorAttrKey
+from custom_components.askoheat.long_term_statistics import (
+    HourlyStatistics,
+    long_term_statistics_descriptions,
+)
+
+COUNTER = next(
+    descr
+    for descr in DATA_REGISTER_BLOCK_DESCRIPTOR.sensors
+    if descr.key == SensorAttrKey.DATA_OPERATING_TIME_MINUTES
+)
+MEASUREMENT = next(
+    descr
+    for descr in DATA_REGISTER_BLOCK_DESCRIPTOR.sensors
+    if descr.key == SensorAttrKey.DATA_MAX_MEASURED_TEMP
+)
+START = datetime(2024, 10, 1, 10, tzinfo=UTC)
+
+
+def test_long_term_statistics_of_counters() -> None:
+    """Test that all counters of the operating data get sum statistics."""
+    kinds = {
+        descr.key: descr.long_term_statistic
+        for descr in long_term_statistics_descriptions()
+    }
+    assert kinds[SensorAttrKey.DATA_OPERATING_TIME_HEATER_STEP1] is (
+        LongTermStatistic.SUM
+    )
+    assert kinds[SensorAttrKey.DATA_BOOT_COUNT] is LongTermStatistic.SUM
+    assert kinds[SensorAttrKey.DATA_MAX_MEASURED_TEMP] is LongTermStatistic.MEAN
+
+
+def test_long_term_statistics_not_compiled_by_recorder() -> None:
+    """Test that values with imported statistics are not compiled from states."""
+    assert all(
+        descr.state_class is None for descr in long_term_statistics_descriptions()
+    )
+
+
+def test_hourly_statistics() -> None:
+    """Test sums of counters and means of measurements once an hour ended."""
+    hourly = HourlyStatistics((COUNTER, MEASUREMENT))
+    for minute, counter, temperature in ((0, 100, 40), (30, 130, 50), (59, 159, 60)):
+        assert not hourly.add(
+            START + timedelta(minutes=minute),
+            {COUNTER.data_key: counter, MEASUREMENT.data_key: temperature},
+        )
+
+    statistics = hourly.add(
+        START + timedelta(hours=1), {COUNTER.data_key: 160, MEASUREMENT.data_key: 60}
+    )
+    assert statistics[COUNTER.data_key] == [{"start": START, "state": 159, "sum": 59}]
+    assert statistics[MEASUREMENT.data_key] == [
+        {"start": START, "mean": 50, "min": 40, "max": 60}
+    ]
+
+    statistics = hourly.add(START + timedelta(hours=2), {COUNTER.data_key: 10})
+    assert statistics[COUNTER.data_key] == [
+        {"start": START + timedelta(hours=1), "state": 160, "sum": 60}
+    ]
+    # counter got reset, its new value is counted as increase
+    assert hourly.flush()[COUNTER.data_key] == [
+        {"start": START + timedelta(hours=2), "state": 10, "sum": 70}
+    ]
+
+
+def test_hourly_statistics_backfill_counters() -> None:
+    """Test that hours missed are backfilled from the counter values."""
+    hourly = HourlyStatistics((COUNTER, MEASUREMENT))
+    hourly.restore(COUNTER.data_key, START - timedelta(hours=1), 100, 1000)
+
+    # polled again at the start of the third hour after the last imported one
+    hourly.add(
+        START + timedelta(hours=2), {COUNTER.data_key: 220, MEASUREMENT.data_key: 60}
+    )
+    statistics = hourly.flush()
+
+    assert statistics[COUNTER.data_key] == [
+        {"start": START, "state": 160, "sum": 1060},
+        {"start": START + timedelta(hours=1), "state": 220, "sum": 1120},
+        {"start": START + timedelta(hours=2), "state": 220, "sum": 1120},
+    ]
+    # measurements are not backfilled
+    assert len(statistics[MEASUREMENT.data_key]) == 1
+
+    # hours imported before are not imported again
+    hourly.restore(COUNTER.data_key, START + timedelta(hours=3), 230, 1130)
+    hourly.add(START + timedelta(hours=3), {COUNTER.data_key: 230})
+    assert COUNTER.data_key not in hourly.flush()
+
+
+def test_hourly_statistics_continue_hour_after_restart() -> None:
+    """Test that the increase of an hour polled before a restart is not lost."""
+    hourly = HourlyStatistics((COUNTER,))
+    # the hour polled before the restart was not imported
+    hourly.restore(COUNTER.data_key, START - timedelta(hours=1), 100, 1000)
+
+    hourly.add(START + timedelta(minutes=30), {COUNTER.data_key: 130})
+    statistics = hourly.add(START + timedelta(hours=1), {COUNTER.data_key: 160})
+
+    assert statistics[COUNTER.data_key] == [{"start": START, "state": 130, "sum": 1030}]
@@ -0,0 +1,64 @@
+"""Tests for the on-disk history of raw register snapshots."""
+
+from pathlib import Path
+
+from pymodbus.pdu.register_message import ReadInputRegistersResponse
+
+from custom_components.askoheat.api import AskoheatModbusApiClient
+from custom_components.askoheat.api_ema_desc import EMA_REGISTER_BLOCK_DESCRIPTOR
+from custom_components.askoheat.const import BlockKey
+from custom_components.askoheat.register_history import RegisterHistory
+
+
+def test_history_rolls_over_and_slices_by_time(tmp_path: Path) -> None:
+    """Test that the oldest snapshots are overwritten and slices are time ordered."""
+    history = RegisterHistory(tmp_path / "ema.history", 3, 4)
+    for second in range(6):
+        history.append(float(second), [second, None, 65535])
+
+    assert len(history) == 4  # noqa: PLR2004
+    assert list(history.snapshots(1.5, 4.5)) == [
+        (2.0, [2, None, 65535]),
+        (3.0, [3, None, 65535]),
+        (4.0, [4, None, 65535]),
+    ]
+    # the records roll over the end of the file
+    assert [len(part) for part in history.slice(0, 10)] == [2, 2]
+    assert history.slice(10, 20) == []
+
+
+def test_history_is_kept_across_restarts(tmp_path: Path) -> None:
+    """Test that snapshots are read back from an existing file of the same layout."""
+    path = tmp_path / "ema.history"
+    history = RegisterHistory(path, 3, 4)
+    history.append(1.0, [1, 2, 3])
+    history.flush()
+    del history
+
+    assert list(RegisterHistory(path, 3, 4).snapshots(0, 10)) == [(1.0, [1, 2, 3])]
+    # a file of another layout is recreated
+    assert len(RegisterHistory(path, 4, 4)) == 0
+
+
+async def test_client_records_and_decodes_snapshots(
+    tmp_path: Path,
+    mock_api_client: AskoheatModbusApiClient,  # noqa: ARG001
+    read_ema_input_registers_response: ReadInputRegistersResponse,
+) -> None:
+    """Test that snapshots of the history decode like the values read."""
+    read_ema_input_registers_response.registers[25:27] = [0x41B4, 0x0000]
+    client = AskoheatModbusApiClient(host="192.199.1.2", port=502)
+    client.register_histories = {
+        BlockKey.EMA: RegisterHistory(
+            tmp_path / "ema.history",
+            EMA_REGISTER_BLOCK_DESCRIPTOR.number_of_registers,
+            10,
+        )
+    }
+
+    data = await client.async_read_ema_data()
+
+    ((_, registers),) = client.register_histories[BlockKey.EMA].snapshots(
+        float("-inf"), float("inf")
+    )
+    assert client.decode_block(BlockKey.EMA, registers) == data
@@ -6,19 +6,31 @@ from math import isclose
 from typing import Any
 
 import pytest
-from homeassistant.const import UnitOfTime
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.const import STATE_UNAVAILABLE, UnitOfTime
 from homeassistant.core import HomeAssistant
+from pymodbus.exceptions import ModbusException
 from pymodbus.pdu.register_message import (
     ReadHoldingRegistersResponse,
     ReadInputRegistersResponse,
 )
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
+from custom_components.askoheat.api import AsyncModbusTcpClient
 from custom_components.askoheat.api_conf_desc import CONF_REGISTER_BLOCK_DESCRIPTOR
 from custom_components.askoheat.api_ema_desc import EMA_REGISTER_BLOCK_DESCRIPTOR
 from custom_components.askoheat.api_op_desc import DATA_REGISTER_BLOCK_DESCRIPTOR
 from custom_components.askoheat.api_par_desc import PARAM_REGISTER_BLOCK_DESCRIPTOR
-from custom_components.askoheat.const import AttributeKeys, SensorAttrKey
+from custom_components.askoheat.const import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CONF_STALE_DATA_GRACE_PERIOD,
+    AttributeKeys,
+    CircuitBreakerState,
+    SensorAttrKey,
+)
 from custom_components.askoheat.model import (
     AskoheatDurationSensorEntityDescription,
     AskoheatSensorEntityDescription,
@@ -30,8 +42,12 @@ from .testdata import (
     ema_register_values,
     fill_test_data,
     par_register_values,
+    prepare_register_values,
 )
 
+# seconds of stale data served in the tests of the grace period
+STALE_DATA_GRACE_PERIOD = 60
+
 # prepare sensor data
 sensor_entities = [
     entity_descriptor
@@ -101,6 +117,7 @@ async def test_read_sensor_states(
     key = f"sensor.test_{entity_descriptor.key}"
     state = hass.states.get(key)
     assert state
+    assert state.attributes[AttributeKeys.DATA_AGE] == 0
 
     expected = (
         0
@@ -153,3 +170,130 @@ async def test_read_sensor_states(
         assert state.state == str(expected), (
             f"Expect state {expected!s}({type(expected)}) for entity {entity_descriptor.key}, but received {state.state}({type(state.state)})."  # noqa: E501
         )
+
+
+def test_significant_change_thresholds() -> None:
+    """Test absolute and relative thresholds of significant changes."""
+    absolute = AskoheatSensorEntityDescription(
+        key=SensorAttrKey.HEATER_LOAD, significant_change=1
+    )
+    assert not absolute.is_significant_change(10, 10.5)
+    assert absolute.is_significant_change(10, 9)
+    assert absolute.is_significant_change("on", "off")
+
+    relative = AskoheatSensorEntityDescription(
+        key=SensorAttrKey.HEATER_LOAD, significant_change_relative=0.1
+    )
+    assert not relative.is_significant_change(100, 105)
+    assert relative.is_significant_change(100, 110)
+    assert relative.is_significant_change(0, 1)
+
+    # without thresholds every update is written
+    assert AskoheatSensorEntityDescription(
+        key=SensorAttrKey.HEATER_LOAD
+    ).is_significant_change(1, 1)
+
+
+async def test_insignificant_changes_are_not_written(
+    mock_config_entry: MockConfigEntry,
+    hass: HomeAssistant,
+    read_ema_input_registers_response: ReadInputRegistersResponse,
+) -> None:
+    """Test that changes below the significant change keep the written state."""
+    description = next(
+        descr
+        for descr in EMA_REGISTER_BLOCK_DESCRIPTOR.sensors
+        if descr.key == SensorAttrKey.INTERNAL_TEMPERATUR_SENSOR_VALUE
+    )
+    assert description.significant_change is not None
+    coordinator = mock_config_entry.runtime_data.ema_coordinator
+    entity_id = f"sensor.test_{description.key}"
+
+    for value, expected in ((0.1, 0.0), (0.5, 0.5)):
+        prepare_register_values(
+            description, read_ema_input_registers_response.registers, value
+        )
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+        state = hass.states.get(entity_id)
+        assert state
+        assert float(state.state) == expected
+
+
+async def test_circuit_breaker_sensor(
+    mock_config_entry: MockConfigEntry,  # noqa: ARG001
+    hass: HomeAssistant,
+) -> None:
+    """Test that the circuit breaker of the device requests is shown closed."""
+    state = hass.states.get(f"sensor.test_{SensorAttrKey.CIRCUIT_BREAKER}")
+    assert state
+    assert state.state == CircuitBreakerState.CLOSED
+
+
+async def test_circuit_breaker_sensor_follows_breaker(
+    mock_config_entry: MockConfigEntry,
+    hass: HomeAssistant,
+) -> None:
+    """Test that the state is written whenever the breaker changes its state."""
+    coordinator = mock_config_entry.runtime_data.ema_coordinator
+    entity_id = f"sensor.test_{SensorAttrKey.CIRCUIT_BREAKER}"
+    AsyncModbusTcpClient.read_input_registers.side_effect = ModbusException(
+        "no response"
+    )
+
+    # only the first failed refresh is passed to the entities by the coordinator
+    for _ in range(CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+        await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    state = hass.states.get(entity_id)
+    assert state
+    assert state.state == CircuitBreakerState.OPEN
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+
+
+async def test_failed_poll_turns_unavailable_without_grace_period(
+    mock_config_entry: MockConfigEntry,
+    hass: HomeAssistant,
+) -> None:
+    """Test that entities turn unavailable at once by default."""
+    coordinator = mock_config_entry.runtime_data.ema_coordinator
+    entity_id = f"sensor.test_{SensorAttrKey.INTERNAL_TEMPERATUR_SENSOR_VALUE}"
+    AsyncModbusTcpClient.read_input_registers.side_effect = ModbusException(
+        "no response"
+    )
+
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    state = hass.states.get(entity_id)
+    assert state
+    assert state.state == STATE_UNAVAILABLE
+
+
+@pytest.mark.parametrize(
+    "conf_connection", [{CONF_STALE_DATA_GRACE_PERIOD: STALE_DATA_GRACE_PERIOD}]
+)
+async def test_stale_data_turns_unavailable_after_grace_period(
+    mock_config_entry: MockConfigEntry,
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test that entities serve stale data only until the grace period ends."""
+    coordinator = mock_config_entry.runtime_data.ema_coordinator
+    entity_id = f"sensor.test_{SensorAttrKey.INTERNAL_TEMPERATUR_SENSOR_VALUE}"
+    AsyncModbusTcpClient.read_input_registers.side_effect = ModbusException(
+        "no response"
+    )
+
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    state = hass.states.get(entity_id)
+    assert state
+    assert state.state != STATE_UNAVAILABLE
+
+    freezer.tick(timedelta(seconds=STALE_DATA_GRACE_PERIOD + 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    state = hass.states.get(entity_id)
+    assert state
+    assert state.state == STATE_UNAVAILABLE
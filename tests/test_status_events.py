@@ -0,0 +1,81 @@
+"""Tests for the events and device triggers of the status register bits."""
+
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from pymodbus.pdu.register_message import ReadInputRegistersResponse
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
+
+from custom_components.askoheat.const import (
+    DOMAIN,
+    EMA_STATUS_REGISTER,
+    EVENT_STATUS_BIT_CHANGED,
+    BinarySensorAttrKey,
+    DeviceKey,
+)
+from custom_components.askoheat.device_trigger import (
+    CONF_SUBTYPE,
+    TRIGGER_TYPE_TURNED_ON,
+    async_get_triggers,
+)
+from custom_components.askoheat.status_events import (
+    ATTR_BIT,
+    ATTR_KEY,
+    ATTR_NEW,
+    ATTR_OLD,
+    changed_bits,
+)
+
+
+def test_changed_bits() -> None:
+    """Test that the bits differing between two status words are iterated."""
+    assert list(changed_bits(0b0101, 0b0101)) == []
+    assert list(changed_bits(0b0101, 0b1100)) == [0, 3]
+
+
+async def test_status_bit_change_fires_event(
+    mock_config_entry: MockConfigEntry,
+    hass: HomeAssistant,
+    read_ema_input_registers_response: ReadInputRegistersResponse,
+) -> None:
+    """Test that a changed bit of the status register fires one event."""
+    events = async_capture_events(hass, EVENT_STATUS_BIT_CHANGED)
+    coordinator = mock_config_entry.runtime_data.ema_coordinator
+
+    # heater 1 turned on
+    read_ema_input_registers_response.registers[EMA_STATUS_REGISTER] = 0b1
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    device = dr.async_get(hass).async_get_device(
+        identifiers={
+            (
+                DOMAIN,
+                f"{DeviceKey.WATER_HEATER_CONTROL_UNIT}.{mock_config_entry.entry_id}",
+            )
+        }
+    )
+    assert device
+    assert len(events) == 1
+    assert events[0].data[ATTR_DEVICE_ID] == device.id
+    assert events[0].data[ATTR_KEY] == BinarySensorAttrKey.HEATER1_ACTIVE
+    assert events[0].data[ATTR_BIT] == 0
+    assert events[0].data[ATTR_OLD] is False
+    assert events[0].data[ATTR_NEW] is True
+
+    # unchanged status register
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert len(events) == 1
+
+    triggers = await async_get_triggers(hass, device.id)
+    assert {
+        "platform": "device",
+        "domain": DOMAIN,
+        "device_id": device.id,
+        "type": TRIGGER_TYPE_TURNED_ON,
+        CONF_SUBTYPE: BinarySensorAttrKey.HEATER1_ACTIVE,
+    } in triggers
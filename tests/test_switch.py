@@ -1,17 +1,26 @@
 """Tests for the switch sensor entities."""
 
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    EVENT_STATE_CHANGED,
     STATE_OFF,
     STATE_ON,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from pymodbus.client import AsyncModbusTcpClient
+from pymodbus.exceptions import ModbusIOException
 from pymodbus.pdu.register_message import (
     ReadHoldingRegistersResponse,
 )
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
 
 from custom_components.askoheat.api_conf_desc import CONF_REGISTER_BLOCK_DESCRIPTOR
 from custom_components.askoheat.api_desc import (
@@ -20,8 +29,11 @@ from custom_components.askoheat.api_desc import (
 )
 from custom_components.askoheat.const import (
     DOMAIN,
+    EVENT_WRITE_FAILED,
     SwitchAttrKey,
 )
+from custom_components.askoheat.coordinator import AskoheatDataUpdateCoordinator
+from custom_components.askoheat.entity import ATTR_KEY
 from custom_components.askoheat.model import (
     AskoheatSwitchEntityDescription,
 )
@@ -135,3 +147,88 @@ async def test_update_switch_sensor_states(
     state = hass.states.get(entity_id)
     assert state
     assert state.state == STATE_OFF
+
+
+@pytest.mark.parametrize("conf_optimistic_writes", [True])
+async def test_failed_optimistic_write_reverts_state(
+    mock_config_entry: MockConfigEntry,  # noqa: ARG001
+    hass: HomeAssistant,
+) -> None:
+    """Test that a switch shows the written state and reverts if writing fails."""
+    entity_descriptor = switch_entities[0]
+    entity_id = f"switch.test_{entity_descriptor.key}"
+    state_changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+    failed_writes = async_capture_events(hass, EVENT_WRITE_FAILED)
+    msg = "No response received"
+    AsyncModbusTcpClient.write_registers.side_effect = ModbusIOException(msg)
+
+    await hass.services.async_call(
+        "switch", "turn_on", service_data={"entity_id": entity_id}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+    assert [
+        event.data["new_state"].state
+        for event in state_changes
+        if event.data["entity_id"] == entity_id
+    ] == [STATE_ON, STATE_OFF]
+    assert len(failed_writes) == 1
+    assert failed_writes[0].data[ATTR_ENTITY_ID] == entity_id
+    assert failed_writes[0].data[ATTR_KEY] == entity_descriptor.key
+
+
+@pytest.mark.parametrize("conf_optimistic_writes", [True])
+async def test_optimistic_write_ignored_by_device_reverts_state(
+    mock_config_entry: MockConfigEntry,  # noqa: ARG001
+    hass: HomeAssistant,
+) -> None:
+    """Test that a switch reverts if the device reads back another state."""
+    entity_descriptor = switch_entities[0]
+    entity_id = f"switch.test_{entity_descriptor.key}"
+    state_changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+    failed_writes = async_capture_events(hass, EVENT_WRITE_FAILED)
+    # the write is answered, but the register keeps its value
+    AsyncModbusTcpClient.write_registers.side_effect = None
+
+    await hass.services.async_call(
+        "switch", "turn_on", service_data={"entity_id": entity_id}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+    assert [
+        event.data["new_state"].state
+        for event in state_changes
+        if event.data["entity_id"] == entity_id
+    ] == [STATE_ON, STATE_OFF]
+    assert len(failed_writes) == 1
+    assert failed_writes[0].data[ATTR_ENTITY_ID] == entity_id
+
+
+@pytest.mark.parametrize("conf_optimistic_writes", [True])
+async def test_optimistic_write_raising_reverts_state(
+    mock_config_entry: MockConfigEntry,  # noqa: ARG001
+    hass: HomeAssistant,
+) -> None:
+    """Test that a switch reverts if writing raises instead of failing."""
+    entity_descriptor = switch_entities[0]
+    entity_id = f"switch.test_{entity_descriptor.key}"
+    state_changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+    failed_writes = async_capture_events(hass, EVENT_WRITE_FAILED)
+
+    with patch.object(
+        AskoheatDataUpdateCoordinator,
+        "async_write",
+        side_effect=UpdateFailed("Block is read only"),
+    ):
+        await hass.services.async_call(
+            "switch", "turn_on", service_data={"entity_id": entity_id}, blocking=True
+        )
+        await hass.async_block_till_done()
+
+    assert [
+        event.data["new_state"].state
+        for event in state_changes
+        if event.data["entity_id"] == entity_id
+    ] == [STATE_ON, STATE_OFF]
+    assert len(failed_writes) == 1
+    assert failed_writes[0].data[ATTR_ENTITY_ID] == entity_id
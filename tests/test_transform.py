@@ -0,0 +1,36 @@
+"""Tests for the transforms of raw register values."""
+
+from homeassistant.const import UnitOfTime
+
+from custom_components.askoheat.transform import (
+    DurationValue,
+    duration_transform,
+    number_transform,
+    sensor_transform,
+)
+
+
+def test_sensor_transform_scales_and_caches_values() -> None:
+    """Test that sensor values are scaled, rounded and cached per raw value."""
+    transform = sensor_transform(factor=0.1, precision=1)
+
+    assert transform(123) == 12.3  # noqa: PLR2004
+    assert transform("text") == "text"
+    transform(123)
+    assert transform.cache_info().hits == 1  # type: ignore[attr-defined]
+
+
+def test_number_transform_keeps_values_without_factor_and_precision() -> None:
+    """Test that number values are passed as is without factor and precision."""
+    transform = number_transform(factor=None, precision=None)
+
+    assert transform(5) == 5  # noqa: PLR2004
+
+
+def test_duration_transform_unpacks_days_hours_and_minutes() -> None:
+    """Test that durations are converted into the unit of the entity."""
+    transform = duration_transform(UnitOfTime.HOURS, factor=None, precision=None)
+
+    assert transform((2 << 16) | (3 << 8) | 30) == DurationValue(
+        value=2 * 24 + 3 + 0.5, formatted="2 days, 3:30:00"
+    )